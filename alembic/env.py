@@ -2,8 +2,10 @@
 Alembic Environment Configuration
 Production-ready database migration environment for Cookie-Licking Detector
 """
+import asyncio
 from logging.config import fileConfig
 from sqlalchemy import engine_from_config, pool
+from sqlalchemy.ext.asyncio import create_async_engine
 from alembic import context
 import os
 import sys
@@ -19,14 +21,21 @@ from app.core.config import get_settings
 config = context.config
 
 # Interpret the config file for Python logging.
-# This line sets up loggers basically.
-if config.config_file_name is not None:
+# This line sets up loggers basically. Skipped when the application runs
+# migrations in-process so its own logging setup is left alone.
+if config.config_file_name is not None and config.attributes.get("configure_logger", True):
     fileConfig(config.config_file_name)
 
 # add your model's MetaData object here
 # for 'autogenerate' support
 target_metadata = Base.metadata
 
+# Tables that autogenerate should never manage
+EXCLUDED_TABLES = frozenset({"alembic_version"})
+
+# Bail out of DDL that waits on a table lock instead of stalling the app
+LOCK_TIMEOUT = os.environ.get("ALEMBIC_LOCK_TIMEOUT", "5s")
+
 def get_database_url():
     """Get database URL from environment or config"""
     settings = get_settings()
@@ -58,6 +67,62 @@ def run_migrations_offline() -> None:
         context.run_migrations()
 
 
+def do_run_migrations(connection) -> None:
+    """Configure the migration context on a connection and run migrations."""
+    # Alembic >= 1.13 reflects the schema through SQLAlchemy 2.0's batched
+    # Inspector.get_multi_* API: one catalog query per object kind
+    # instead of one per table during autogenerate.
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        compare_type=True,
+        compare_server_default=True,
+        # Include object names in autogenerate
+        include_object=include_object,
+        # Compare table comments
+        include_comments=True,
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def get_async_engine_options() -> dict:
+    """Pool options for the async migration engine.
+
+    One-shot CLI runs keep NullPool (ALEMBIC_POOL=null, the default);
+    long-running processes that also serve requests can set ALEMBIC_POOL=queue
+    to keep warm connections across upgrades.
+    """
+    if os.environ.get("ALEMBIC_POOL", "null").lower() == "null":
+        return {"poolclass": pool.NullPool}
+    
+    return {
+        "pool_pre_ping": True,
+        "pool_recycle": 3600,
+        "pool_size": 5,
+        "max_overflow": 0,
+    }
+
+
+async def run_async_migrations(url: str) -> None:
+    """Run migrations through an async engine (Alembic async recipe)."""
+    # lock_timeout is a session setting sent in the startup packet; running
+    # SET on the connection would open a transaction before Alembic's own,
+    # so migrations would never commit and autocommit_block() would fail
+    connectable = create_async_engine(
+        url,
+        connect_args={"server_settings": {"lock_timeout": LOCK_TIMEOUT}},
+        **get_async_engine_options()
+    )
+
+    try:
+        async with connectable.connect() as connection:
+            await connection.run_sync(do_run_migrations)
+    finally:
+        await connectable.dispose()
+
+
 def run_migrations_online() -> None:
     """Run migrations in 'online' mode.
 
@@ -65,48 +130,40 @@ def run_migrations_online() -> None:
     and associate a connection with the context.
 
     """
-    # Override the sqlalchemy.url in alembic.ini
-    configuration = config.get_section(config.config_ini_section)
-    configuration['sqlalchemy.url'] = get_database_url()
-    
-    connectable = engine_from_config(
-        configuration,
-        prefix="sqlalchemy.",
-        poolclass=pool.NullPool,
-    )
+    url = get_database_url()
 
-    with connectable.connect() as connection:
-        context.configure(
-            connection=connection,
-            target_metadata=target_metadata,
-            compare_type=True,
-            compare_server_default=True,
-            # Include object names in autogenerate
-            include_object=include_object,
-            # Compare table comments
-            include_comments=True,
+    # SQLite has no async handshake to save; keep the sync path
+    if url.startswith("sqlite"):
+        # Override the sqlalchemy.url in alembic.ini
+        configuration = config.get_section(config.config_ini_section)
+        configuration['sqlalchemy.url'] = url.replace("sqlite+aiosqlite://", "sqlite://")
+        
+        connectable = engine_from_config(
+            configuration,
+            prefix="sqlalchemy.",
+            poolclass=pool.NullPool,
+            connect_args={"check_same_thread": False},
         )
 
-        with context.begin_transaction():
-            context.run_migrations()
+        with connectable.connect() as connection:
+            do_run_migrations(connection)
+        return
+
+    # Sync driver URLs are swapped for asyncpg, the only async driver installed
+    if url.startswith(("postgresql://", "postgresql+psycopg2://")):
+        url = "postgresql+asyncpg://" + url.split("://", 1)[1]
+
+    asyncio.run(run_async_migrations(url))
 
 
 def include_object(object, name, type_, reflected, compare_to):
     """Include objects in migration based on naming conventions"""
     
     # Don't auto-generate migrations for certain tables
-    if type_ == "table" and name in ["alembic_version"]:
+    if type_ == "table" and name in EXCLUDED_TABLES:
         return False
     
-    # Include indexes that match our naming convention
-    if type_ == "index" and name.startswith("ix_"):
-        return True
-        
-    # Include all foreign key constraints
-    if type_ == "foreign_key_constraint":
-        return True
-        
-    # Include all other objects by default
+    # Include all other objects (indexes, foreign keys, ...) by default
     return True
 
 
@@ -14,9 +14,11 @@ Creates all tables as specified in MD file:
 
 With all indexes, constraints, and relationships
 """
-from alembic import op
+from alembic import context, op
 import sqlalchemy as sa
 from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateTable
+from sqlalchemy.util import await_only
 
 # revision identifiers, used by Alembic.
 revision = '001'
@@ -25,11 +27,36 @@ branch_labels = None
 depends_on = None
 
 
+def execute_ddl_batch(statements) -> None:
+    """Send DDL statements to the server as a single script.
+
+    Postgres accepts several statements in one simple-query message, so the
+    whole batch costs one round trip instead of one per statement. asyncpg is
+    driven directly because SQLAlchemy's asyncpg adapter prepares every
+    statement, and prepared statements cannot hold more than one command.
+    """
+    if context.is_offline_mode() or op.get_bind().dialect.name != "postgresql":
+        for statement in statements:
+            op.execute(statement)
+        return
+    
+    bind = op.get_bind()
+    
+    script = ";\n".join(str(statement.compile(dialect=bind.dialect)) for statement in statements)
+    
+    if bind.dialect.driver == "asyncpg":
+        await_only(bind.connection.driver_connection.execute(script))
+    else:
+        bind.exec_driver_sql(script)
+
+
 def upgrade() -> None:
     """Create all tables with proper constraints and indexes"""
     
+    metadata = sa.MetaData()
+    
     # repositories table
-    op.create_table('repositories',
+    sa.Table('repositories', metadata,
         sa.Column('id', sa.Integer(), nullable=False),
         sa.Column('github_repo_id', sa.Integer(), nullable=False),
         sa.Column('owner', sa.String(), nullable=False),
@@ -47,11 +74,9 @@ def upgrade() -> None:
         sa.CheckConstraint('nudge_count >= 0', name='ck_repositories_nudge_count_non_negative'),
         sa.CheckConstraint('claim_detection_threshold BETWEEN 0 AND 100', name='ck_repositories_threshold_range')
     )
-    op.create_index('ix_repositories_is_monitored', 'repositories', ['is_monitored'])
-    op.create_index('ix_repositories_owner_name', 'repositories', ['owner', 'name'])
     
     # issues table
-    op.create_table('issues',
+    sa.Table('issues', metadata,
         sa.Column('id', sa.Integer(), nullable=False),
         sa.Column('github_repo_id', sa.Integer(), nullable=False),
         sa.Column('github_issue_number', sa.Integer(), nullable=False),
@@ -66,12 +91,9 @@ def upgrade() -> None:
         sa.PrimaryKeyConstraint('id'),
         sa.UniqueConstraint('github_repo_id', 'github_issue_number', name='uq_issues_repo_number')
     )
-    op.create_index('ix_issues_status', 'issues', ['status'])
-    op.create_index('ix_issues_repo_id', 'issues', ['github_repo_id'])
-    op.create_index('ix_issues_updated_at', 'issues', ['updated_at'])
     
     # claims table
-    op.create_table('claims',
+    sa.Table('claims', metadata,
         sa.Column('id', sa.Integer(), nullable=False),
         sa.Column('issue_id', sa.Integer(), nullable=False),
         sa.Column('github_user_id', sa.Integer(), nullable=False),
@@ -92,13 +114,9 @@ def upgrade() -> None:
         sa.CheckConstraint('confidence_score BETWEEN 0 AND 100', name='ck_claims_confidence_range'),
         sa.CheckConstraint("status IN ('active', 'inactive', 'completed', 'released')", name='ck_claims_status_valid')
     )
-    op.create_index('ix_claims_status', 'claims', ['status'])
-    op.create_index('ix_claims_issue_user', 'claims', ['issue_id', 'github_user_id'])
-    op.create_index('ix_claims_last_activity', 'claims', ['last_activity_timestamp'])
-    op.create_index('ix_claims_username', 'claims', ['github_username'])
     
     # activity_log table
-    op.create_table('activity_log',
+    sa.Table('activity_log', metadata,
         sa.Column('id', sa.Integer(), nullable=False),
         sa.Column('claim_id', sa.Integer(), nullable=False),
         sa.Column('activity_type', sa.String(), nullable=False),
@@ -110,12 +128,9 @@ def upgrade() -> None:
         sa.CheckConstraint("activity_type IN ('progress_nudge', 'auto_release', 'comment', 'claim_detected', 'progress_update', 'timer_reset', 'manual_nudge_triggered', 'manual_release', 'progress_detected')", 
                           name='ck_activity_log_type_valid')
     )
-    op.create_index('ix_activity_log_claim_id', 'activity_log', ['claim_id'])
-    op.create_index('ix_activity_log_timestamp', 'activity_log', ['timestamp'])
-    op.create_index('ix_activity_log_type', 'activity_log', ['activity_type'])
     
     # progress_tracking table
-    op.create_table('progress_tracking',
+    sa.Table('progress_tracking', metadata,
         sa.Column('id', sa.Integer(), nullable=False),
         sa.Column('claim_id', sa.Integer(), nullable=False),
         sa.Column('pr_number', sa.Integer(), nullable=True),
@@ -131,10 +146,9 @@ def upgrade() -> None:
         sa.CheckConstraint("pr_status IS NULL OR pr_status IN ('open', 'closed', 'merged')", name='ck_progress_tracking_pr_status_valid'),
         sa.CheckConstraint("detected_from IS NULL OR detected_from IN ('ecosyste_ms_api', 'github_api')", name='ck_progress_tracking_detected_from_valid')
     )
-    op.create_index('ix_progress_tracking_updated_at', 'progress_tracking', ['updated_at'])
     
     # queue_jobs table
-    op.create_table('queue_jobs',
+    sa.Table('queue_jobs', metadata,
         sa.Column('id', sa.Integer(), nullable=False),
         sa.Column('job_type', sa.String(), nullable=False),
         sa.Column('payload', sa.JSON(), nullable=True),
@@ -152,10 +166,33 @@ def upgrade() -> None:
         sa.CheckConstraint('retry_count >= 0', name='ck_queue_jobs_retry_count_non_negative'),
         sa.CheckConstraint('max_retries >= 0', name='ck_queue_jobs_max_retries_non_negative')
     )
-    op.create_index('ix_queue_jobs_scheduled_at', 'queue_jobs', ['scheduled_at'])
-    op.create_index('ix_queue_jobs_status', 'queue_jobs', ['status'])
-    op.create_index('ix_queue_jobs_job_type', 'queue_jobs', ['job_type'])
-    op.create_index('ix_queue_jobs_status_scheduled', 'queue_jobs', ['status', 'scheduled_at'])
+    
+    # All CREATE TABLEs go out in one round trip, in FK dependency order
+    execute_ddl_batch([CreateTable(table) for table in metadata.sorted_tables])
+
+    # Indexes are built CONCURRENTLY so copies of this pattern in later
+    # migrations never take a write-blocking SHARE lock on populated tables.
+    # CONCURRENTLY cannot run inside a transaction, hence the autocommit block.
+    # The composite pending-job index goes last so a partial failure never
+    # leaves the worker poll query without its index.
+    with op.get_context().autocommit_block():
+        op.create_index('ix_repositories_is_monitored', 'repositories', ['is_monitored'], postgresql_concurrently=True)
+        op.create_index('ix_repositories_owner_name', 'repositories', ['owner', 'name'], postgresql_concurrently=True)
+        op.create_index('ix_issues_status', 'issues', ['status'], postgresql_concurrently=True)
+        op.create_index('ix_issues_repo_id', 'issues', ['github_repo_id'], postgresql_concurrently=True)
+        op.create_index('ix_issues_updated_at', 'issues', ['updated_at'], postgresql_concurrently=True)
+        op.create_index('ix_claims_status', 'claims', ['status'], postgresql_concurrently=True)
+        op.create_index('ix_claims_issue_user', 'claims', ['issue_id', 'github_user_id'], postgresql_concurrently=True)
+        op.create_index('ix_claims_last_activity', 'claims', ['last_activity_timestamp'], postgresql_concurrently=True)
+        op.create_index('ix_claims_username', 'claims', ['github_username'], postgresql_concurrently=True)
+        op.create_index('ix_activity_log_claim_id', 'activity_log', ['claim_id'], postgresql_concurrently=True)
+        op.create_index('ix_activity_log_timestamp', 'activity_log', ['timestamp'], postgresql_concurrently=True)
+        op.create_index('ix_activity_log_type', 'activity_log', ['activity_type'], postgresql_concurrently=True)
+        op.create_index('ix_progress_tracking_updated_at', 'progress_tracking', ['updated_at'], postgresql_concurrently=True)
+        op.create_index('ix_queue_jobs_scheduled_at', 'queue_jobs', ['scheduled_at'], postgresql_concurrently=True)
+        op.create_index('ix_queue_jobs_status', 'queue_jobs', ['status'], postgresql_concurrently=True)
+        op.create_index('ix_queue_jobs_job_type', 'queue_jobs', ['job_type'], postgresql_concurrently=True)
+        op.create_index('ix_queue_jobs_status_scheduled', 'queue_jobs', ['status', 'scheduled_at'], postgresql_concurrently=True)
 
 
 def downgrade() -> None:
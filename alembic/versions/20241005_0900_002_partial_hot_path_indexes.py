@@ -0,0 +1,55 @@
+"""Partial indexes for hot worker paths
+
+Revision ID: 002
+Revises: 001
+Create Date: 2024-10-05 09:00:00.000000
+
+Replaces full-table B-tree indexes with partial ones covering only the rows
+workers actually poll:
+- queue_jobs: ix_queue_jobs_status_scheduled -> ix_queue_jobs_pending
+  (scheduled_at WHERE status = 'pending')
+- claims: ix_claims_status -> ix_claims_active
+  (last_activity_timestamp WHERE status = 'active')
+
+Completed/released rows never enter these indexes, so they stay sized to
+the pending/active working set instead of the full history.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '002'
+down_revision = '001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Swap status indexes for partial indexes on pending jobs / active claims"""
+    
+    # CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        # Build the replacements first so the poll queries are never unindexed
+        op.create_index(
+            'ix_queue_jobs_pending', 'queue_jobs', ['scheduled_at'],
+            postgresql_where=sa.text("status = 'pending'"),
+            postgresql_concurrently=True
+        )
+        op.create_index(
+            'ix_claims_active', 'claims', ['last_activity_timestamp'],
+            postgresql_where=sa.text("status = 'active'"),
+            postgresql_concurrently=True
+        )
+        
+        op.drop_index('ix_queue_jobs_status_scheduled', table_name='queue_jobs', postgresql_concurrently=True)
+        op.drop_index('ix_claims_status', table_name='claims', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Restore the full status indexes"""
+    with op.get_context().autocommit_block():
+        op.create_index('ix_claims_status', 'claims', ['status'], postgresql_concurrently=True)
+        op.create_index('ix_queue_jobs_status_scheduled', 'queue_jobs', ['status', 'scheduled_at'], postgresql_concurrently=True)
+        
+        op.drop_index('ix_claims_active', table_name='claims', postgresql_concurrently=True)
+        op.drop_index('ix_queue_jobs_pending', table_name='queue_jobs', postgresql_concurrently=True)
@@ -0,0 +1,65 @@
+"""Store JSON documents as JSONB
+
+Revision ID: 003
+Revises: 002
+Create Date: 2024-10-05 09:30:00.000000
+
+Converts every json column to jsonb (binary storage, no re-parse on read)
+and adds a GIN index on queue_jobs.payload for payload containment lookups.
+
+Note: ALTER COLUMN ... TYPE rewrites each table under an ACCESS EXCLUSIVE
+lock; run during a maintenance window on large tables.
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '003'
+down_revision = '002'
+branch_labels = None
+depends_on = None
+
+# (table, column) pairs stored as JSON documents
+JSON_COLUMNS = (
+    ('repositories', 'notification_settings'),
+    ('issues', 'github_data'),
+    ('claims', 'context_metadata'),
+    ('activity_log', 'metadata'),
+    ('queue_jobs', 'payload'),
+)
+
+
+def upgrade() -> None:
+    """Convert json columns to jsonb and index queue_jobs.payload"""
+    for table, column in JSON_COLUMNS:
+        op.alter_column(
+            table, column,
+            type_=postgresql.JSONB(astext_type=sa.Text()),
+            existing_type=sa.JSON(),
+            existing_nullable=True,
+            postgresql_using=f'"{column}"::jsonb'
+        )
+    
+    # CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_queue_jobs_payload_gin', 'queue_jobs', ['payload'],
+            postgresql_using='gin',
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    """Convert jsonb columns back to json"""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_queue_jobs_payload_gin', table_name='queue_jobs', postgresql_concurrently=True)
+    
+    for table, column in JSON_COLUMNS:
+        op.alter_column(
+            table, column,
+            type_=sa.JSON(),
+            existing_type=postgresql.JSONB(astext_type=sa.Text()),
+            existing_nullable=True,
+            postgresql_using=f'"{column}"::json'
+        )
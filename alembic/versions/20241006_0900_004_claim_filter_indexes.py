@@ -0,0 +1,65 @@
+"""Indexes backing claim listing and dashboard filters
+
+Revision ID: 004
+Revises: 003
+Create Date: 2024-10-06 09:00:00.000000
+
+Adds indexes for the hot claim filter combinations:
+- ix_claims_status_id: status filter with keyset pagination on id
+- ix_claims_username_trgm: GIN trigram index so ILIKE '%user%' can use an
+  index (requires the pg_trgm extension)
+- ix_claims_issue_status: per-issue/repository status counts
+- ix_claims_claim_timestamp_brin: BRIN range index for the 7-day window;
+  claims arrive in time order so a BRIN stays tiny compared to a B-tree
+- ix_claims_auto_released: partial index on auto-released claims
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '004'
+down_revision = '003'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create claim filter indexes"""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    
+    # CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_claims_status_id', 'claims', ['status', 'id'],
+            postgresql_concurrently=True
+        )
+        op.create_index(
+            'ix_claims_username_trgm', 'claims', ['github_username'],
+            postgresql_using='gin',
+            postgresql_ops={'github_username': 'gin_trgm_ops'},
+            postgresql_concurrently=True
+        )
+        op.create_index(
+            'ix_claims_issue_status', 'claims', ['issue_id', 'status'],
+            postgresql_concurrently=True
+        )
+        op.create_index(
+            'ix_claims_claim_timestamp_brin', 'claims', ['claim_timestamp'],
+            postgresql_using='brin',
+            postgresql_concurrently=True
+        )
+        op.create_index(
+            'ix_claims_auto_released', 'claims', ['id'],
+            postgresql_where=sa.text("release_reason = 'auto_released_after_max_nudges'"),
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    """Drop claim filter indexes"""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_claims_auto_released', table_name='claims', postgresql_concurrently=True)
+        op.drop_index('ix_claims_claim_timestamp_brin', table_name='claims', postgresql_concurrently=True)
+        op.drop_index('ix_claims_issue_status', table_name='claims', postgresql_concurrently=True)
+        op.drop_index('ix_claims_username_trgm', table_name='claims', postgresql_concurrently=True)
+        op.drop_index('ix_claims_status_id', table_name='claims', postgresql_concurrently=True)
@@ -0,0 +1,35 @@
+"""Composite activity_log index for per-claim history
+
+Revision ID: 005
+Revises: 004
+Create Date: 2024-10-06 09:30:00.000000
+
+Adds ix_activity_log_claim_timestamp (claim_id, timestamp) so a claim's
+activity history is read newest-first straight from the index instead of
+fetching every row for the claim and sorting. The global recent-activity
+feed is already served by ix_activity_log_timestamp scanned backwards.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '005'
+down_revision = '004'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create the per-claim activity history index"""
+    # CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_activity_log_claim_timestamp', 'activity_log', ['claim_id', 'timestamp'],
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    """Drop the per-claim activity history index"""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_activity_log_claim_timestamp', table_name='activity_log', postgresql_concurrently=True)
@@ -0,0 +1,49 @@
+"""Stored confidence bucket on claims
+
+Revision ID: 006
+Revises: 005
+Create Date: 2024-10-06 10:00:00.000000
+
+Adds claims.confidence_bucket, a STORED generated column holding the
+confidence_score decile (0, 10, ..., 100), plus an index on it. The
+dashboard's confidence distribution groups on the column instead of
+computing floor(confidence_score / 10) * 10 for every row.
+
+Note: adding a stored generated column rewrites the table under an
+ACCESS EXCLUSIVE lock; run during a maintenance window on large tables.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '006'
+down_revision = '005'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add the generated confidence_bucket column and its index"""
+    op.add_column(
+        'claims',
+        sa.Column(
+            'confidence_bucket', sa.SmallInteger(),
+            sa.Computed('(confidence_score / 10) * 10', persisted=True),
+            nullable=True
+        )
+    )
+    
+    # CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_claims_confidence_bucket', 'claims', ['confidence_bucket'],
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    """Drop confidence_bucket and its index"""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_claims_confidence_bucket', table_name='claims', postgresql_concurrently=True)
+    
+    op.drop_column('claims', 'confidence_bucket')
@@ -0,0 +1,33 @@
+"""Cached GitHub snapshots on progress_tracking
+
+Revision ID: 007
+Revises: 006
+Create Date: 2024-10-06 10:30:00.000000
+
+Adds commits_cache / prs_cache (jsonb) and cache_updated_at so the progress
+endpoints can serve the last GitHub commit and pull request snapshot
+straight from Postgres while a background task refreshes it.
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '007'
+down_revision = '006'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add GitHub snapshot columns to progress_tracking"""
+    op.add_column('progress_tracking', sa.Column('commits_cache', postgresql.JSONB(astext_type=sa.Text()), nullable=True))
+    op.add_column('progress_tracking', sa.Column('prs_cache', postgresql.JSONB(astext_type=sa.Text()), nullable=True))
+    op.add_column('progress_tracking', sa.Column('cache_updated_at', sa.DateTime(timezone=True), nullable=True))
+
+
+def downgrade() -> None:
+    """Drop GitHub snapshot columns from progress_tracking"""
+    op.drop_column('progress_tracking', 'cache_updated_at')
+    op.drop_column('progress_tracking', 'prs_cache')
+    op.drop_column('progress_tracking', 'commits_cache')
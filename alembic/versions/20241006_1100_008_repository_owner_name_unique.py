@@ -0,0 +1,49 @@
+"""Unique (owner, name) on repositories
+
+Revision ID: 008
+Revises: 007
+Create Date: 2024-10-06 11:00:00.000000
+
+Replaces the plain ix_repositories_owner_name index with a unique one, so
+registering the same repository twice is rejected by the database (and
+INSERT ... ON CONFLICT DO NOTHING can detect it) rather than relying on a
+check-then-insert in the API.
+
+Note: fails if duplicate (owner, name) rows already exist; remove them first.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '008'
+down_revision = '007'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Swap the (owner, name) index for a unique constraint"""
+    # CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'uq_repositories_owner_name', 'repositories', ['owner', 'name'],
+            unique=True,
+            postgresql_concurrently=True
+        )
+    
+    # Attach the constraint to the prebuilt index (no second table scan)
+    op.execute(
+        "ALTER TABLE repositories ADD CONSTRAINT uq_repositories_owner_name "
+        "UNIQUE USING INDEX uq_repositories_owner_name"
+    )
+    
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_repositories_owner_name', table_name='repositories', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Restore the plain (owner, name) index"""
+    with op.get_context().autocommit_block():
+        op.create_index('ix_repositories_owner_name', 'repositories', ['owner', 'name'], postgresql_concurrently=True)
+    
+    op.drop_constraint('uq_repositories_owner_name', 'repositories', type_='unique')
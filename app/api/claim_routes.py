@@ -6,13 +6,25 @@ As specified in MD file API Design section:
 - POST /api/claims/{id}/nudge
 - POST /api/claims/{id}/release
 """
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+import asyncio
+import base64
+import binascii
+import uuid
+from functools import lru_cache
+from types import SimpleNamespace
+
+import orjson
+
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, Query
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import bindparam, insert, select, func
+from sqlalchemy.orm import joinedload, selectinload
 from typing import List, Optional
 from pydantic import BaseModel
 from datetime import datetime
 
+from app.core.cache import invalidate, DASHBOARD_CACHE_KEYS
 from app.db.database import get_async_session
 from app.db.models import Claim, ActivityLog, Issue, Repository, ClaimStatus
 from app.workers.nudge_check import process_nudge_check
@@ -22,6 +34,61 @@ logger = get_logger(__name__)
 
 router = APIRouter()
 
+# Invariant statements are built once at import time; per request only the
+# bound parameters change, so SQLAlchemy's compiled cache is hit directly
+# Listing only reads the ClaimResponse columns, so select them as plain
+# rows rather than hydrating Claim/Issue/Repository entities
+_LIST_CLAIMS_BASE = select(
+    Claim.id,
+    Claim.issue_id,
+    Claim.github_user_id,
+    Claim.github_username,
+    Claim.claim_text,
+    Claim.claim_timestamp,
+    Claim.status,
+    Claim.confidence_score,
+    Claim.first_nudge_sent_at,
+    Claim.last_activity_timestamp,
+    Claim.auto_release_timestamp,
+    Claim.release_reason,
+    Issue.github_issue_number,
+    Issue.title.label("issue_title"),
+    Repository.owner_name,
+    Repository.name.label("repository_name")
+).select_from(Claim).join(
+    Issue, Claim.issue_id == Issue.id
+).join(
+    Repository, Issue.repository_id == Repository.id
+)
+
+_COUNT_CLAIMS_BASE = select(func.count(Claim.id)).select_from(
+    Claim.__table__.join(Issue.__table__, Claim.issue_id == Issue.id).join(
+        Repository.__table__, Issue.repository_id == Repository.id
+    )
+)
+
+_GET_CLAIM_BY_ID = select(Claim).where(Claim.id == bindparam("claim_id"))
+
+_GET_CLAIM_WITH_REPOSITORY = select(Claim).options(
+    joinedload(Claim.issue).joinedload(Issue.repository)
+).where(Claim.id == bindparam("claim_id"))
+
+_GET_CLAIM_DETAILS = select(Claim).options(
+    joinedload(Claim.issue).joinedload(Issue.repository),
+    selectinload(Claim.activity_logs)
+).where(Claim.id == bindparam("claim_id"))
+
+# Full history is unbounded, so it is fetched from a server-side cursor in
+# batches rather than buffered whole
+_ACTIVITY_BY_CLAIM = select(ActivityLog).where(
+    ActivityLog.claim_id == bindparam("claim_id")
+).order_by(ActivityLog.timestamp.desc()).execution_options(yield_per=500)
+
+# Claim.status is a native enum column, so loaded claims always carry a
+# ClaimStatus member and never raw strings
+_NUDGEABLE_STATUSES = frozenset({ClaimStatus.ACTIVE})
+_RELEASABLE_STATUSES = frozenset({ClaimStatus.ACTIVE})
+
 # Pydantic models
 class ClaimResponse(BaseModel):
     id: int
@@ -47,17 +114,45 @@ class ClaimResponse(BaseModel):
 
 class ClaimListResponse(BaseModel):
     claims: List[ClaimResponse]
-    total_count: int
-    page: int
+    total_count: Optional[int] = None
     per_page: int
+    next_cursor: Optional[str] = None
+
+
+@lru_cache(maxsize=32)
+def normalize_claim_status(value: str):
+    """Map a status query value to ClaimStatus, case-insensitively; unknown values pass through."""
+    return ClaimStatus.__members__.get(value.upper(), value)
+
+
+def escape_like(value: str) -> str:
+    """Escape LIKE wildcards (with '/' as the escape character) so user input is matched literally."""
+    return value.replace("/", "//").replace("%", "/%").replace("_", "/_")
+
+
+def encode_claim_cursor(claim_id: int) -> str:
+    """Encode the last claim ID of a page as an opaque cursor."""
+    return base64.urlsafe_b64encode(str(claim_id).encode()).decode()
+
+
+def decode_claim_cursor(cursor: str) -> int:
+    """Decode a cursor produced by encode_claim_cursor."""
+    try:
+        return int(base64.urlsafe_b64decode(cursor.encode()).decode())
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
 
 @router.get("/claims", response_model=ClaimListResponse)
 async def list_claims(
     status: Optional[str] = Query(None, description="Filter by claim status"),
     repo: Optional[str] = Query(None, description="Filter by repository (owner/name)"),
     user: Optional[str] = Query(None, description="Filter by GitHub username"),
-    page: int = Query(1, ge=1, description="Page number"),
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page's next_cursor"),
     per_page: int = Query(50, ge=1, le=200, description="Items per page"),
+    include_total: bool = Query(False, description="Also return the total match count (slow on large tables)"),
     db: AsyncSession = Depends(get_async_session)
 ):
     """
@@ -65,79 +160,89 @@ async def list_claims(
     As specified in MD file: GET /api/claims
     """
     
-    # Build base query with joins
-    stmt = select(Claim, Issue, Repository).join(
-        Issue, Claim.issue_id == Issue.id
-    ).join(
-        Repository, Issue.repository_id == Repository.id
-    )
-    
-    # Apply filters
+    # Collect filters once so the page and optional count queries match
+    filters = []
     if status:
-        # Convert string status to enum if needed
-        status_enum = ClaimStatus(status) if hasattr(ClaimStatus, status.upper()) else status
-        stmt = stmt.where(Claim.status == status_enum)
+        filters.append(Claim.status == normalize_claim_status(status))
     
     if repo:
         if "/" in repo:
             owner, name = repo.split("/", 1)
-            stmt = stmt.where(Repository.owner_name == owner, Repository.name == name)
+            filters.extend([Repository.owner_name == owner, Repository.name == name])
     
     if user:
-        stmt = stmt.where(Claim.github_username.ilike(f"%{user}%"))
+        # Substring match served by the ix_claims_username_trgm GIN index;
+        # wildcards in the input are escaped so they match literally
+        filters.append(Claim.github_username.ilike(f"%{escape_like(user)}%", escape="/"))
     
-    # Get total count - use the same join pattern as the main query
-    count_stmt = select(func.count(Claim.id)).select_from(
-        Claim.__table__.join(Issue.__table__, Claim.issue_id == Issue.id).join(
-            Repository.__table__, Issue.repository_id == Repository.id
+    # Build base query with joins
+    stmt = _LIST_CLAIMS_BASE.where(*filters)
+    
+    # Counting every match is O(rows), so it is opt-in. The count rides
+    # along as an uncorrelated scalar subquery on the page query, so it costs
+    # no extra round trip and ignores the cursor below.
+    count_stmt = _COUNT_CLAIMS_BASE.where(*filters)
+    if include_total:
+        stmt = stmt.add_columns(
+            count_stmt.correlate(None).scalar_subquery().label("total_count")
         )
-    )
-    if status:
-        status_enum = ClaimStatus(status) if hasattr(ClaimStatus, status.upper()) else status
-        count_stmt = count_stmt.where(Claim.status == status_enum)
-    if repo and "/" in repo:
-        owner, name = repo.split("/", 1)
-        count_stmt = count_stmt.where(Repository.owner_name == owner, Repository.name == name)
-    if user:
-        count_stmt = count_stmt.where(Claim.github_username.ilike(f"%{user}%"))
     
-    count_result = await db.execute(count_stmt)
-    total_count = count_result.scalar()
-    
-    # Apply pagination
-    offset = (page - 1) * per_page
-    stmt = stmt.offset(offset).limit(per_page)
+    # Keyset pagination, newest first: seek below the cursor on the primary
+    # key instead of scanning and discarding OFFSET rows. One extra row tells
+    # us whether another page exists.
+    if cursor:
+        stmt = stmt.where(Claim.id < decode_claim_cursor(cursor))
+    stmt = stmt.order_by(Claim.id.desc()).limit(per_page + 1)
     result = await db.execute(stmt)
     claims_data = result.all()
     
-    # Format response
-    claim_responses = []
-    for claim, issue, repository in claims_data:
-        claim_data = ClaimResponse(
-            id=claim.id,
-            issue_id=claim.issue_id,
-            github_user_id=claim.github_user_id,
-            github_username=claim.github_username,
-            claim_text=claim.claim_text,
-            claim_timestamp=claim.claim_timestamp,
-            status=claim.status.value if hasattr(claim.status, 'value') else claim.status,
-            confidence_score=claim.confidence_score,
-            first_nudge_sent_at=claim.first_nudge_sent_at,
-            last_activity_timestamp=claim.last_activity_timestamp,
-            auto_release_timestamp=claim.auto_release_timestamp,
-            release_reason=claim.release_reason,
-            issue_number=issue.github_issue_number if issue else None,
-            issue_title=issue.title if issue else None,
-            repository_name=f"{repository.owner_name}/{repository.name}" if repository else None
-        )
-        claim_responses.append(claim_data)
+    total_count = None
+    if include_total:
+        if claims_data:
+            total_count = claims_data[0].total_count
+        elif not cursor:
+            total_count = 0
+        else:
+            # Past the last page there is no row to carry the count
+            count_result = await db.execute(count_stmt)
+            total_count = count_result.scalar()
+    
+    next_cursor = None
+    if len(claims_data) > per_page:
+        claims_data = claims_data[:per_page]
+        next_cursor = encode_claim_cursor(claims_data[-1].id)
+    
+    # Rows come from typed columns, so build the ClaimResponse shape as
+    # plain dicts and hand them to orjson directly; returning a Response
+    # skips per-row model validation and the jsonable_encoder pass (orjson
+    # writes the ClaimStatus enum as its value)
+    claim_responses = [
+        {
+            "id": row.id,
+            "issue_id": row.issue_id,
+            "github_user_id": row.github_user_id,
+            "github_username": row.github_username,
+            "claim_text": row.claim_text,
+            "claim_timestamp": row.claim_timestamp,
+            "status": row.status,
+            "confidence_score": row.confidence_score,
+            "first_nudge_sent_at": row.first_nudge_sent_at,
+            "last_activity_timestamp": row.last_activity_timestamp,
+            "auto_release_timestamp": row.auto_release_timestamp,
+            "release_reason": row.release_reason,
+            "issue_number": row.github_issue_number,
+            "issue_title": row.issue_title,
+            "repository_name": f"{row.owner_name}/{row.repository_name}"
+        }
+        for row in claims_data
+    ]
     
-    return ClaimListResponse(
-        claims=claim_responses,
-        total_count=total_count,
-        page=page,
-        per_page=per_page
-    )
+    return ORJSONResponse({
+        "claims": claim_responses,
+        "total_count": total_count,
+        "per_page": per_page,
+        "next_cursor": next_cursor
+    })
 
 @router.get("/claims/{claim_id}")
 async def get_claim_details(
@@ -149,31 +254,20 @@ async def get_claim_details(
     As specified in MD file: GET /api/claims/{id}
     """
     
-    # Get claim with related data
-    stmt = select(Claim, Issue, Repository).join(
-        Issue, Claim.issue_id == Issue.id
-    ).join(
-        Repository, Issue.repository_id == Repository.id
-    ).where(Claim.id == claim_id)
-    
-    result = await db.execute(stmt)
-    claim_data = result.first()
+    # Claim, issue and repository come back in one joined row and the
+    # activities in a single selectin query, so nothing lazy-loads later
+    result = await db.execute(_GET_CLAIM_DETAILS, {"claim_id": claim_id})
+    claim = result.scalars().first()
     
-    if not claim_data:
+    if not claim:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Claim {claim_id} not found"
         )
     
-    claim, issue, repository = claim_data
-    
-    # Get activity history
-    activities_stmt = select(ActivityLog).where(
-        ActivityLog.claim_id == claim_id
-    ).order_by(ActivityLog.timestamp.desc())
-    
-    activities_result = await db.execute(activities_stmt)
-    activities = activities_result.scalars().all()
+    issue = claim.issue
+    repository = issue.repository if issue else None
+    activities = sorted(claim.activity_logs, key=lambda activity: activity.timestamp, reverse=True)
     
     activity_history = [
         {
@@ -186,7 +280,7 @@ async def get_claim_details(
         for activity in activities
     ]
     
-    return {
+    return ORJSONResponse({
         "claim": {
             "id": claim.id,
             "issue_id": claim.issue_id,
@@ -211,7 +305,7 @@ async def get_claim_details(
             "repository": f"{repository.owner_name}/{repository.name}" if repository else None
         } if issue else None,
         "activity_history": activity_history
-    }
+    })
 
 @router.post("/claims/{claim_id}/nudge")
 async def manually_send_nudge(
@@ -224,8 +318,7 @@ async def manually_send_nudge(
     """
     
     # Verify claim exists and is active
-    stmt = select(Claim).where(Claim.id == claim_id)
-    result = await db.execute(stmt)
+    result = await db.execute(_GET_CLAIM_BY_ID, {"claim_id": claim_id})
     claim = result.scalar_one_or_none()
     
     if not claim:
@@ -234,32 +327,36 @@ async def manually_send_nudge(
             detail=f"Claim {claim_id} not found"
         )
     
-    if claim.status != ClaimStatus.ACTIVE:
+    if claim.status not in _NUDGEABLE_STATUSES:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Cannot nudge claim with status: {claim.status.value}"
         )
     
     try:
-        # Schedule nudge check (which will send the nudge)
-        result = process_nudge_check.delay(claim_id)
+        # The task ID is fixed up front so the log can reference it, but the
+        # task itself is only dispatched once the log is committed; a rolled
+        # back request never leaves an orphaned nudge behind
+        task_id = str(uuid.uuid4())
         
         # Log the manual nudge action
         from app.db.models import ActivityType
-        manual_nudge_log = ActivityLog(
+        await db.execute(insert(ActivityLog).values(
             claim_id=claim_id,
             activity_type=ActivityType.PROGRESS_NUDGE,
             description="Manual nudge triggered via API",
-            activity_metadata={"task_id": result.id, "manual_trigger": True}
-        )
-        
-        db.add(manual_nudge_log)
+            activity_metadata={"task_id": task_id, "manual_trigger": True}
+        ))
         await db.commit()
+        await invalidate(*DASHBOARD_CACHE_KEYS)
+        
+        # Schedule nudge check (which will send the nudge)
+        process_nudge_check.apply_async(args=[claim_id], task_id=task_id)
         
         return {
             "message": f"Nudge scheduled for claim {claim_id}",
             "claim_id": claim_id,
-            "task_id": result.id,
+            "task_id": task_id,
             "status": "scheduled"
         }
         
@@ -270,9 +367,69 @@ async def manually_send_nudge(
             detail=f"Error scheduling nudge: {str(e)}"
         )
 
+async def _post_release_side_effects(
+    claim_id: int,
+    owner_name: str,
+    repository_name: str,
+    issue_number: int,
+    issue_title: Optional[str],
+    issue_github_data: Optional[dict],
+    username: str,
+    claim_timestamp: datetime,
+    release_reason: Optional[str]
+):
+    """Unassign the user on GitHub and email them about the manual release."""
+    try:
+        from app.services.github_service import get_github_service
+        from app.services.notification_service import get_notification_service
+        
+        github_service = get_github_service()
+        notification_service = get_notification_service()
+    except Exception as e:
+        logger.warning(f"Failed to set up release follow-up for claim {claim_id}: {e}")
+        return
+    
+    repository_full_name = f"{owner_name}/{repository_name}"
+    
+    # The email templates read claim.issue.repository.owner; the session is
+    # gone by now, so hand them a detached snapshot of the released claim
+    released_claim = SimpleNamespace(
+        github_username=username,
+        claim_timestamp=claim_timestamp,
+        issue=SimpleNamespace(
+            github_issue_number=issue_number,
+            title=issue_title,
+            github_data=issue_github_data,
+            repository=SimpleNamespace(owner=owner_name, name=repository_name)
+        )
+    )
+    
+    # Both calls are independent, so latency is the slower of the two
+    unassign_result, notify_result = await asyncio.gather(
+        github_service.unassign_issue(owner_name, repository_name, issue_number, username),
+        notification_service.send_auto_release_email(
+            released_claim,
+            reason=release_reason or "Released by a maintainer"
+        ),
+        return_exceptions=True
+    )
+    
+    # unassign_issue reports API errors by returning False
+    if isinstance(unassign_result, Exception) or unassign_result is False:
+        logger.warning(f"Failed to remove GitHub assignment for {username} on {repository_full_name}#{issue_number}: {unassign_result}")
+    else:
+        logger.info(f"Removed GitHub assignment for {username} on {repository_full_name}#{issue_number}")
+    
+    # send_auto_release_email returns False when email is disabled or fails
+    if isinstance(notify_result, Exception) or notify_result is False:
+        logger.warning(f"Failed to send release email for claim {claim_id}: {notify_result}")
+    else:
+        logger.info(f"Sent release email for manual release of claim {claim_id}")
+
 @router.post("/claims/{claim_id}/release")
 async def manually_release_claim(
     claim_id: int,
+    background_tasks: BackgroundTasks,
     reason: Optional[str] = None,
     db: AsyncSession = Depends(get_async_session)
 ):
@@ -281,9 +438,9 @@ async def manually_release_claim(
     As specified in MD file: POST /api/claims/{id}/release
     """
     
-    # Verify claim exists and can be released
-    stmt = select(Claim).where(Claim.id == claim_id)
-    result = await db.execute(stmt)
+    # Verify claim exists and can be released; issue and repository are
+    # loaded up front so the GitHub/notification steps below never lazy-load
+    result = await db.execute(_GET_CLAIM_WITH_REPOSITORY, {"claim_id": claim_id})
     claim = result.scalar_one_or_none()
     
     if not claim:
@@ -292,10 +449,10 @@ async def manually_release_claim(
             detail=f"Claim {claim_id} not found"
         )
     
-    if claim.status not in [ClaimStatus.ACTIVE, "active", "inactive"]:
+    if claim.status not in _RELEASABLE_STATUSES:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Cannot release claim with status: {claim.status}"
+            detail=f"Cannot release claim with status: {claim.status.value}"
         )
     
     try:
@@ -304,55 +461,36 @@ async def manually_release_claim(
         claim.auto_release_timestamp = datetime.utcnow()
         claim.release_reason = reason or "manual_release_via_api"
         
-        # Log the manual release
+        # Log the manual release with a Core insert; it goes out in the same
+        # transaction as the claim UPDATE, without unit-of-work bookkeeping
         from app.db.models import ActivityType
-        release_log = ActivityLog(
+        await db.execute(insert(ActivityLog).values(
             claim_id=claim_id,
             activity_type=ActivityType.MANUAL_RELEASE,
             description="Claim manually released via API",
             timestamp=datetime.utcnow(),
             activity_metadata={"reason": reason}
-        )
-        
-        db.add(release_log)
+        ))
         await db.commit()
         
-        # Remove GitHub assignment if exists
-        try:
-            from app.services.github_service import GitHubService
-            github_service = GitHubService()
-            
-            if claim.issue and claim.issue.repository:
-                repo_full_name = f"{claim.issue.repository.owner}/{claim.issue.repository.name}"
-                await github_service.unassign_issue(
-                    repo_full_name,
-                    claim.issue.github_issue_number,
-                    claim.github_username
-                )
-                logger.info(f"Removed GitHub assignment for {claim.github_username} on {repo_full_name}#{claim.issue.github_issue_number}")
-        except Exception as e:
-            logger.warning(f"Failed to remove GitHub assignment: {e}")
+        # Dashboard aggregates count this claim as active until dropped
+        await invalidate(*DASHBOARD_CACHE_KEYS)
         
-        # Notify maintainers
-        try:
-            from app.services.notification_service import NotificationService
-            notification_service = NotificationService()
-            
-            if claim.issue and claim.issue.repository:
-                await notification_service.send_maintainer_notification(
-                    repository_full_name=f"{claim.issue.repository.owner}/{claim.issue.repository.name}",
-                    event_type="manual_release",
-                    details={
-                        "issue_number": claim.issue.github_issue_number,
-                        "issue_title": claim.issue.title,
-                        "username": claim.github_username,
-                        "release_reason": claim.release_reason,
-                        "manual_release": True
-                    }
-                )
-                logger.info(f"Sent maintainer notification for manual release of claim {claim_id}")
-        except Exception as e:
-            logger.warning(f"Failed to send maintainer notification: {e}")
+        # The release is committed, which is all the response depends on;
+        # the GitHub unassign and release email run after it has been sent
+        if claim.issue and claim.issue.repository:
+            background_tasks.add_task(
+                _post_release_side_effects,
+                claim_id=claim_id,
+                owner_name=claim.issue.repository.owner_name,
+                repository_name=claim.issue.repository.name,
+                issue_number=claim.issue.github_issue_number,
+                issue_title=claim.issue.title,
+                issue_github_data=claim.issue.github_data,
+                username=claim.github_username,
+                claim_timestamp=claim.claim_timestamp,
+                release_reason=claim.release_reason
+            )
         
         return {
             "message": f"Claim {claim_id} released successfully",
@@ -379,8 +517,7 @@ async def get_claim_activity(
     """
     
     # Verify claim exists
-    stmt = select(Claim).where(Claim.id == claim_id)
-    result = await db.execute(stmt)
+    result = await db.execute(_GET_CLAIM_BY_ID, {"claim_id": claim_id})
     claim = result.scalar_one_or_none()
     
     if not claim:
@@ -389,24 +526,24 @@ async def get_claim_activity(
             detail=f"Claim {claim_id} not found"
         )
     
-    # Get activity history
-    activities_stmt = select(ActivityLog).where(
-        ActivityLog.claim_id == claim_id
-    ).order_by(ActivityLog.timestamp.desc())
-    
-    activities_result = await db.execute(activities_stmt)
-    activities = activities_result.scalars().all()
-    
-    return {
-        "claim_id": claim_id,
-        "activities": [
-            {
+    # Stream the history: rows come off the cursor and are encoded one at a
+    # time, so memory stays flat however long the claim's history is.
+    # The session dependency stays open until the response has been sent.
+    async def generate_activity():
+        yield b'{"claim_id":' + orjson.dumps(claim_id) + b',"activities":['
+        first = True
+        activities = await db.stream_scalars(_ACTIVITY_BY_CLAIM, {"claim_id": claim_id})
+        async for activity in activities:
+            if not first:
+                yield b","
+            yield orjson.dumps({
                 "id": activity.id,
                 "type": activity.activity_type,
                 "description": activity.description,
                 "timestamp": activity.timestamp.isoformat(),
                 "metadata": activity.activity_metadata
-            }
-            for activity in activities
-        ]
-    }
\ No newline at end of file
+            })
+            first = False
+        yield b"]}"
+    
+    return StreamingResponse(generate_activity(), media_type="application/json")
@@ -5,85 +5,151 @@ As specified in MD file API Design section:
 - GET /api/dashboard/repositories 
 - GET /api/dashboard/users
 """
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, desc, case
+from sqlalchemy import bindparam, select, func, desc, case, and_
 from typing import List, Dict
 from datetime import datetime, timedelta
+import hashlib
 
+import orjson
+
+from app.core.cache import cached_json, DASHBOARD_STATS_KEY, DASHBOARD_REPOS_KEY, DASHBOARD_USERS_KEY
+from app.core.config import get_settings
 from app.db.database import get_async_session
 from app.db.models import Repository, Claim, Issue, ActivityLog
 from app.db.models.claims import ClaimStatus
 
 router = APIRouter()
+settings = get_settings()
 
-@router.get("/dashboard/stats")
-async def get_dashboard_stats(db: AsyncSession = Depends(get_async_session)):
-    """
-    Overall system statistics
-    As specified in MD file: GET /api/dashboard/stats
+# Invariant statements are built once at import time; per request only the
+# bound parameters change, so SQLAlchemy's compiled cache is hit directly
+_DASHBOARD_STATS = select(
+    func.count(Claim.id).label("total_claims"),
+    func.count(case((Claim.status == ClaimStatus.ACTIVE, 1))).label("active_claims"),
+    func.count(case((Claim.status == ClaimStatus.RELEASED, 1))).label("released_claims"),
+    func.count(case((Claim.status == ClaimStatus.COMPLETED, 1))).label("completed_claims"),
+    func.count(case((Claim.claim_timestamp >= bindparam("week_ago"), 1))).label("recent_claims"),
+    func.count(case((Claim.release_reason == "auto_released_after_max_nudges", 1))).label("auto_released"),
+    func.avg(case((
+        and_(Claim.status == ClaimStatus.RELEASED, Claim.auto_release_timestamp.isnot(None)),
+        func.extract("epoch", Claim.auto_release_timestamp - Claim.claim_timestamp)
+    ))).label("avg_seconds_to_release")
+)
+
+# confidence_bucket is a stored generated column with its own index, so the
+# distribution is an index-only scan instead of computing the bucket per row
+_CONFIDENCE_DISTRIBUTION = select(
+    Claim.confidence_bucket.label("confidence_range"),
+    func.count().label("count")
+).group_by(Claim.confidence_bucket)
+
+_REPOSITORY_STATS = select(
+    Repository.id,
+    Repository.owner_name,
+    Repository.name,
+    Repository.is_monitored,
+    func.count(Claim.id).label("total_claims"),
+    func.count(case((Claim.status == ClaimStatus.COMPLETED, 1))).label("completed_claims"),
+    func.count(case((Claim.status == ClaimStatus.ACTIVE, 1))).label("active_claims")
+).select_from(Repository).outerjoin(
+    Claim, Claim.repository_id == Repository.id
+).group_by(
+    Repository.id, Repository.owner_name, Repository.name, Repository.is_monitored
+)
+
+_USER_TOTAL = func.count(Claim.id)
+_USER_COMPLETED = func.sum(case((Claim.status == ClaimStatus.COMPLETED, 1), else_=0))
+_USER_RELEASED = func.sum(case((Claim.status == ClaimStatus.RELEASED, 1), else_=0))
+_USER_COMPLETION_RATE = _USER_COMPLETED * 100.0 / _USER_TOTAL
+
+_USER_STATS = select(
+    Claim.github_username,
+    _USER_TOTAL.label("total_claims"),
+    _USER_COMPLETED.label("completed_claims"),
+    _USER_RELEASED.label("released_claims")
+).group_by(Claim.github_username)
+
+# Leaderboards are filtered, ranked and cut down by Postgres so only the
+# rows that are returned cross the wire
+_TOP_CONTRIBUTORS = _USER_STATS.having(
+    and_(_USER_TOTAL >= 3, _USER_COMPLETION_RATE >= 80)
+).order_by(_USER_COMPLETION_RATE.desc(), _USER_TOTAL.desc()).limit(20)
+
+_FREQUENT_CLAIMERS = _USER_STATS.having(
+    _USER_TOTAL >= 10
+).order_by(_USER_TOTAL.desc()).limit(20)
+
+_USER_STATS_SUBQUERY = _USER_STATS.subquery()
+_USER_DISTRIBUTION = select(
+    func.count().label("total_users"),
+    func.count(case((
+        _USER_STATS_SUBQUERY.c.completed_claims * 1.0 / _USER_STATS_SUBQUERY.c.total_claims >= 0.8, 1
+    ))).label("high_performers"),
+    func.count(case((_USER_STATS_SUBQUERY.c.total_claims >= 5, 1))).label("frequent_users")
+).select_from(_USER_STATS_SUBQUERY)
+
+_RECENT_ACTIVITY = select(
+    ActivityLog.id,
+    ActivityLog.activity_type,
+    ActivityLog.description,
+    ActivityLog.timestamp,
+    ActivityLog.claim_id,
+    ActivityLog.activity_metadata,
+    Claim.github_username
+).join(
+    Claim, ActivityLog.claim_id == Claim.id
+).order_by(desc(ActivityLog.timestamp)).limit(100)
+
+def _conditional_json_response(request: Request, payload: Dict) -> Response:
     """
+    Serialize payload once and tag it with a strong ETag; a matching
+    If-None-Match gets an empty 304 instead of the body.
     
-    # Total claims
-    total_claims_stmt = select(func.count(Claim.id))
-    total_claims_result = await db.execute(total_claims_stmt)
-    total_claims = total_claims_result.scalar()
+    If-None-Match uses weak comparison (RFC 9110 13.1.2): proxies that
+    compress the body, such as nginx gzip, hand the tag back as W/"...".
+    """
+    body = orjson.dumps(payload)
+    etag = '"' + hashlib.blake2b(body, digest_size=12).hexdigest() + '"'
+    headers = {
+        "ETag": etag,
+        "Cache-Control": f"private, max-age={settings.DASHBOARD_CACHE_TTL}"
+    }
     
-    # Active claims  
-    active_claims_stmt = select(func.count(Claim.id)).where(Claim.status == ClaimStatus.ACTIVE)
-    active_claims_result = await db.execute(active_claims_stmt)
-    active_claims = active_claims_result.scalar()
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+        if "*" in tags or etag in tags:
+            return Response(status_code=304, headers=headers)
     
-    # Released claims
-    released_claims_stmt = select(func.count(Claim.id)).where(Claim.status == ClaimStatus.RELEASED)
-    released_claims_result = await db.execute(released_claims_stmt)
-    released_claims = released_claims_result.scalar()
+    return Response(content=body, media_type="application/json", headers=headers)
+
+async def _compute_dashboard_stats(db: AsyncSession) -> Dict:
+    """Build the overall statistics payload."""
+    # Headline counts and average release time in one round trip via
+    # conditional aggregation; the average is computed by Postgres instead
+    # of loading every released claim
+    week_ago = datetime.utcnow() - timedelta(days=7)
+    stats_result = await db.execute(_DASHBOARD_STATS, {"week_ago": week_ago})
+    stats = stats_result.one()
     
-    # Completed claims
-    completed_claims_stmt = select(func.count(Claim.id)).where(Claim.status == ClaimStatus.COMPLETED)
-    completed_claims_result = await db.execute(completed_claims_stmt)
-    completed_claims = completed_claims_result.scalar()
+    total_claims = stats.total_claims
+    active_claims = stats.active_claims
+    released_claims = stats.released_claims
+    completed_claims = stats.completed_claims
+    recent_claims = stats.recent_claims
+    auto_released = stats.auto_released
     
     # Claims by confidence score distribution  
-    confidence_bucket = func.floor(Claim.confidence_score / 10) * 10
-    confidence_stmt = select(
-        confidence_bucket.label("confidence_range"),
-        func.count(Claim.id).label("count")
-    ).group_by(confidence_bucket)
-    confidence_result = await db.execute(confidence_stmt)
+    confidence_result = await db.execute(_CONFIDENCE_DISTRIBUTION)
     confidence_data = confidence_result.all()
     confidence_distribution = {str(int(row.confidence_range)): row.count for row in confidence_data}
     
-    # Recent activity (last 7 days)
-    week_ago = datetime.utcnow() - timedelta(days=7)
-    recent_claims_stmt = select(func.count(Claim.id)).where(
-        Claim.claim_timestamp >= week_ago
-    )
-    recent_claims_result = await db.execute(recent_claims_stmt)
-    recent_claims = recent_claims_result.scalar()
-    
-    # Auto-release rate
-    auto_released_stmt = select(func.count(Claim.id)).where(
-        Claim.release_reason == "auto_released_after_max_nudges"
-    )
-    auto_released_result = await db.execute(auto_released_stmt)
-    auto_released = auto_released_result.scalar()
-    
-    # Average time to release
-    released_with_time_stmt = select(Claim).where(
-        Claim.status == ClaimStatus.RELEASED,
-        Claim.auto_release_timestamp.isnot(None)
-    )
-    released_with_time_result = await db.execute(released_with_time_stmt)
-    released_with_time = released_with_time_result.scalars().all()
-    
     avg_time_to_release = None
-    if released_with_time:
-        total_time = sum([
-            (claim.auto_release_timestamp - claim.claim_timestamp).total_seconds()
-            for claim in released_with_time
-        ])
-        avg_time_to_release = total_time / len(released_with_time) / 86400  # days
+    if stats.avg_seconds_to_release is not None:
+        avg_time_to_release = float(stats.avg_seconds_to_release) / 86400  # days
     
     return {
         "overview": {
@@ -101,64 +167,44 @@ async def get_dashboard_stats(db: AsyncSession = Depends(get_async_session)):
         "generated_at": datetime.utcnow().isoformat()
     }
 
-@router.get("/dashboard/repositories")
-async def get_repository_metrics(db: AsyncSession = Depends(get_async_session)):
+@router.get("/dashboard/stats")
+async def get_dashboard_stats(request: Request, db: AsyncSession = Depends(get_async_session)):
     """
-    Repository-specific metrics
-    As specified in MD file: GET /api/dashboard/repositories
+    Overall system statistics
+    As specified in MD file: GET /api/dashboard/stats
     """
+    payload = await cached_json(
+        DASHBOARD_STATS_KEY, settings.DASHBOARD_CACHE_TTL, lambda: _compute_dashboard_stats(db)
+    )
+    return _conditional_json_response(request, payload)
+
+async def _compute_repository_metrics(db: AsyncSession) -> Dict:
+    """Build the per-repository metrics payload."""
+    # Per-repository claim counts in a single GROUP BY; the outer join keeps
+    # monitored repositories that have no claims yet
+    repo_stats_result = await db.execute(_REPOSITORY_STATS)
+    repo_stats = repo_stats_result.all()
     
     # Active claims per repository
-    repo_claims_stmt = select(
-        Repository.owner_name,
-        Repository.name,
-        Repository.id,
-        func.count(Claim.id).label("active_claims")
-    ).select_from(
-        Repository.__table__.join(Issue.__table__, Repository.id == Issue.repository_id)
-        .join(Claim.__table__, Issue.id == Claim.issue_id)
-    ).where(
-        Claim.status == ClaimStatus.ACTIVE
-    ).group_by(
-        Repository.id, Repository.owner_name, Repository.name
-    ).order_by(desc("active_claims"))
-    
-    repo_claims_result = await db.execute(repo_claims_stmt)
-    repo_claims = repo_claims_result.all()
+    repo_claims = sorted(
+        (r for r in repo_stats if r.active_claims > 0),
+        key=lambda r: r.active_claims,
+        reverse=True
+    )
     
-    # Success rate per repository (claims completed vs total)
+    # Success rate per monitored repository (claims completed vs total)
     repo_success_rates = []
-    
-    # Get all monitored repositories
-    monitored_repos_stmt = select(Repository).where(Repository.is_monitored == True)
-    monitored_repos_result = await db.execute(monitored_repos_stmt)
-    monitored_repos = monitored_repos_result.scalars().all()
-    
-    for repo in monitored_repos:
-        # Total claims for this repository
-        total_claims_stmt = select(func.count(Claim.id)).select_from(
-            Claim.__table__.join(Issue.__table__, Claim.issue_id == Issue.id)
-        ).where(Issue.repository_id == repo.id)
-        total_claims_result = await db.execute(total_claims_stmt)
-        total_claims = total_claims_result.scalar()
-        
-        # Completed claims for this repository
-        completed_claims_stmt = select(func.count(Claim.id)).select_from(
-            Claim.__table__.join(Issue.__table__, Claim.issue_id == Issue.id)
-        ).where(
-            Issue.repository_id == repo.id,
-            Claim.status == ClaimStatus.COMPLETED
-        )
-        completed_claims_result = await db.execute(completed_claims_stmt)
-        completed_claims = completed_claims_result.scalar()
+    for repo in repo_stats:
+        if not repo.is_monitored:
+            continue
         
-        success_rate = completed_claims / max(total_claims, 1) * 100
+        success_rate = repo.completed_claims / max(repo.total_claims, 1) * 100
         
         repo_success_rates.append({
             "repository": f"{repo.owner_name}/{repo.name}",
             "repository_id": repo.id,
-            "total_claims": total_claims,
-            "completed_claims": completed_claims,
+            "total_claims": repo.total_claims,
+            "completed_claims": repo.completed_claims,
             "success_rate": round(success_rate, 1)
         })
     
@@ -175,92 +221,93 @@ async def get_repository_metrics(db: AsyncSession = Depends(get_async_session)):
         "generated_at": datetime.utcnow().isoformat()
     }
 
-@router.get("/dashboard/users")
-async def get_user_metrics(db: AsyncSession = Depends(get_async_session)):
+@router.get("/dashboard/repositories")
+async def get_repository_metrics(request: Request, db: AsyncSession = Depends(get_async_session)):
     """
-    User activity metrics
-    As specified in MD file: GET /api/dashboard/users
+    Repository-specific metrics
+    As specified in MD file: GET /api/dashboard/repositories
     """
+    payload = await cached_json(
+        DASHBOARD_REPOS_KEY, settings.DASHBOARD_CACHE_TTL, lambda: _compute_repository_metrics(db)
+    )
+    return _conditional_json_response(request, payload)
+
+def _format_user_stats(user) -> Dict:
+    """Shape a per-user stats row for the dashboard."""
+    return {
+        "username": user.github_username,
+        "total_claims": user.total_claims,
+        "completed_claims": user.completed_claims,
+        "released_claims": user.released_claims,
+        "completion_rate": round(user.completed_claims / user.total_claims * 100, 1)
+    }
+
+async def _compute_user_metrics(db: AsyncSession) -> Dict:
+    """Build the user activity metrics payload."""
+    # Top contributors (high completion rate with reasonable claim count)
+    top_contributors_result = await db.execute(_TOP_CONTRIBUTORS)
+    top_contributors = [_format_user_stats(user) for user in top_contributors_result.all()]
     
-    # Claim completion rates by user
-    user_stats_stmt = select(
-        Claim.github_username,
-        func.count(Claim.id).label("total_claims"),
-        func.sum(case((Claim.status == ClaimStatus.COMPLETED, 1), else_=0)).label("completed_claims"),
-        func.sum(case((Claim.status == ClaimStatus.RELEASED, 1), else_=0)).label("released_claims")
-    ).group_by(Claim.github_username)\
-     .having(func.count(Claim.id) > 0)\
-     .order_by(desc("total_claims"))\
-     .limit(50)
-     
-    user_stats_result = await db.execute(user_stats_stmt)
-    user_stats = user_stats_result.all()
+    # Frequent claimers (high claim count, any completion rate)
+    frequent_claimers_result = await db.execute(_FREQUENT_CLAIMERS)
+    frequent_claimers = [_format_user_stats(user) for user in frequent_claimers_result.all()]
     
-    # Top contributors (by completion rate)
-    top_contributors = []
-    frequent_claimers = []
-    
-    for user in user_stats:
-        completion_rate = user.completed_claims / user.total_claims * 100
-        
-        user_data = {
-            "username": user.github_username,
-            "total_claims": user.total_claims,
-            "completed_claims": user.completed_claims,
-            "released_claims": user.released_claims,
-            "completion_rate": round(completion_rate, 1)
-        }
-        
-        # Top contributors (high completion rate with reasonable claim count)
-        if completion_rate >= 80 and user.total_claims >= 3:
-            top_contributors.append(user_data)
-        
-        # Frequent claimers (high claim count, any completion rate)
-        if user.total_claims >= 10:
-            frequent_claimers.append(user_data)
-    
-    # Sort lists
-    top_contributors.sort(key=lambda x: x["completion_rate"], reverse=True)
-    frequent_claimers.sort(key=lambda x: x["total_claims"], reverse=True)
+    # Distribution across every claimant, not just the leaderboard rows
+    distribution_result = await db.execute(_USER_DISTRIBUTION)
+    distribution = distribution_result.one()
     
     return {
-        "top_contributors": top_contributors[:20],
-        "frequent_claimers": frequent_claimers[:20],
+        "top_contributors": top_contributors,
+        "frequent_claimers": frequent_claimers,
         "user_distribution": {
-            "total_users": len(user_stats),
-            "high_performers": len([u for u in user_stats if (u.completed_claims / u.total_claims) >= 0.8]),
-            "frequent_users": len([u for u in user_stats if u.total_claims >= 5]),
+            "total_users": distribution.total_users,
+            "high_performers": distribution.high_performers,
+            "frequent_users": distribution.frequent_users,
         },
         "generated_at": datetime.utcnow().isoformat()
     }
 
+@router.get("/dashboard/users")
+async def get_user_metrics(request: Request, db: AsyncSession = Depends(get_async_session)):
+    """
+    User activity metrics
+    As specified in MD file: GET /api/dashboard/users
+    """
+    payload = await cached_json(
+        DASHBOARD_USERS_KEY, settings.DASHBOARD_CACHE_TTL, lambda: _compute_user_metrics(db)
+    )
+    return _conditional_json_response(request, payload)
+
+def _activity_to_dict(activity) -> Dict:
+    """Shape an activity feed row for the dashboard."""
+    return {
+        "id": activity.id,
+        "type": activity.activity_type,
+        "description": activity.description,
+        "timestamp": activity.timestamp.isoformat(),
+        "claim_id": activity.claim_id,
+        "username": activity.github_username,
+        "metadata": activity.activity_metadata
+    }
+
 @router.get("/dashboard/activity")
 async def get_recent_activity(db: AsyncSession = Depends(get_async_session)):
     """
     Recent system activity feed
     """
     
-    # Get recent activity logs with claim data
-    recent_activities_stmt = select(ActivityLog, Claim).join(
-        Claim, ActivityLog.claim_id == Claim.id
-    ).order_by(desc(ActivityLog.timestamp)).limit(100)
-    
-    recent_activities_result = await db.execute(recent_activities_stmt)
-    recent_activities_data = recent_activities_result.all()
+    # Rows are streamed from a server-side cursor and encoded one at a time,
+    # so the feed is never held in memory as a list plus its encoded copy.
+    # The session dependency stays open until the response has been sent.
+    async def generate_feed():
+        yield b'{"recent_activities":['
+        first = True
+        result = await db.stream(_RECENT_ACTIVITY)
+        async for activity in result:
+            if not first:
+                yield b","
+            yield orjson.dumps(_activity_to_dict(activity))
+            first = False
+        yield b'],"generated_at":' + orjson.dumps(datetime.utcnow().isoformat()) + b"}"
     
-    activity_feed = []
-    for activity, claim in recent_activities_data:
-        activity_feed.append({
-            "id": activity.id,
-            "type": activity.activity_type,
-            "description": activity.description,
-            "timestamp": activity.timestamp.isoformat(),
-            "claim_id": activity.claim_id,
-            "username": claim.github_username if claim else None,
-            "metadata": activity.activity_metadata
-        })
-    
-    return {
-        "recent_activities": activity_feed,
-        "generated_at": datetime.utcnow().isoformat()
-    }
\ No newline at end of file
+    return StreamingResponse(generate_feed(), media_type="application/json")
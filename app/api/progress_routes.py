@@ -3,20 +3,70 @@ Progress Tracking Endpoints
 As specified in MD file API Design section:
 - GET /api/progress/{claim_id}
 - POST /api/progress/{claim_id}/update
+- POST /api/progress/batch
+- POST /api/progress/update
+- GET /api/progress/{claim_id}/activity
 """
-from fastapi import APIRouter, Depends, HTTPException, status
+import uuid
+
+from celery import group
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from typing import Optional
-from pydantic import BaseModel
-from datetime import datetime
+from sqlalchemy import bindparam, func, insert, select
+from sqlalchemy.orm import joinedload
+from collections import defaultdict
+from typing import List, Optional
+from pydantic import BaseModel, Field
+from datetime import datetime, timedelta, timezone
 
+from app.core.cache import acquire_once
+from app.core.config import get_settings
 from app.db.database import get_async_session
 from app.db.models import Claim, ProgressTracking, Issue, Repository, ActivityLog, ActivityType
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 router = APIRouter()
+settings = get_settings()
+
+# Issue, repository and progress tracking are all to-one, so they come back
+# joined onto the claim row in one query instead of separate round trips
+_GET_CLAIM_WITH_PROGRESS = select(Claim).options(
+    joinedload(Claim.issue).joinedload(Issue.repository),
+    joinedload(Claim.progress_tracking)
+).where(Claim.id == bindparam("claim_id"))
+
+# Commit summary only: the JSON snapshots are left unloaded
+_GET_CLAIM_PROGRESS_SUMMARY = select(Claim).options(
+    joinedload(Claim.progress_tracking).defer(ProgressTracking.commits_cache).defer(ProgressTracking.prs_cache)
+).where(Claim.id == bindparam("claim_id"))
+
+# Walks ix_activity_log_claim_timestamp backwards and stops after ten rows;
+# no separate DESC index is needed for the newest-first order
+_RECENT_ACTIVITY_BY_CLAIM = select(ActivityLog).where(
+    ActivityLog.claim_id == bindparam("claim_id")
+).order_by(ActivityLog.timestamp.desc()).limit(10)
+
+_GET_CLAIMS_WITH_PROGRESS = select(Claim).options(
+    joinedload(Claim.issue).joinedload(Issue.repository),
+    joinedload(Claim.progress_tracking)
+).where(Claim.id.in_(bindparam("claim_ids", expanding=True)))
+
+_EXISTING_CLAIM_IDS = select(Claim.id).where(Claim.id.in_(bindparam("claim_ids", expanding=True)))
+
+# Rank each claim's activity newest first and keep the top ten per claim
+_ACTIVITY_RANK = func.row_number().over(
+    partition_by=ActivityLog.claim_id,
+    order_by=ActivityLog.timestamp.desc()
+).label("activity_rank")
+_RANKED_ACTIVITY = select(ActivityLog.id, _ACTIVITY_RANK).where(
+    ActivityLog.claim_id.in_(bindparam("claim_ids", expanding=True))
+).subquery()
+_RECENT_ACTIVITY_BY_CLAIMS = select(ActivityLog).join(
+    _RANKED_ACTIVITY, ActivityLog.id == _RANKED_ACTIVITY.c.id
+).where(
+    _RANKED_ACTIVITY.c.activity_rank <= 10
+).order_by(ActivityLog.claim_id, ActivityLog.timestamp.desc())
 
 # Pydantic models
 class ProgressResponse(BaseModel):
@@ -32,64 +82,107 @@ class ProgressResponse(BaseModel):
     class Config:
         from_attributes = True
 
+class ActivityItem(BaseModel):
+    id: int
+    type: ActivityType
+    description: Optional[str]
+    timestamp: str
+    metadata: Optional[dict]
+
 class ProgressDetail(BaseModel):
     claim_id: int
     progress_tracking: Optional[ProgressResponse]
     claim_info: dict
     issue_info: dict
-    recent_activity: list
+    recent_activity: List[ActivityItem]
 
-@router.get("/progress/{claim_id}", response_model=ProgressDetail)
-async def get_progress_details(
-    claim_id: int,
-    db: AsyncSession = Depends(get_async_session)
-):
-    """
-    Get progress details for a claim
-    As specified in MD file: GET /api/progress/{claim_id}
-    Includes PR status, commit activity
-    """
+class ProgressBatchRequest(BaseModel):
+    claim_ids: List[int] = Field(..., min_length=1, max_length=100)
+
+def _cache_timestamp(progress_tracking: Optional[ProgressTracking]) -> Optional[str]:
+    """ISO timestamp of the GitHub snapshot, if one has been taken."""
+    if progress_tracking and progress_tracking.cache_updated_at:
+        return progress_tracking.cache_updated_at.isoformat()
+    return None
+
+async def _schedule_cache_refresh(claim_id: int, progress_tracking: Optional[ProgressTracking]) -> None:
+    """Queue a GitHub snapshot refresh when the stored one is missing or stale."""
+    ttl = settings.GITHUB_RESPONSE_CACHE_TTL
+    if progress_tracking and progress_tracking.cache_updated_at:
+        cache_updated_at = progress_tracking.cache_updated_at
+        if cache_updated_at.tzinfo is None:
+            cache_updated_at = cache_updated_at.replace(tzinfo=timezone.utc)
+        if datetime.now(timezone.utc) - cache_updated_at < timedelta(seconds=ttl):
+            return
     
-    # Get the claim
-    stmt = select(Claim).where(Claim.id == claim_id)
-    result = await db.execute(stmt)
-    claim = result.scalar_one_or_none()
+    # Polling clients would otherwise queue one refresh per request
+    if not await acquire_once(f"progress:refresh:{claim_id}", ttl):
+        return
     
-    if not claim:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Claim {claim_id} not found"
-        )
+    try:
+        from app.tasks.progress_check import refresh_progress_cache_task
+        refresh_progress_cache_task.delay(claim_id)
+    except Exception as e:
+        logger.warning(f"Could not schedule progress cache refresh for claim {claim_id}: {e}")
+
+def _commit_summary(progress_tracking: Optional[ProgressTracking]) -> dict:
+    """Commit fields served from the stored GitHub snapshot."""
+    commits = (progress_tracking.commits_cache if progress_tracking else None) or []
+    last_commit_date = None
+    if commits:
+        last_commit_date = commits[0]['author']['date']
+    elif progress_tracking and progress_tracking.last_commit_date:
+        last_commit_date = progress_tracking.last_commit_date.isoformat()
     
-    # Get progress tracking data
-    progress_stmt = select(ProgressTracking).where(
-        ProgressTracking.claim_id == claim_id
-    )
-    progress_result = await db.execute(progress_stmt)
-    progress_tracking = progress_result.scalar_one_or_none()
+    return {
+        "commit_count": len(commits),
+        "last_commit_date": last_commit_date,
+        "commits": commits
+    }
+
+def _pull_request_summary(progress_tracking: Optional[ProgressTracking]) -> dict:
+    """Pull request fields served from the stored GitHub snapshot."""
+    pull_requests = (progress_tracking.prs_cache if progress_tracking else None) or []
     
-    # Get recent activity from activity log
-    activities_stmt = select(ActivityLog).where(
-        ActivityLog.claim_id == claim_id
-    ).order_by(ActivityLog.timestamp.desc()).limit(10)
+    # Fall back to the tracked PR when no snapshot has been taken yet
+    if not pull_requests and progress_tracking and progress_tracking.pr_number:
+        pull_requests = [{
+            "number": progress_tracking.pr_number,
+            "state": progress_tracking.pr_status.value if progress_tracking.pr_status else None,
+            "detected_from": progress_tracking.detected_from.value if progress_tracking.detected_from else None,
+            "updated_at": progress_tracking.updated_at.isoformat()
+        }]
     
-    activities_result = await db.execute(activities_stmt)
-    recent_activities = activities_result.scalars().all()
+    return {
+        "pr_number": pull_requests[0]['number'] if pull_requests else None,
+        "pr_status": pull_requests[0]['state'] if pull_requests else None,
+        "pull_requests": pull_requests
+    }
+
+def _build_progress_detail(claim: Claim, recent_activities: List[ActivityLog]) -> ProgressDetail:
+    """
+    Shape a claim, its eagerly loaded relations and recent activity.
     
+    Everything except the progress row is built here from typed columns, so
+    it is assembled with model_construct rather than validated field by
+    field; the response model still checks the result on the way out.
+    """
     activity_list = [
-        {
-            "id": activity.id,
-            "type": activity.activity_type,
-            "description": activity.description,
-            "timestamp": activity.timestamp.isoformat(),
-            "metadata": activity.activity_metadata
-        }
+        ActivityItem.model_construct(
+            id=activity.id,
+            type=activity.activity_type,
+            description=activity.description,
+            timestamp=activity.timestamp.isoformat(),
+            metadata=activity.activity_metadata
+        )
         for activity in recent_activities
     ]
     
-    return ProgressDetail(
-        claim_id=claim_id,
-        progress_tracking=progress_tracking,
+    progress_tracking = claim.progress_tracking
+    
+    return ProgressDetail.model_construct(
+        claim_id=claim.id,
+        progress_tracking=ProgressResponse.model_validate(progress_tracking) if progress_tracking else None,
         claim_info={
             "id": claim.id,
             "username": claim.github_username,
@@ -103,11 +196,128 @@ async def get_progress_details(
             "number": claim.issue.github_issue_number,
             "title": claim.issue.title,
             "status": claim.issue.status,
-            "repository": f"{claim.issue.repository.owner}/{claim.issue.repository.name}" if claim.issue.repository else None
+            "repository": f"{claim.issue.repository.owner_name}/{claim.issue.repository.name}" if claim.issue.repository else None
         } if claim.issue else {},
         recent_activity=activity_list
     )
 
+@router.post("/progress/batch", response_model=List[ProgressDetail])
+async def get_progress_batch(
+    batch: ProgressBatchRequest,
+    db: AsyncSession = Depends(get_async_session)
+):
+    """
+    Get progress details for several claims in one request
+    Unknown claim IDs are skipped; results follow the requested order
+    """
+    claim_ids = list(dict.fromkeys(batch.claim_ids))
+    
+    # All claims with their to-one relations in one query
+    claims_result = await db.execute(_GET_CLAIMS_WITH_PROGRESS, {"claim_ids": claim_ids})
+    claims = {claim.id: claim for claim in claims_result.scalars().all()}
+    
+    # The ten most recent activities per claim in one windowed query
+    activities_result = await db.execute(_RECENT_ACTIVITY_BY_CLAIMS, {"claim_ids": claim_ids})
+    activities_by_claim = defaultdict(list)
+    for activity in activities_result.scalars().all():
+        activities_by_claim[activity.claim_id].append(activity)
+    
+    return [
+        _build_progress_detail(claims[claim_id], activities_by_claim[claim_id])
+        for claim_id in claim_ids
+        if claim_id in claims
+    ]
+
+@router.post("/progress/update")
+async def force_update_progress_batch(
+    batch: ProgressBatchRequest,
+    db: AsyncSession = Depends(get_async_session)
+):
+    """
+    Force update progress tracking for several claims in one request
+    Unknown claim IDs are skipped and reported back
+    """
+    claim_ids = list(dict.fromkeys(batch.claim_ids))
+    
+    result = await db.execute(_EXISTING_CLAIM_IDS, {"claim_ids": claim_ids})
+    existing_ids = set(result.scalars().all())
+    scheduled_ids = [claim_id for claim_id in claim_ids if claim_id in existing_ids]
+    
+    # Task IDs are assigned up front so the activity rows can reference them
+    task_ids = {claim_id: str(uuid.uuid4()) for claim_id in scheduled_ids}
+    now = datetime.utcnow()
+    
+    try:
+        # One multi-row INSERT for every claim's activity log entry
+        if scheduled_ids:
+            await db.execute(insert(ActivityLog), [
+                {
+                    "claim_id": claim_id,
+                    "activity_type": ActivityType.PROGRESS_UPDATE,
+                    "description": "Manual progress update triggered via API",
+                    "timestamp": now,
+                    "activity_metadata": {"task_id": task_ids[claim_id], "trigger": "manual"}
+                }
+                for claim_id in scheduled_ids
+            ])
+        await db.commit()
+    except Exception as e:
+        await db.rollback()
+        logger.error(f"Failed to log batch progress update: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error triggering progress update: {str(e)}"
+        )
+    
+    # Enqueue as one group, so all messages go out over a single broker
+    # connection instead of one publish round trip per .delay()
+    if scheduled_ids:
+        from app.tasks.progress_check import update_progress_task
+        group(
+            update_progress_task.s(claim_id).set(task_id=task_ids[claim_id])
+            for claim_id in scheduled_ids
+        ).apply_async()
+    
+    logger.info(f"Manual progress update triggered for {len(scheduled_ids)} claims")
+    
+    return {
+        "message": f"Progress update triggered for {len(scheduled_ids)} claims",
+        "scheduled": [
+            {"claim_id": claim_id, "task_id": task_ids[claim_id]}
+            for claim_id in scheduled_ids
+        ],
+        "not_found": [claim_id for claim_id in claim_ids if claim_id not in existing_ids],
+        "status": "scheduled"
+    }
+
+@router.get("/progress/{claim_id}", response_model=ProgressDetail)
+async def get_progress_details(
+    claim_id: int,
+    db: AsyncSession = Depends(get_async_session)
+):
+    """
+    Get progress details for a claim
+    As specified in MD file: GET /api/progress/{claim_id}
+    Includes PR status, commit activity
+    """
+    
+    # Get the claim with its issue, repository and progress in one round trip
+    result = await db.execute(_GET_CLAIM_WITH_PROGRESS, {"claim_id": claim_id})
+    claim = result.scalar_one_or_none()
+    
+    if not claim:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Claim {claim_id} not found"
+        )
+    
+    # Get recent activity from activity log (bounded, so kept as its own
+    # indexed query rather than joined onto the claim row)
+    activities_result = await db.execute(_RECENT_ACTIVITY_BY_CLAIM, {"claim_id": claim_id})
+    recent_activities = activities_result.scalars().all()
+    
+    return _build_progress_detail(claim, recent_activities)
+
 @router.post("/progress/{claim_id}/update")
 async def force_update_progress(
     claim_id: int,
@@ -118,40 +328,40 @@ async def force_update_progress(
     As specified in MD file: POST /api/progress/{claim_id}/update
     """
     
-    # Verify claim exists
-    stmt = select(Claim).where(Claim.id == claim_id)
-    result = await db.execute(stmt)
-    claim = result.scalar_one_or_none()
+    # Verify claim exists; only the ID is needed, so skip ORM hydration
+    result = await db.execute(_EXISTING_CLAIM_IDS, {"claim_ids": [claim_id]})
     
-    if not claim:
+    if result.scalar_one_or_none() is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Claim {claim_id} not found"
         )
     
+    # The task ID is assigned up front so the activity row can reference it
+    # and the task is only sent once that row is committed
+    task_id = str(uuid.uuid4())
+    
     try:
-        # Trigger progress check task
-        from app.workers.progress_check import update_progress_task
-        task_result = update_progress_task.delay(claim_id)
-        
-        # Log the manual progress update
-        progress_update_log = ActivityLog(
+        # Log the manual progress update with a Core INSERT (no ORM flush)
+        await db.execute(insert(ActivityLog).values(
             claim_id=claim_id,
-            activity_type=ActivityType.MANUAL_UPDATE,
+            activity_type=ActivityType.PROGRESS_UPDATE,
             description="Manual progress update triggered via API",
             timestamp=datetime.utcnow(),
-            activity_metadata={"task_id": task_result.id}
-        )
-        
-        db.add(progress_update_log)
+            activity_metadata={"task_id": task_id, "trigger": "manual"}
+        ))
         await db.commit()
         
+        # Trigger progress check task
+        from app.tasks.progress_check import update_progress_task
+        update_progress_task.apply_async((claim_id,), task_id=task_id)
+        
         logger.info(f"Manual progress update triggered for claim {claim_id}")
         
         return {
             "message": f"Progress update triggered for claim {claim_id}",
             "claim_id": claim_id,
-            "task_id": task_result.id,
+            "task_id": task_id,
             "status": "scheduled"
         }
         
@@ -166,15 +376,18 @@ async def force_update_progress(
 @router.get("/progress/{claim_id}/commits")
 async def get_claim_commits(
     claim_id: int,
+    include_list: bool = Query(False, description="Include the commit list from the GitHub snapshot"),
     db: AsyncSession = Depends(get_async_session)
 ):
     """
     Get commit activity for a specific claim
+    Count and last commit date come from progress_tracking; the commit list
+    itself is only loaded when include_list is set
     """
     
-    # Verify claim exists
-    stmt = select(Claim).where(Claim.id == claim_id)
-    result = await db.execute(stmt)
+    # Verify claim exists, with its progress loaded
+    stmt = _GET_CLAIM_WITH_PROGRESS if include_list else _GET_CLAIM_PROGRESS_SUMMARY
+    result = await db.execute(stmt, {"claim_id": claim_id})
     claim = result.scalar_one_or_none()
     
     if not claim:
@@ -183,47 +396,24 @@ async def get_claim_commits(
             detail=f"Claim {claim_id} not found"
         )
     
-    # Get progress tracking
-    progress_stmt = select(ProgressTracking).where(
-        ProgressTracking.claim_id == claim_id
-    )
-    progress_result = await db.execute(progress_stmt)
-    progress_tracking = progress_result.scalar_one_or_none()
+    # Serve the last GitHub snapshot; a stale one is refreshed in the background
+    progress_tracking = claim.progress_tracking
+    await _schedule_cache_refresh(claim_id, progress_tracking)
     
-    if not progress_tracking:
+    if include_list:
         return {
             "claim_id": claim_id,
-            "commit_count": 0,
-            "last_commit_date": None,
-            "commits": []
+            **_commit_summary(progress_tracking),
+            "cache_updated_at": _cache_timestamp(progress_tracking)
         }
     
-    # Fetch real commit data from GitHub API
-    commits = []
-    try:
-        from app.services.github_service import get_github_service
-        from datetime import datetime, timezone
-        
-        github_service = get_github_service()
-        
-        if claim.issue and claim.issue.repository:
-            # Get commits by user since claim was made
-            since_date = claim.claim_timestamp.replace(tzinfo=timezone.utc)
-            commits_data = await github_service.get_user_commits(
-                owner=claim.issue.repository.owner,
-                name=claim.issue.repository.name,
-                username=claim.github_username,
-                since=since_date
-            )
-            commits = commits_data
-    except Exception as e:
-        logger.warning(f"Could not fetch commits for claim {claim_id}: {e}")
+    last_commit_date = progress_tracking.last_commit_date if progress_tracking else None
     
     return {
         "claim_id": claim_id,
-        "commit_count": len(commits),
-        "last_commit_date": commits[0]['author']['date'] if commits else (progress_tracking.last_commit_date.isoformat() if progress_tracking.last_commit_date else None),
-        "commits": commits
+        "commit_count": progress_tracking.commit_count if progress_tracking else 0,
+        "last_commit_date": last_commit_date.isoformat() if last_commit_date else None,
+        "cache_updated_at": _cache_timestamp(progress_tracking)
     }
 
 @router.get("/progress/{claim_id}/prs") 
@@ -235,9 +425,8 @@ async def get_claim_pull_requests(
     Get pull request activity for a specific claim
     """
     
-    # Verify claim exists
-    stmt = select(Claim).where(Claim.id == claim_id)
-    result = await db.execute(stmt)
+    # Verify claim exists, with its issue, repository and progress loaded
+    result = await db.execute(_GET_CLAIM_WITH_PROGRESS, {"claim_id": claim_id})
     claim = result.scalar_one_or_none()
     
     if not claim:
@@ -246,48 +435,45 @@ async def get_claim_pull_requests(
             detail=f"Claim {claim_id} not found"
         )
     
-    # Get progress tracking
-    progress_stmt = select(ProgressTracking).where(
-        ProgressTracking.claim_id == claim_id
-    )
-    progress_result = await db.execute(progress_stmt)
-    progress_tracking = progress_result.scalar_one_or_none()
+    # Serve the last GitHub snapshot; a stale one is refreshed in the background
+    progress_tracking = claim.progress_tracking
+    await _schedule_cache_refresh(claim_id, progress_tracking)
     
-    # Fetch real pull request data from GitHub API
-    pull_requests = []
-    try:
-        from app.services.github_service import get_github_service
-        
-        github_service = get_github_service()
-        
-        if claim.issue and claim.issue.repository:
-            # Get PRs that reference this issue
-            prs_data = await github_service.get_pull_requests_for_issue(
-                owner=claim.issue.repository.owner,
-                name=claim.issue.repository.name,
-                issue_number=claim.issue.github_issue_number
-            )
-            
-            # Filter PRs by the claim user
-            for pr in prs_data:
-                if pr['user']['login'] == claim.github_username:
-                    pull_requests.append(pr)
-                    
-    except Exception as e:
-        logger.warning(f"Could not fetch PRs for claim {claim_id}: {e}")
-        
-        # Fallback to progress tracking data if available
-        if progress_tracking and progress_tracking.pr_number:
-            pull_requests = [{
-                "number": progress_tracking.pr_number,
-                "status": progress_tracking.pr_status,
-                "detected_from": progress_tracking.detected_from,
-                "updated_at": progress_tracking.updated_at.isoformat()
-            }]
+    return {
+        "claim_id": claim_id,
+        **_pull_request_summary(progress_tracking),
+        "cache_updated_at": _cache_timestamp(progress_tracking)
+    }
+
+@router.get("/progress/{claim_id}/activity")
+async def get_claim_github_activity(
+    claim_id: int,
+    db: AsyncSession = Depends(get_async_session)
+):
+    """
+    Get commit and pull request activity for a specific claim
+    One claim lookup and one snapshot refresh instead of calling both
+    /commits and /prs
+    """
+    
+    # Verify claim exists, with its issue, repository and progress loaded
+    result = await db.execute(_GET_CLAIM_WITH_PROGRESS, {"claim_id": claim_id})
+    claim = result.scalar_one_or_none()
+    
+    if not claim:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Claim {claim_id} not found"
+        )
+    
+    # Commits and PRs share one snapshot, refreshed by a single background
+    # task that fetches both from GitHub concurrently
+    progress_tracking = claim.progress_tracking
+    await _schedule_cache_refresh(claim_id, progress_tracking)
     
     return {
         "claim_id": claim_id,
-        "pr_number": pull_requests[0]['number'] if pull_requests else (progress_tracking.pr_number if progress_tracking else None),
-        "pr_status": pull_requests[0]['state'] if pull_requests else (progress_tracking.pr_status if progress_tracking else None),
-        "pull_requests": pull_requests
+        **_commit_summary(progress_tracking),
+        **_pull_request_summary(progress_tracking),
+        "cache_updated_at": _cache_timestamp(progress_tracking)
     }
@@ -8,13 +8,16 @@ As specified in MD file API Design section:
 """
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from typing import List, Optional
 from pydantic import BaseModel
 from datetime import datetime
 
+from app.core.cache import invalidate, repository_config_key
 from app.db.database import get_async_session
 from app.db.models import Repository
+from app.services.github_service import GitHubAPIService, get_github_service
 
 router = APIRouter()
 
@@ -52,10 +55,15 @@ class RepositoryResponse(BaseModel):
     class Config:
         from_attributes = True
 
+class RepositoryListResponse(BaseModel):
+    items: List[RepositoryResponse]
+    next_cursor: Optional[int] = None
+
 @router.post("/repositories", response_model=RepositoryResponse)
 async def register_repository(
     repo_data: RepositoryCreate,
-    db: AsyncSession = Depends(get_async_session)
+    db: AsyncSession = Depends(get_async_session),
+    github_service: GitHubAPIService = Depends(get_github_service)
 ):
     """
     Register a new repository for monitoring
@@ -63,8 +71,9 @@ async def register_repository(
     """
     
     try:
-        # Check if repository already exists
-        stmt = select(Repository).where(
+        # Check if repository already exists (uq_repositories_owner_name
+        # index); done before the GitHub lookup so duplicates cost no API call
+        stmt = select(Repository.id).where(
             Repository.owner_name == repo_data.owner,
             Repository.name == repo_data.name
         )
@@ -78,9 +87,6 @@ async def register_repository(
             )
         
         # Fetch real GitHub repository data
-        from app.services.github_service import get_github_service
-        github_service = get_github_service()
-        
         try:
             repo_info = await github_service.get_repository(repo_data.owner, repo_data.name)
             github_repo_id = repo_info['id']
@@ -90,8 +96,9 @@ async def register_repository(
                 detail=f"Could not find repository {repo_data.owner}/{repo_data.name} on GitHub: {str(e)}"
             )
         
-        # Create repository record
-        new_repo = Repository(
+        # Insert and fetch in one round trip; a registration racing this one
+        # hits the unique constraint and comes back empty instead of raising
+        stmt = pg_insert(Repository).values(
             github_repo_id=github_repo_id,
             owner_name=repo_data.owner,
             name=repo_data.name,
@@ -102,11 +109,18 @@ async def register_repository(
             claim_detection_threshold=repo_data.claim_detection_threshold,
             notification_settings=repo_data.notification_settings,
             is_monitored=True
-        )
+        ).on_conflict_do_nothing().returning(Repository)
+        result = await db.execute(stmt)
+        new_repo = result.scalar_one_or_none()
+        
+        if new_repo is None:
+            await db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"Repository {repo_data.owner}/{repo_data.name} already registered"
+            )
         
-        db.add(new_repo)
         await db.commit()
-        await db.refresh(new_repo)
         
         return new_repo
         
@@ -119,10 +133,10 @@ async def register_repository(
             detail=f"Error registering repository: {str(e)}"
         )
 
-@router.get("/repositories", response_model=List[RepositoryResponse])
+@router.get("/repositories", response_model=RepositoryListResponse)
 async def list_repositories(
     status_filter: Optional[str] = Query(None, description="Filter by monitoring status"),
-    skip: int = Query(0, ge=0, description="Number of records to skip"),
+    after_id: Optional[int] = Query(None, description="Cursor from the previous page's next_cursor"),
     limit: int = Query(100, ge=1, le=1000, description="Number of records to return"),
     db: AsyncSession = Depends(get_async_session)
 ):
@@ -139,12 +153,18 @@ async def list_repositories(
     elif status_filter == "inactive":
         stmt = stmt.where(Repository.is_monitored == False)
     
-    # Apply pagination
-    stmt = stmt.offset(skip).limit(limit)
+    # Keyset pagination: seek past the cursor on the primary key instead
+    # of scanning and discarding OFFSET rows
+    if after_id is not None:
+        stmt = stmt.where(Repository.id > after_id)
+    stmt = stmt.order_by(Repository.id).limit(limit)
     result = await db.execute(stmt)
     repositories = result.scalars().all()
     
-    return repositories
+    return {
+        "items": repositories,
+        "next_cursor": repositories[-1].id if len(repositories) == limit else None
+    }
 
 @router.put("/repositories/{repo_id}", response_model=RepositoryResponse)
 async def update_repository(
@@ -157,33 +177,39 @@ async def update_repository(
     As specified in MD file: PUT /api/repositories/{id}
     """
     
-    # Get repository
-    stmt = select(Repository).where(Repository.id == repo_id)
-    result = await db.execute(stmt)
-    repository = result.scalar_one_or_none()
-    if not repository:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Repository {repo_id} not found"
-        )
+    update_data = repo_update.dict(exclude_unset=True)
+    
+    # Update and fetch in one round trip; no row back means no such repository
+    if update_data:
+        stmt = update(Repository).where(
+            Repository.id == repo_id
+        ).values(**update_data).returning(Repository)
+    else:
+        stmt = select(Repository).where(Repository.id == repo_id)
     
     try:
-        # Update fields
-        update_data = repo_update.dict(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(repository, field, value)
-        
-        await db.commit()
-        await db.refresh(repository)
-        
-        return repository
-        
+        result = await db.execute(stmt)
+        repository = result.scalar_one_or_none()
     except Exception as e:
         await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error updating repository: {str(e)}"
         )
+    
+    if not repository:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Repository {repo_id} not found"
+        )
+    
+    await db.commit()
+    
+    # Webhooks read monitoring settings from the cache
+    if update_data:
+        await invalidate(repository_config_key(repository.github_repo_id))
+    
+    return repository
 
 @router.delete("/repositories/{repo_id}")
 async def stop_monitoring_repository(
@@ -195,29 +221,34 @@ async def stop_monitoring_repository(
     As specified in MD file: DELETE /api/repositories/{id}
     """
     
-    # Get repository
-    stmt = select(Repository).where(Repository.id == repo_id)
-    result = await db.execute(stmt)
-    repository = result.scalar_one_or_none()
-    if not repository:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Repository {repo_id} not found"
-        )
+    # Instead of deleting, mark as not monitored; RETURNING supplies the
+    # name for the response, so there is no separate existence check
+    stmt = update(Repository).where(
+        Repository.id == repo_id
+    ).values(is_monitored=False).returning(
+        Repository.owner_name, Repository.name, Repository.github_repo_id
+    )
     
     try:
-        # Instead of deleting, mark as not monitored
-        repository.is_monitored = False
-        await db.commit()
-        
-        return {
-            "message": f"Stopped monitoring repository {repository.owner_name}/{repository.name}",
-            "repository_id": repo_id
-        }
-        
+        result = await db.execute(stmt)
+        repository = result.one_or_none()
     except Exception as e:
         await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error stopping monitoring: {str(e)}"
         )
+    
+    if not repository:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Repository {repo_id} not found"
+        )
+    
+    await db.commit()
+    await invalidate(repository_config_key(repository.github_repo_id))
+    
+    return {
+        "message": f"Stopped monitoring repository {repository.owner_name}/{repository.name}",
+        "repository_id": repo_id
+    }
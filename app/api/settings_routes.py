@@ -2,17 +2,23 @@
 Settings API Routes
 Provides system configuration and monitoring endpoints
 """
+import time
+
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
-from pydantic import BaseModel, Field
+from sqlalchemy import select
+from redis.exceptions import RedisError
+from pydantic import BaseModel, Field, ValidationError
 from typing import Dict, Any, Optional
 from datetime import datetime
 
-from app.db.database import get_async_session
+from app.core.cache import get_cache_client
+from app.core.logging import get_logger
+from app.db.database import get_async_session, get_engine, estimated_row_count
 from app.db.models import Repository
 
 router = APIRouter()
+logger = get_logger(__name__)
 
 class NotificationSettings(BaseModel):
     email_enabled: bool = False
@@ -45,23 +51,60 @@ class SystemStats(BaseModel):
     database_size: str
     cache_hit_rate: float
 
-# Global settings store (in production, this would be in database)
+# Settings live in Redis so every worker process sees the same values;
+# each process keeps a copy for SETTINGS_LOCAL_TTL seconds to keep reads
+# off the network. The in-process value is the fallback when Redis is down
+# or holds a value that no longer validates. Bump the key version when
+# SystemSettingsModel changes incompatibly.
+SYSTEM_SETTINGS_KEY = "system:settings:v1"
+SETTINGS_LOCAL_TTL = 1.0
+
 _system_settings = SystemSettingsModel()
+_system_settings_loaded_at = 0.0
+
+
+async def _load_system_settings() -> SystemSettingsModel:
+    """Return the shared settings, re-reading Redis at most once per local TTL."""
+    global _system_settings, _system_settings_loaded_at
+    
+    now = time.monotonic()
+    if now - _system_settings_loaded_at < SETTINGS_LOCAL_TTL:
+        return _system_settings
+    
+    try:
+        raw = await get_cache_client().get(SYSTEM_SETTINGS_KEY)
+        if raw is not None:
+            _system_settings = SystemSettingsModel.model_validate_json(raw)
+    except RedisError as e:
+        logger.warning(f"Settings store unavailable, serving local copy: {e}")
+    except ValidationError as e:
+        logger.error(f"Stored system settings are invalid, serving local copy: {e}")
+    
+    _system_settings_loaded_at = now
+    return _system_settings
 
 @router.get("/settings", response_model=SystemSettingsModel)
 async def get_settings():
     """
     Get current system settings
     """
-    return _system_settings
+    return await _load_system_settings()
 
 @router.put("/settings", response_model=SystemSettingsModel)
 async def update_settings(settings: SystemSettingsModel):
     """
     Update system settings
     """
-    global _system_settings
+    global _system_settings, _system_settings_loaded_at
+    
+    try:
+        await get_cache_client().set(SYSTEM_SETTINGS_KEY, settings.model_dump_json())
+    except RedisError as e:
+        logger.error(f"Failed to persist system settings: {e}")
+        raise HTTPException(status_code=503, detail="Settings store unavailable")
+    
     _system_settings = settings
+    _system_settings_loaded_at = time.monotonic()
     return _system_settings
 
 @router.get("/system/stats", response_model=SystemStats)
@@ -70,10 +113,9 @@ async def get_system_stats(db: AsyncSession = Depends(get_async_session)):
     Get system performance statistics
     """
     
-    # Get database statistics
-    repo_count_stmt = select(func.count(Repository.id))
-    repo_count_result = await db.execute(repo_count_stmt)
-    repo_count = repo_count_result.scalar()
+    # Get database statistics; these stats are approximate anyway, so use
+    # the planner's row estimate instead of a full count(*) scan
+    repo_count = await estimated_row_count(db, Repository.__tablename__)
     
     # Calculate uptime (mock for now)
     uptime_hours = 168.5  # 1 week example
@@ -102,18 +144,39 @@ async def restart_system():
         "timestamp": datetime.utcnow().isoformat()
     }
 
+# Last database probe result as (healthy, monotonic time); probes are reused
+# for HEALTH_PROBE_TTL seconds so frequent polling doesn't tie up the pool
+HEALTH_PROBE_TTL = 1.0
+_db_health = (True, float("-inf"))
+_HEALTH_PROBE = select(1)
+
+
+async def _probe_database() -> bool:
+    """Check the database on a short-lived pooled connection, caching the result."""
+    global _db_health
+    
+    healthy, checked_at = _db_health
+    now = time.monotonic()
+    if now - checked_at < HEALTH_PROBE_TTL:
+        return healthy
+    
+    try:
+        async with get_engine().connect() as conn:
+            await conn.execute(_HEALTH_PROBE)
+        healthy = True
+    except Exception as e:
+        logger.warning(f"Database health probe failed: {e}")
+        healthy = False
+    
+    _db_health = (healthy, now)
+    return healthy
+
 @router.get("/system/health")
-async def get_system_health(db: AsyncSession = Depends(get_async_session)):
+async def get_system_health():
     """
     Get system health status
     """
-    try:
-        # Test database connection
-        test_stmt = select(1)
-        await db.execute(test_stmt)
-        db_healthy = True
-    except Exception:
-        db_healthy = False
+    db_healthy = await _probe_database()
     
     health_status = {
         "status": "healthy" if db_healthy else "unhealthy",
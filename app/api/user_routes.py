@@ -3,20 +3,26 @@ User Management Endpoints
 """
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, update, bindparam
 from typing import Optional
 from pydantic import BaseModel, EmailStr
 from datetime import datetime
 
 from app.db.database import get_async_session
 from app.db.models import User
+from app.core.cache import cached_json, invalidate, user_preferences_key
+from app.core.config import get_settings
 from app.core.security import get_current_user
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
+settings = get_settings()
 
 router = APIRouter()
 
+# preferences is a deferred column, so it is read on its own
+_GET_USER_PREFERENCES = select(User.preferences).where(User.id == bindparam("user_id"))
+
 # Pydantic models
 class UserProfile(BaseModel):
     id: int
@@ -50,21 +56,7 @@ async def get_current_user_profile(
     """
     Get current authenticated user's profile
     """
-    return UserProfile(
-        id=current_user.id,
-        email=current_user.email,
-        github_username=current_user.github_username,
-        full_name=current_user.full_name,
-        bio=current_user.bio,
-        website=current_user.website,
-        location=current_user.location,
-        roles=current_user.roles,
-        is_active=current_user.is_active,
-        is_verified=current_user.is_verified,
-        created_at=current_user.created_at,
-        updated_at=current_user.updated_at,
-        last_login_at=current_user.last_login_at
-    )
+    return UserProfile.model_validate(current_user)
 
 @router.put("/users/me", response_model=UserProfile)
 async def update_current_user_profile(
@@ -76,40 +68,19 @@ async def update_current_user_profile(
     Update current authenticated user's profile
     """
     try:
-        # Update user fields if provided
-        if user_update.github_username is not None:
-            current_user.github_username = user_update.github_username
-        if user_update.full_name is not None:
-            current_user.full_name = user_update.full_name
-        if user_update.bio is not None:
-            current_user.bio = user_update.bio
-        if user_update.website is not None:
-            current_user.website = user_update.website
-        if user_update.location is not None:
-            current_user.location = user_update.location
-            
-        current_user.updated_at = datetime.utcnow()
+        # Only fields that were provided are written
+        values = user_update.model_dump(exclude_none=True)
+        values["updated_at"] = datetime.utcnow()
         
+        # Write and read back in one statement instead of commit + refresh
+        stmt = update(User).where(User.id == current_user.id).values(**values).returning(User)
+        result = await db.execute(stmt)
+        updated_user = result.scalar_one()
         await db.commit()
-        await db.refresh(current_user)
         
-        logger.info(f"User profile updated: {current_user.email}")
+        logger.info(f"User profile updated: {updated_user.email}")
         
-        return UserProfile(
-            id=current_user.id,
-            email=current_user.email,
-            github_username=current_user.github_username,
-            full_name=current_user.full_name,
-            bio=current_user.bio,
-            website=current_user.website,
-            location=current_user.location,
-            roles=current_user.roles,
-            is_active=current_user.is_active,
-            is_verified=current_user.is_verified,
-            created_at=current_user.created_at,
-            updated_at=current_user.updated_at,
-            last_login_at=current_user.last_login_at
-        )
+        return UserProfile.model_validate(updated_user)
         
     except Exception as e:
         await db.rollback()
@@ -121,14 +92,25 @@ async def update_current_user_profile(
 
 @router.get("/users/me/preferences")
 async def get_user_preferences(
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_session)
 ):
     """
     Get user's notification and application preferences
     """
+    async def load_preferences():
+        result = await db.execute(_GET_USER_PREFERENCES, {"user_id": current_user.id})
+        return result.scalar() or {}
+    
+    preferences = await cached_json(
+        user_preferences_key(current_user.id),
+        settings.USER_PREFERENCES_CACHE_TTL,
+        load_preferences
+    )
+    
     return {
         "user_id": current_user.id,
-        "preferences": current_user.preferences or {},
+        "preferences": preferences,
         "notification_settings": {
             "email_notifications": True,
             "webhook_notifications": True,
@@ -151,6 +133,7 @@ async def update_user_preferences(
         current_user.updated_at = datetime.utcnow()
         
         await db.commit()
+        await invalidate(user_preferences_key(current_user.id))
         
         logger.info(f"User preferences updated: {current_user.email}")
         
@@ -5,50 +5,102 @@ Processes GitHub webhooks for issue comments and other events.
 
 import hashlib
 import hmac
-import json
-from typing import Dict, Any
+import re
+from collections import defaultdict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
 
-from fastapi import APIRouter, Request, HTTPException, status, Depends, BackgroundTasks
+import orjson
+from celery import group
+
+from fastapi import APIRouter, Request, HTTPException, status, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import cached_json, repository_config_key
+from app.core.celery_app import celery_app
 from app.core.config import get_settings
 from app.core.logging import get_logger
 from app.core.monitoring import track_api_call
 from app.db.database import get_async_session
-from app.workers.comment_analysis import analyze_comment_for_claim
 from app.tasks.progress_check import check_progress_task, update_progress_task
 from app.db.models.repositories import Repository
 from app.db.models.issues import Issue, IssueStatus
 from app.db.models.claims import Claim, ClaimStatus
-from sqlalchemy import select
+from sqlalchemy import bindparam, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 router = APIRouter(prefix="/webhooks", tags=["webhooks"])
 logger = get_logger(__name__)
 settings = get_settings()
 
+# Published by name, so the web process needs no handle on the analysis task
+ANALYZE_COMMENT_TASK = "app.tasks.comment_analysis.analyze_comment_task"
+
+# Closing keywords followed by an issue number, e.g. "fixes #123"
+_ISSUE_REF_RE = re.compile(r'(?:fix(?:es)?|close(?:s)?|resolve(?:s)?)\s+#(\d+)', re.IGNORECASE)
+
+# Active claims on a set of issues in one repository, for PR references
+_ACTIVE_CLAIMS_FOR_ISSUES = select(Claim.id, Issue.github_issue_number).join(
+    Issue, Claim.issue_id == Issue.id
+).where(
+    Issue.github_repo_id == bindparam("github_repo_id"),
+    Issue.github_issue_number.in_(bindparam("issue_numbers", expanding=True)),
+    Claim.status == ClaimStatus.ACTIVE
+)
+
+# Largest delivery accepted; bodies are rejected as soon as they pass it
+MAX_WEBHOOK_BODY_BYTES = settings.MAX_REQUEST_SIZE * 1024 * 1024
+
 
-def verify_github_signature(payload_body: bytes, signature_header: str) -> bool:
-    """Verify GitHub webhook signature."""
-    if not signature_header:
+def _signature_matches(digest: bytes, signature_header: str) -> bool:
+    """Constant-time compare of a raw HMAC-SHA256 digest with a sha256=<hex> header."""
+    if not signature_header or not signature_header.startswith("sha256="):
         return False
     
     try:
-        hash_object = hmac.new(
-            settings.GITHUB_WEBHOOK_SECRET.encode('utf-8'),
-            msg=payload_body,
-            digestmod=hashlib.sha256
-        )
-        expected_signature = f"sha256={hash_object.hexdigest()}"
-        return hmac.compare_digest(expected_signature, signature_header)
-    except Exception as e:
-        logger.error(f"Signature verification failed: {e}")
+        provided_signature = bytes.fromhex(signature_header[len("sha256="):])
+    except ValueError:
+        # Signature header is not valid hex
         return False
+    return hmac.compare_digest(digest, provided_signature)
+
+
+async def _read_webhook_body(request: Request) -> Tuple[bytearray, Optional[bytes]]:
+    """
+    Read the request body chunk by chunk, up to MAX_WEBHOOK_BODY_BYTES.
+    
+    When a webhook secret is configured the HMAC is updated as each chunk
+    arrives, so the body is hashed in the same pass that reads it. Returns
+    the body and its raw digest (None without a secret); raises 413 once the
+    body is over the limit.
+    """
+    content_length = request.headers.get("Content-Length")
+    if content_length and content_length.isdigit() and int(content_length) > MAX_WEBHOOK_BODY_BYTES:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail="Webhook payload too large"
+        )
+    
+    mac = None
+    if settings.GITHUB_WEBHOOK_SECRET:
+        mac = hmac.new(settings.GITHUB_WEBHOOK_SECRET.encode('utf-8'), digestmod=hashlib.sha256)
+    
+    body = bytearray()
+    async for chunk in request.stream():
+        body += chunk
+        if len(body) > MAX_WEBHOOK_BODY_BYTES:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail="Webhook payload too large"
+            )
+        if mac is not None:
+            mac.update(chunk)
+    
+    return body, mac.digest() if mac is not None else None
 
 
 @router.post("/github")
 async def handle_github_webhook(
     request: Request,
-    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_async_session)
 ):
     """Handle GitHub webhook events."""
@@ -58,44 +110,46 @@ async def handle_github_webhook(
         github_delivery = request.headers.get("X-GitHub-Delivery")
         signature_header = request.headers.get("X-Hub-Signature-256")
         
-        # Get payload
-        payload_body = await request.body()
+        # Get payload, hashing it as it is read
+        try:
+            payload_body, digest = await _read_webhook_body(request)
+        except HTTPException as e:
+            track_api_call("webhook", "github", e.status_code)
+            raise
         
         # Verify signature if webhook secret is configured
-        if settings.GITHUB_WEBHOOK_SECRET and not verify_github_signature(payload_body, signature_header):
+        if digest is not None and not _signature_matches(digest, signature_header):
             track_api_call("webhook", "github", 401)
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid signature"
             )
         
-        # Parse JSON payload
+        logger.info(f"Received GitHub webhook: {github_event} - {github_delivery}")
+        
+        # Signed deliveries we don't act on (ping, star, fork, ...) are
+        # acknowledged without parsing the body
+        if github_event == "ping":
+            # Webhook test event
+            track_api_call("webhook", "github_ping", 200)
+            return {"message": "pong"}
+        handler = _EVENT_HANDLERS.get(github_event)
+        if handler is None:
+            logger.info(f"Unhandled GitHub event: {github_event}")
+            track_api_call("webhook", "github", 200)
+            return {"message": "Webhook processed successfully"}
+        
+        # Parse JSON payload (orjson: delivery bodies run to hundreds of KB)
         try:
-            payload = json.loads(payload_body)
-        except json.JSONDecodeError:
+            payload = orjson.loads(payload_body)
+        except orjson.JSONDecodeError:
             track_api_call("webhook", "github", 400)
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Invalid JSON payload"
             )
         
-        logger.info(f"Received GitHub webhook: {github_event} - {github_delivery}")
-        
-        # Handle different event types
-        if github_event == "issue_comment":
-            await handle_issue_comment(payload, background_tasks, db)
-        elif github_event == "issues":
-            await handle_issues(payload, background_tasks, db)
-        elif github_event == "pull_request":
-            await handle_pull_request(payload, background_tasks, db)
-        elif github_event == "push":
-            await handle_push(payload, background_tasks, db)
-        elif github_event == "ping":
-            # Webhook test event
-            track_api_call("webhook", "github_ping", 200)
-            return {"message": "pong"}
-        else:
-            logger.info(f"Unhandled GitHub event: {github_event}")
+        await handler(payload, db)
         
         track_api_call("webhook", "github", 200)
         return {"message": "Webhook processed successfully"}
@@ -111,9 +165,57 @@ async def handle_github_webhook(
         )
 
 
+async def _get_or_create_repository_config(
+    repository: Dict[str, Any],
+    db: AsyncSession
+) -> Dict[str, Any]:
+    """Load a repository's monitoring config, auto-registering unknown repositories."""
+    stmt = select(Repository).where(
+        Repository.github_repo_id == repository.get("id")
+    )
+    result = await db.execute(stmt)
+    repo_record = result.scalar_one_or_none()
+    
+    if not repo_record:
+        # Auto-monitor new repository
+        logger.info(f"Auto-monitoring new repository: {repository.get('full_name')}")
+        
+        # Upsert so a concurrent delivery for the same repository gets
+        # the existing row back instead of a unique violation
+        stmt = pg_insert(Repository).values(
+            github_repo_id=repository.get("id"),
+            owner_name=repository.get("owner", {}).get("login", ""),
+            name=repository.get("name", ""),
+            full_name=repository.get("full_name", ""),
+            url=repository.get("html_url", ""),
+            is_monitored=True,  # Auto-enable monitoring
+            grace_period_days=7,
+            nudge_count=2,
+            claim_detection_threshold=75,
+            notification_settings={"enabled": True}
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Repository.github_repo_id],
+            set_={"full_name": stmt.excluded.full_name}
+        ).returning(Repository)
+        result = await db.execute(stmt)
+        repo_record = result.scalar_one()
+        await db.commit()
+        
+        logger.info(f"✅ Auto-added repository: {repo_record.full_name} (ID: {repo_record.id})")
+    
+    return {
+        "repository_id": repo_record.id,
+        "is_monitored": repo_record.is_monitored,
+        "grace_period_days": repo_record.grace_period_days,
+        "nudge_count": repo_record.nudge_count,
+        "claim_detection_threshold": repo_record.claim_detection_threshold,
+        "notification_settings": repo_record.notification_settings or {}
+    }
+
+
 async def handle_issue_comment(
     payload: Dict[str, Any],
-    background_tasks: BackgroundTasks,
     db: AsyncSession
 ):
     """Handle issue comment events with complete pipeline."""
@@ -128,52 +230,19 @@ async def handle_issue_comment(
     issue = payload.get("issue", {})
     repository = payload.get("repository", {})
     
-    # Check if repository is monitored or auto-create
+    # Check if repository is monitored or auto-create; the config is cached
+    # per repository so comment bursts don't re-read the same row
     try:
-        stmt = select(Repository).where(
-            Repository.github_repo_id == repository.get("id")
+        repository_config = await cached_json(
+            repository_config_key(repository.get("id")),
+            settings.REPOSITORY_CONFIG_CACHE_TTL,
+            lambda: _get_or_create_repository_config(repository, db)
         )
-        result = await db.execute(stmt)
-        repo_record = result.scalar_one_or_none()
-        
-        if not repo_record:
-            # Auto-monitor new repository
-            logger.info(f"Auto-monitoring new repository: {repository.get('full_name')}")
-            
-            from app.core.config import get_settings
-            settings = get_settings()
-            
-            repo_record = Repository(
-                github_repo_id=repository.get("id"),
-                owner_name=repository.get("owner", {}).get("login", ""),
-                name=repository.get("name", ""),
-                full_name=repository.get("full_name", ""),
-                url=repository.get("html_url", ""),
-                is_monitored=True,  # Auto-enable monitoring
-                grace_period_days=7,
-                nudge_count=2,
-                claim_detection_threshold=75,
-                notification_settings={"enabled": True}
-            )
-            db.add(repo_record)
-            await db.commit()
-            await db.refresh(repo_record)
-            
-            logger.info(f"✅ Auto-added repository: {repo_record.full_name} (ID: {repo_record.id})")
         
-        elif not repo_record.is_monitored:
+        if not repository_config["is_monitored"]:
             logger.info(f"Repository {repository.get('full_name')} not monitored, skipping")
             return
         
-        # Get repository configuration
-        repository_config = {
-            "repository_id": repo_record.id,
-            "grace_period_days": repo_record.grace_period_days,
-            "nudge_count": repo_record.nudge_count,
-            "claim_detection_threshold": repo_record.claim_detection_threshold,
-            "notification_settings": repo_record.notification_settings or {}
-        }
-        
     except Exception as e:
         logger.error(f"Error checking repository config: {e}")
         # Use defaults if repo not found
@@ -202,7 +271,7 @@ async def handle_issue_comment(
         "title": issue.get("title", ""),
         "body": issue.get("body", ""),
         "state": issue.get("state"),
-        "assignees": [assignee.get("login") for assignee in issue.get("assignees", [])]
+        "assignees": tuple(assignee["login"] for assignee in (issue.get("assignees") or ()) if "login" in assignee)
     }
     
     # Find or create issue record in database
@@ -216,8 +285,9 @@ async def handle_issue_comment(
             issue_record = result.scalar_one_or_none()
             
             if not issue_record:
-                # Create issue record
-                issue_record = Issue(
+                # Create issue record; upsert on (github_repo_id, number) so
+                # concurrent comments on a new issue don't race each other
+                stmt = pg_insert(Issue).values(
                     repository_id=repository_config["repository_id"],
                     github_repo_id=repository.get("id"),
                     github_issue_id=issue.get("id"),
@@ -227,10 +297,19 @@ async def handle_issue_comment(
                     status=IssueStatus.OPEN if issue.get("state") == "open" else IssueStatus.CLOSED,
                     github_data=issue
                 )
-                db.add(issue_record)
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=[Issue.github_repo_id, Issue.github_issue_number],
+                    set_={
+                        "title": stmt.excluded.title,
+                        "status": stmt.excluded.status,
+                        "github_data": stmt.excluded.github_data
+                    }
+                ).returning(Issue.id)
+                result = await db.execute(stmt)
+                issue_id = result.scalar_one()
                 await db.commit()
-                await db.refresh(issue_record)
-            issue_id = issue_record.id
+            else:
+                issue_id = issue_record.id
         else:
             logger.warning("No repository_id found, cannot create issue record")
             return
@@ -241,8 +320,6 @@ async def handle_issue_comment(
         return
     
     # Queue comment analysis task
-    from app.tasks.comment_analysis import analyze_comment_task
-    
     # Prepare task data in the format expected by analyze_comment_task
     task_data = {
         'comment_id': comment_data['id'],
@@ -257,14 +334,14 @@ async def handle_issue_comment(
         'issue_data': issue_data
     }
     
-    analyze_comment_task.delay(task_data)
+    # Published by name with the orjson codec; the payload is plain JSON data
+    celery_app.send_task(ANALYZE_COMMENT_TASK, args=(task_data,), serializer="orjson")
     
     logger.info(f"Queued complete comment analysis for issue #{issue.get('number')} in {repository.get('full_name')}")
 
 
 async def handle_issues(
     payload: Dict[str, Any],
-    background_tasks: BackgroundTasks,
     db: AsyncSession
 ):
     """Handle issue events."""
@@ -280,7 +357,7 @@ async def handle_issues(
             "issue_title": issue.get("title", ""),
             "issue_body": issue.get("body", ""),
             "issue_state": issue.get("state"),
-            "issue_assignees": [assignee.get("login") for assignee in issue.get("assignees", [])],
+            "issue_assignees": tuple(assignee["login"] for assignee in (issue.get("assignees") or ()) if "login" in assignee),
             "repository_id": repository.get("id"),
             "repository_full_name": repository.get("full_name"),
             "action": action
@@ -288,14 +365,13 @@ async def handle_issues(
         
         # If issue was assigned/unassigned, check for progress updates
         if action in ["assigned", "unassigned"]:
-            check_progress_task.delay(issue_data)
+            check_progress_task.apply_async((issue_data,), serializer="orjson")
         
         logger.info(f"Processed issue {action} for #{issue_data['issue_number']} in {issue_data['repository_full_name']}")
 
 
 async def handle_pull_request(
     payload: Dict[str, Any],
-    background_tasks: BackgroundTasks,
     db: AsyncSession
 ):
     """Handle pull request events."""
@@ -310,68 +386,41 @@ async def handle_pull_request(
         pr_title = pull_request.get("title", "")
         
         # Look for issue references (e.g., "fixes #123", "closes #456")
-        import re
-        issue_references = re.findall(
-            r'(?:fix(?:es)?|close(?:s)?|resolve(?:s)?)\s+#(\d+)',
-            f"{pr_title} {pr_body}",
-            re.IGNORECASE
-        )
+        issue_references = _ISSUE_REF_RE.findall(f"{pr_title} {pr_body}")
         
         if issue_references:
-            pr_data = {
-                "pr_id": pull_request.get("id"),
-                "pr_number": pull_request.get("number"),
-                "pr_title": pr_title,
-                "pr_state": pull_request.get("state"),
-                "pr_merged": pull_request.get("merged", False),
-                "pr_user": pull_request.get("user", {}).get("login"),
-                "pr_user_id": pull_request.get("user", {}).get("id"),
-                "repository_id": repository.get("id"),
-                "repository_full_name": repository.get("full_name"),
-                "referenced_issues": issue_references,
-                "action": action
-            }
-            
-            # Find claims for referenced issues and trigger progress checks
+            # Find active claims on every referenced issue in one query and
+            # trigger progress checks
             try:
-                from app.db.models import ClaimStatus
+                issue_numbers = sorted({int(number) for number in issue_references})
+                result = await db.execute(_ACTIVE_CLAIMS_FOR_ISSUES, {
+                    "github_repo_id": repository.get("id"),
+                    "issue_numbers": issue_numbers
+                })
+                
+                claims_by_issue = defaultdict(list)
+                for claim_id, issue_number in result.all():
+                    claims_by_issue[issue_number].append(claim_id)
+                
+                # Queue a progress check for every active claim as one group,
+                # published over a single broker connection
+                if claims_by_issue:
+                    group(
+                        update_progress_task.s(claim_id)
+                        for claim_ids in claims_by_issue.values()
+                        for claim_id in claim_ids
+                    ).apply_async()
                 
-                for issue_number in issue_references:
-                    # Find issue in database
-                    stmt = select(Issue).where(
-                        Issue.github_repo_id == repository.get("id"),
-                        Issue.github_issue_number == int(issue_number)
-                    )
-                    result = await db.execute(stmt)
-                    issue_record = result.scalar_one_or_none()
-                    
-                    if issue_record:
-                        # Find active claims for this issue
-                        stmt = select(Claim).where(
-                            Claim.issue_id == issue_record.id,
-                            Claim.status == ClaimStatus.ACTIVE
-                        )
-                        result = await db.execute(stmt)
-                        active_claims = result.scalars().all()
-                        
-                        # Queue progress check for each active claim
-                        for claim in active_claims:
-                            # Update PR data for progress tracking
-                            update_progress_task.delay(
-                                claim_id=claim.id,
-                                pr_data=pr_data
-                            )
-                            
-                        logger.info(f"Queued progress checks for {len(active_claims)} claims on issue #{issue_number}")
+                for issue_number, claim_ids in claims_by_issue.items():
+                    logger.info(f"Queued progress checks for {len(claim_ids)} claims on issue #{issue_number}")
             except Exception as e:
                 logger.error(f"Error processing PR references: {e}")
             
-            logger.info(f"PR #{pr_data['pr_number']} references issues: {issue_references}")
+            logger.info(f"PR #{pull_request.get('number')} references issues: {issue_references}")
 
 
 async def handle_push(
     payload: Dict[str, Any],
-    background_tasks: BackgroundTasks,
     db: AsyncSession
 ):
     """Handle push events."""
@@ -379,17 +428,10 @@ async def handle_push(
     commits = payload.get("commits", [])
     pusher = payload.get("pusher", {})
     
-    # Check commits for issue references
-    issue_references = []
+    # Check commits for issue references, deduplicating as they are found
+    issue_references = set()
     for commit in commits:
-        message = commit.get("message", "")
-        import re
-        refs = re.findall(
-            r'(?:fix(?:es)?|close(?:s)?|resolve(?:s)?)\s+#(\d+)',
-            message,
-            re.IGNORECASE
-        )
-        issue_references.extend(refs)
+        issue_references.update(_ISSUE_REF_RE.findall(commit.get("message", "")))
     
     if issue_references:
         push_data = {
@@ -397,23 +439,29 @@ async def handle_push(
             "repository_full_name": repository.get("full_name"),
             "pusher": pusher.get("name"),
             "commit_count": len(commits),
-            "referenced_issues": list(set(issue_references)),  # Remove duplicates
+            "referenced_issues": sorted(issue_references),  # JSON needs a list
             "ref": payload.get("ref")
         }
         
-        # Queue progress check for referenced issues
-        background_tasks.add_task(
-            check_progress_task.delay,
-            push_data
-        )
+        # Queue progress check for referenced issues; publishing returns as
+        # soon as the broker accepts the message, so enqueue inline
+        check_progress_task.apply_async((push_data,), serializer="orjson")
         
-        logger.info(f"Push to {push_data['repository_full_name']} references issues: {issue_references}")
+        logger.info(f"Push to {push_data['repository_full_name']} references issues: {push_data['referenced_issues']}")
+
+
+# Event type -> handler; payloads of any other event are never parsed
+_EVENT_HANDLERS: Dict[str, Callable[[Dict[str, Any], AsyncSession], Awaitable[None]]] = {
+    "issue_comment": handle_issue_comment,
+    "issues": handle_issues,
+    "pull_request": handle_pull_request,
+    "push": handle_push,
+}
 
 
 @router.post("/test")
 async def test_webhook(
-    request: Request,
-    background_tasks: BackgroundTasks
+    request: Request
 ):
     """Test webhook endpoint for development."""
     if settings.ENVIRONMENT != "development":
@@ -422,7 +470,13 @@ async def test_webhook(
             detail="Not found"
         )
     
-    payload = await request.json()
+    try:
+        payload = orjson.loads(await request.body())
+    except orjson.JSONDecodeError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid JSON payload"
+        )
     
     logger.info("Test webhook received")
     logger.debug(f"Test payload: {payload}")
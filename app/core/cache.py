@@ -0,0 +1,122 @@
+"""
+Short-lived Redis cache for expensive read endpoints.
+Values are stored as orjson bytes; Redis outages fall through to the source.
+"""
+
+from typing import Any, Awaitable, Callable, Optional
+
+import orjson
+import redis.asyncio as aioredis
+from redis.exceptions import LockError, RedisError
+
+from app.core.config import get_settings
+from app.core.logging import get_logger
+
+settings = get_settings()
+logger = get_logger(__name__)
+
+# Dashboard aggregate keys; bump the version suffix when a payload shape changes
+DASHBOARD_STATS_KEY = "dash:stats:v1"
+DASHBOARD_REPOS_KEY = "dash:repos:v1"
+DASHBOARD_USERS_KEY = "dash:users:v1"
+DASHBOARD_CACHE_KEYS = (DASHBOARD_STATS_KEY, DASHBOARD_REPOS_KEY, DASHBOARD_USERS_KEY)
+
+
+def user_preferences_key(user_id: int) -> str:
+    """Cache key for one user's stored preferences."""
+    return f"user:prefs:v1:{user_id}"
+
+
+def repository_config_key(github_repo_id: int) -> str:
+    """Cache key for a repository's monitoring config, by GitHub repo ID."""
+    return f"repo:cfg:v1:{github_repo_id}"
+
+_client: Optional[aioredis.Redis] = None
+
+# Marks "fn has not run yet" in cached_json, since None is a valid result
+_MISSING = object()
+
+
+def get_cache_client() -> aioredis.Redis:
+    """Get the shared async Redis client, creating it on first use."""
+    global _client
+    if _client is None:
+        _client = aioredis.from_url(
+            settings.REDIS_URL,
+            max_connections=settings.REDIS_MAX_CONNECTIONS,
+            socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+            socket_connect_timeout=settings.REDIS_SOCKET_CONNECT_TIMEOUT,
+            retry_on_timeout=True,
+        )
+    return _client
+
+
+async def close_cache() -> None:
+    """Close the shared Redis client."""
+    global _client
+    if _client is not None:
+        await _client.close()
+        _client = None
+
+
+async def cached_json(key: str, ttl: int, fn: Callable[[], Awaitable[Any]]) -> Any:
+    """
+    Return the cached value for key, computing it with fn on a miss.
+
+    Misses are single-flight: one caller holds a Redis lock and fills the
+    key while the others wait on it and then re-read, so an expired key
+    doesn't send every concurrent request to the database at once.
+    """
+    client = get_cache_client()
+    result = _MISSING
+
+    try:
+        cached = await client.get(key)
+        if cached is not None:
+            return orjson.loads(cached)
+
+        async with client.lock(f"{key}:lock", timeout=ttl, blocking_timeout=ttl):
+            # Another worker may have filled the key while we waited
+            cached = await client.get(key)
+            if cached is not None:
+                return orjson.loads(cached)
+
+            result = await fn()
+            await client.set(key, orjson.dumps(result), ex=ttl)
+        return result
+    except LockError as e:
+        # Releasing the lock failed after the value was computed
+        if result is not _MISSING:
+            logger.warning(f"Failed to release cache lock on {key}: {e}")
+            return result
+        logger.warning(f"Timed out waiting for cache lock on {key}, computing directly")
+    except RedisError as e:
+        # Storing the value failed; it is still good to return
+        if result is not _MISSING:
+            logger.warning(f"Failed to store {key} in cache: {e}")
+            return result
+        logger.warning(f"Cache unavailable for {key}, computing directly: {e}")
+
+    return await fn()
+
+
+async def invalidate(*keys: str) -> None:
+    """Drop cached keys after a write that changes their source data."""
+    if not keys:
+        return
+    try:
+        await get_cache_client().delete(*keys)
+    except RedisError as e:
+        logger.warning(f"Failed to invalidate cache keys {keys}: {e}")
+
+
+async def acquire_once(key: str, ttl: int) -> bool:
+    """
+    Claim key for ttl seconds; only the first caller in the window gets True.
+    Used to dedupe background refreshes. Fails open if Redis is unavailable.
+    """
+    try:
+        return bool(await get_cache_client().set(key, b"1", nx=True, ex=ttl))
+    except RedisError as e:
+        logger.warning(f"Cache unavailable for {key}, not deduplicating: {e}")
+        return True
@@ -2,11 +2,38 @@
 Celery application configuration for Cookie Licking Detector.
 """
 
+import asyncio
+
+import orjson
 from celery import Celery
+from celery.signals import worker_process_init
+from kombu.serialization import register
+
 from app.core.config import get_settings
+from app.core.logging import setup_logging
 
 settings = get_settings()
 
+# Tasks drive async code with asyncio.run(); run those loops on uvloop
+# (installed with uvicorn[standard]) when it is available
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+else:
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+# orjson encoder for hot-path publishes (send_task(..., serializer="orjson")).
+# It has its own content type: kombu's json codec round-trips datetimes via
+# tagged objects, which plain orjson decoding would not restore.
+register(
+    "orjson",
+    orjson.dumps,
+    orjson.loads,
+    content_type="application/x-orjson",
+    content_encoding="binary"
+)
+
 # Create Celery app
 celery_app = Celery(
     "cookie_licking_detector",
@@ -23,17 +50,37 @@ celery_app = Celery(
 # Configure Celery
 celery_app.conf.update(
     task_serializer=settings.CELERY_TASK_SERIALIZER,
-    accept_content=settings.CELERY_ACCEPT_CONTENT,  # Already a list from config
+    accept_content=[*settings.CELERY_ACCEPT_CONTENT, "orjson"],  # Already a list from config
     result_serializer=settings.CELERY_RESULT_SERIALIZER,
     timezone=settings.CELERY_TIMEZONE,
     enable_utc=True,
     task_track_started=True,
     task_time_limit=30 * 60,  # 30 minutes
     task_soft_time_limit=25 * 60,  # 25 minutes
+    # Safe default for the slow queues; comment workers raise it with
+    # --prefetch-multiplier so short tasks don't wait on a broker round-trip
     worker_prefetch_multiplier=1,
+    # Fast comment analysis and slow progress checks get separate queues so
+    # each worker pool can be sized and prefetched for its workload
+    task_routes={
+        "app.tasks.comment_analysis.*": {"queue": "comments"},
+        "app.tasks.simple_comment_analysis.*": {"queue": "comments"},
+        "app.tasks.progress_check.*": {"queue": "progress"},
+    },
     worker_max_tasks_per_child=1000,
+    # Keep idle broker connections alive and check them periodically, so
+    # publishing from the API doesn't pay for a reconnect
+    broker_transport_options={"socket_keepalive": True, "health_check_interval": 30},
 )
 
+
+
+@worker_process_init.connect
+def _configure_worker_logging(**kwargs):
+    """Install the app's log handlers in each worker child process."""
+    setup_logging()
+
+
 # Tasks are auto-discovered through the 'include' parameter above
 # No need to force import them here as it can cause circular imports
 # Celery will discover and register tasks automatically
@@ -4,9 +4,12 @@ Production-ready structured logging with multiple handlers and formatters.
 """
 
 import logging
+import logging.config
 import logging.handlers
+import re
 import sys
 from pathlib import Path
+from time import perf_counter
 from typing import Any, Dict, Optional
 
 import structlog
@@ -16,19 +19,26 @@ from app.core.config import get_settings
 
 settings = get_settings()
 
-# Ensure logs directory exists
 LOGS_DIR = Path("logs")
-LOGS_DIR.mkdir(exist_ok=True)
+
+# Set once setup_logging() has installed the handlers in this process
+_logging_configured = False
 
 
 class ContextualFilter(logging.Filter):
     """Add contextual information to log records."""
     
+    def __init__(self, name: str = ''):
+        super().__init__(name)
+        # Hostname and service info don't change, so resolve them once
+        self._context = {
+            'hostname': getattr(settings, 'HOSTNAME', 'unknown'),
+            'service': 'cookie-licking-detector',
+            'environment': settings.ENVIRONMENT
+        }
+    
     def filter(self, record: logging.LogRecord) -> bool:
-        # Add hostname and service info
-        record.hostname = getattr(settings, 'HOSTNAME', 'unknown')
-        record.service = 'cookie-licking-detector'
-        record.environment = settings.ENVIRONMENT
+        record.__dict__.update(self._context)
         return True
 
 
@@ -40,20 +50,28 @@ class SensitiveDataFilter(logging.Filter):
         'api_key', 'github_token', 'sendgrid_api_key', 'jwt'
     }
     
+    # One pass over the message for every key: the key, its separator, then
+    # the value to mask. Longest keys first so the whole key is captured.
+    _PATTERN = re.compile(
+        '(' + '|'.join(map(re.escape, sorted(SENSITIVE_KEYS, key=len, reverse=True))) + ')'
+        + r'([\'"]?\s*[:=]\s*[\'"]?)([^\'"\s,}]+)',
+        re.IGNORECASE
+    )
+    
+    def __init__(self, name: str = ''):
+        super().__init__(name)
+        self._last_record = None
+    
     def filter(self, record: logging.LogRecord) -> bool:
-        if hasattr(record, 'msg') and isinstance(record.msg, str):
-            # Basic sensitive data masking
-            for key in self.SENSITIVE_KEYS:
-                if key in record.msg.lower():
-                    record.msg = self._mask_sensitive_data(record.msg, key)
+        # Handlers share this filter, and each one passes the same record
+        # through it; masking is idempotent, so skip the repeat scans
+        if record is self._last_record:
+            return True
+        self._last_record = record
+        
+        if isinstance(record.msg, str) and record.msg:
+            record.msg = self._PATTERN.sub(r'\1\2****', record.msg)
         return True
-    
-    def _mask_sensitive_data(self, message: str, key: str) -> str:
-        """Mask sensitive data in log messages."""
-        import re
-        # Simple pattern to mask values after sensitive keys
-        pattern = rf'({key}[\'"]?\s*[:=]\s*[\'"]?)([^\'"\s,}}]+)'
-        return re.sub(pattern, r'\1****', message, flags=re.IGNORECASE)
 
 
 def configure_structlog() -> None:
@@ -113,72 +131,85 @@ def get_json_formatter() -> jsonlogger.JsonFormatter:
 
 
 def setup_logging() -> None:
-    """Set up comprehensive logging configuration."""
-    
-    # Root logger configuration
-    root_logger = logging.getLogger()
-    root_logger.setLevel(logging.getLevelName(settings.LOG_LEVEL.upper()))
+    """
+    Set up comprehensive logging configuration.
     
-    # Clear existing handlers
-    root_logger.handlers.clear()
+    Entrypoints call this explicitly (app startup, Celery worker processes);
+    repeat calls in the same process are no-ops.
+    """
+    global _logging_configured
+    if _logging_configured:
+        return
+    _logging_configured = True
     
-    # Console handler
-    console_handler = logging.StreamHandler(sys.stdout)
-    if settings.LOG_FORMAT.lower() == 'json':
-        console_handler.setFormatter(get_json_formatter())
-    else:
-        console_formatter = logging.Formatter(
-            fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
-        console_handler.setFormatter(console_formatter)
-    
-    # Add filters
-    console_handler.addFilter(ContextualFilter())
-    console_handler.addFilter(SensitiveDataFilter())
-    root_logger.addHandler(console_handler)
+    # Ensure logs directory exists
+    LOGS_DIR.mkdir(exist_ok=True)
     
-    # File handler for application logs
-    app_file_handler = logging.handlers.RotatingFileHandler(
-        LOGS_DIR / "app.log",
-        maxBytes=10 * 1024 * 1024,  # 10MB
-        backupCount=10
-    )
-    app_file_handler.setFormatter(get_json_formatter())
-    app_file_handler.addFilter(ContextualFilter())
-    app_file_handler.addFilter(SensitiveDataFilter())
-    root_logger.addHandler(app_file_handler)
-    
-    # Error file handler
-    error_file_handler = logging.handlers.RotatingFileHandler(
-        LOGS_DIR / "errors.log",
-        maxBytes=10 * 1024 * 1024,  # 10MB
-        backupCount=5
-    )
-    error_file_handler.setLevel(logging.ERROR)
-    error_file_handler.setFormatter(get_json_formatter())
-    error_file_handler.addFilter(ContextualFilter())
-    error_file_handler.addFilter(SensitiveDataFilter())
-    root_logger.addHandler(error_file_handler)
-    
-    # Celery logs
-    celery_file_handler = logging.handlers.RotatingFileHandler(
-        LOGS_DIR / "celery.log",
-        maxBytes=10 * 1024 * 1024,  # 10MB
-        backupCount=5
-    )
-    celery_file_handler.setFormatter(get_json_formatter())
-    celery_file_handler.addFilter(ContextualFilter())
-    
-    celery_logger = logging.getLogger('celery')
-    celery_logger.addHandler(celery_file_handler)
-    celery_logger.setLevel(logging.INFO)
-    
-    # Third-party loggers (reduce noise)
-    logging.getLogger('urllib3').setLevel(logging.WARNING)
-    logging.getLogger('requests').setLevel(logging.WARNING)
-    logging.getLogger('httpx').setLevel(logging.WARNING)
-    logging.getLogger('sqlalchemy.engine').setLevel(logging.WARNING)
+    # Formatters and filters are declared once and shared by every handler
+    # that names them; dictConfig validates the whole tree before applying it
+    file_handler = 'logging.handlers.RotatingFileHandler'
+    logging.config.dictConfig({
+        'version': 1,
+        # Module-level loggers are created at import, before this runs
+        'disable_existing_loggers': False,
+        'formatters': {
+            'json': {'()': get_json_formatter},
+            'console': {
+                'format': '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+                'datefmt': '%Y-%m-%d %H:%M:%S'
+            }
+        },
+        'filters': {
+            'context': {'()': ContextualFilter},
+            'sensitive': {'()': SensitiveDataFilter}
+        },
+        'handlers': {
+            'console': {
+                'class': 'logging.StreamHandler',
+                'stream': sys.stdout,
+                'formatter': 'json' if settings.LOG_FORMAT.lower() == 'json' else 'console',
+                'filters': ['context', 'sensitive']
+            },
+            # File handler for application logs
+            'app_file': {
+                'class': file_handler,
+                'filename': str(LOGS_DIR / "app.log"),
+                'maxBytes': 10 * 1024 * 1024,  # 10MB
+                'backupCount': 10,
+                'formatter': 'json',
+                'filters': ['context', 'sensitive']
+            },
+            'error_file': {
+                'class': file_handler,
+                'filename': str(LOGS_DIR / "errors.log"),
+                'maxBytes': 10 * 1024 * 1024,  # 10MB
+                'backupCount': 5,
+                'level': 'ERROR',
+                'formatter': 'json',
+                'filters': ['context', 'sensitive']
+            },
+            'celery_file': {
+                'class': file_handler,
+                'filename': str(LOGS_DIR / "celery.log"),
+                'maxBytes': 10 * 1024 * 1024,  # 10MB
+                'backupCount': 5,
+                'formatter': 'json',
+                'filters': ['context']
+            }
+        },
+        'root': {
+            'level': settings.LOG_LEVEL.upper(),
+            'handlers': ['console', 'app_file', 'error_file']
+        },
+        'loggers': {
+            'celery': {'level': 'INFO', 'handlers': ['celery_file']},
+            # Third-party loggers (reduce noise)
+            'urllib3': {'level': 'WARNING'},
+            'requests': {'level': 'WARNING'},
+            'httpx': {'level': 'WARNING'},
+            'sqlalchemy.engine': {'level': 'WARNING'}
+        }
+    })
     
     # Configure structlog
     if settings.STRUCTURED_LOGGING:
@@ -213,21 +244,21 @@ class LoggerMixin:
 class PerformanceTimer:
     """Context manager for performance timing."""
     
+    # Created around every timed operation; slots keep instances small
+    __slots__ = ('operation_name', 'logger', 'start_time')
+    
     def __init__(self, operation_name: str, logger: Optional[logging.Logger] = None):
         self.operation_name = operation_name
         self.logger = logger or get_logger(__name__)
         self.start_time = None
     
     def __enter__(self):
-        import time
-        self.start_time = time.perf_counter()
+        self.start_time = perf_counter()
         self.logger.debug(f"Starting operation: {self.operation_name}")
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        import time
-        end_time = time.perf_counter()
-        duration = end_time - self.start_time
+        duration = perf_counter() - self.start_time
         
         if exc_type is not None:
             self.logger.error(
@@ -273,9 +304,15 @@ def log_database_query(query: str, params: Dict[str, Any],
                       execution_time: float, row_count: Optional[int] = None) -> None:
     """Log database query performance."""
     logger = get_logger('database')
+    slow = execution_time > 1.0  # Log slow queries
+    
+    # Most queries are only logged at DEBUG; skip building the record when
+    # that level is off
+    if not logger.isEnabledFor(logging.WARNING if slow else logging.DEBUG):
+        return
     
     # Sanitize query for logging (remove sensitive data)
-    sanitized_query = query[:500] + "..." if len(query) > 500 else query
+    sanitized_query = query if len(query) <= 500 else f"{query[:500]}..."
     
     log_data = {
         'query_preview': sanitized_query,
@@ -284,7 +321,7 @@ def log_database_query(query: str, params: Dict[str, Any],
         'param_count': len(params) if params else 0
     }
     
-    if execution_time > 1.0:  # Log slow queries
+    if slow:
         logger.warning("Slow database query detected", extra=log_data)
     else:
         logger.debug("Database query executed", extra=log_data)
@@ -309,7 +346,3 @@ def log_task_execution(task_name: str, task_id: str, execution_time: float,
         logger.error("Task failed", extra=log_data)
     else:
         logger.info(f"Task status: {status}", extra=log_data)
-
-
-# Initialize logging on module import
-setup_logging()
\ No newline at end of file
@@ -5,8 +5,10 @@ Includes Prometheus metrics, health checks, and performance monitoring.
 
 import asyncio
 import functools
+import threading
 import time
-from typing import Any, Callable, Dict, List, Optional
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from contextlib import asynccontextmanager
 
 import psutil
@@ -518,18 +520,54 @@ def track_notification(notification_type: str, status: str):
     ).inc()
 
 
+# External API call counters, keyed by service name
+_API_CALL_METRICS = {
+    'github': GITHUB_API_CALLS,
+    'ecosystems': ECOSYSTEMS_API_CALLS,
+}
+
+# Per-process buffer of API call counts; request handlers only pay for a
+# dict increment and a background task flushes the totals to Prometheus
+_api_call_counts: Dict[Tuple[str, str, int], int] = defaultdict(int)
+_api_call_lock = threading.Lock()
+
+
 def track_api_call(service: str, endpoint: str, status_code: int):
     """Track external API call metrics."""
-    if service == 'github':
-        GITHUB_API_CALLS.labels(
-            endpoint=endpoint,
-            status_code=status_code
-        ).inc()
-    elif service == 'ecosystems':
-        ECOSYSTEMS_API_CALLS.labels(
+    if not settings.ENABLE_METRICS or service not in _API_CALL_METRICS:
+        return
+    
+    with _api_call_lock:
+        _api_call_counts[(service, endpoint, status_code)] += 1
+
+
+def flush_api_call_counts() -> int:
+    """Push buffered API call counts to Prometheus. Returns the number of label sets flushed."""
+    global _api_call_counts
+    
+    with _api_call_lock:
+        if not _api_call_counts:
+            return 0
+        pending, _api_call_counts = _api_call_counts, defaultdict(int)
+    
+    for (service, endpoint, status_code), count in pending.items():
+        _API_CALL_METRICS[service].labels(
             endpoint=endpoint,
             status_code=status_code
-        ).inc()
+        ).inc(count)
+    
+    return len(pending)
+
+
+async def run_api_call_flusher(interval: float = 1.0):
+    """Periodically flush buffered API call counts until cancelled."""
+    try:
+        while True:
+            await asyncio.sleep(interval)
+            flush_api_call_counts()
+    finally:
+        # Don't lose the last interval's counts on shutdown
+        flush_api_call_counts()
 
 
 def monitor_performance(operation_name: str):
@@ -3,20 +3,26 @@ Comprehensive authentication and security system for Cookie Licking Detector.
 Includes JWT authentication, API key management, rate limiting, and security utilities.
 """
 
+import asyncio
 import hashlib
+import os
 import secrets
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional, Union
 from uuid import uuid4
 
 import bcrypt
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+from cachetools import TTLCache
 from fastapi import HTTPException, Request, Security, status, Depends
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer, APIKeyHeader
 from jose import JWTError, jwt
 from passlib.context import CryptContext
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, ConfigDict, EmailStr
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import insert, select
 
 from app.core.config import get_settings
 from app.core.logging import get_logger
@@ -29,6 +35,14 @@ logger = get_logger(__name__)
 # Password hashing context
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# Argon2id hasher for new passwords; bcrypt hashes are still accepted and
+# upgraded on the next successful login
+password_hasher = PasswordHasher(time_cost=2, memory_cost=64 * 1024, parallelism=2)
+
+# Hashing is deliberately slow and releases the GIL, so it runs here instead
+# of blocking the event loop
+_PWD_POOL = ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix="password-hash")
+
 # Security schemes
 bearer_scheme = HTTPBearer(auto_error=False)
 api_key_header = APIKeyHeader(name="X-API-Key", auto_error=False)
@@ -50,8 +64,25 @@ class Token(BaseModel):
     expires_in: int
 
 
+class UserInfoResponse(BaseModel):
+    """Current user response model."""
+    model_config = ConfigDict(from_attributes=True)
+    
+    id: int
+    email: str
+    full_name: Optional[str] = None
+    roles: List[str]
+    is_active: bool
+    is_verified: bool
+    github_username: Optional[str] = None
+    created_at: datetime
+    last_login_at: Optional[datetime] = None
+
+
 class UserCreate(BaseModel):
     """User creation model."""
+    model_config = ConfigDict(extra="forbid", frozen=True)
+    
     email: EmailStr
     password: str
     full_name: Optional[str] = None
@@ -60,12 +91,39 @@ class UserCreate(BaseModel):
 
 class UserLogin(BaseModel):
     """User login model."""
+    model_config = ConfigDict(extra="forbid", frozen=True)
+    
     email: EmailStr
     password: str
 
 
+class RefreshRequest(BaseModel):
+    """Token refresh request model."""
+    model_config = ConfigDict(extra="forbid", frozen=True)
+    
+    refresh_token: str
+
+
+class ChangePasswordRequest(BaseModel):
+    """Password change request model."""
+    model_config = ConfigDict(extra="forbid", frozen=True)
+    
+    current_password: str
+    new_password: str
+    confirm_password: str
+
+
+class PasswordResetRequest(BaseModel):
+    """Password reset request model."""
+    model_config = ConfigDict(extra="forbid", frozen=True)
+    
+    email: EmailStr
+
+
 class APIKeyCreate(BaseModel):
     """API key creation model."""
+    model_config = ConfigDict(extra="forbid", frozen=True)
+    
     name: str
     description: Optional[str] = None
     expires_at: Optional[datetime] = None
@@ -88,23 +146,50 @@ class SecurityUtils:
     
     @staticmethod
     def hash_password(password: str) -> str:
-        """Hash a password using bcrypt."""
-        salt = bcrypt.gensalt()
-        hashed = bcrypt.hashpw(password.encode('utf-8'), salt)
-        return hashed.decode('utf-8')
+        """Hash a password using argon2id."""
+        return password_hasher.hash(password)
     
     @staticmethod
     def verify_password(password: str, hashed_password: str) -> bool:
-        """Verify a password against its hash."""
+        """Verify a password against its argon2id or legacy bcrypt hash."""
         try:
+            if hashed_password.startswith('$argon2'):
+                return password_hasher.verify(hashed_password, password)
+            
             return bcrypt.checkpw(
                 password.encode('utf-8'), 
                 hashed_password.encode('utf-8')
             )
-        except Exception as e:
+        except VerificationError:
+            return False
+        except (InvalidHashError, ValueError) as e:
             logger.error(f"Password verification failed: {e}")
             return False
     
+    @staticmethod
+    async def hash_password_async(password: str) -> str:
+        """Hash a password on the password thread pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_PWD_POOL, SecurityUtils.hash_password, password)
+    
+    @staticmethod
+    async def verify_password_async(password: str, hashed_password: str) -> bool:
+        """Verify a password on the password thread pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _PWD_POOL, SecurityUtils.verify_password, password, hashed_password
+        )
+    
+    @staticmethod
+    def password_needs_rehash(hashed_password: str) -> bool:
+        """Check whether a stored hash is legacy bcrypt or uses outdated argon2 parameters."""
+        if not hashed_password.startswith('$argon2'):
+            return True
+        try:
+            return password_hasher.check_needs_rehash(hashed_password)
+        except InvalidHashError:
+            return True
+    
     @staticmethod
     def generate_api_key() -> str:
         """Generate a secure API key."""
@@ -175,6 +260,9 @@ class JWTManager:
         self.algorithm = settings.JWT_ALGORITHM
         self.access_token_expire_minutes = settings.ACCESS_TOKEN_EXPIRE_MINUTES
         self.refresh_token_expire_days = settings.REFRESH_TOKEN_EXPIRE_DAYS
+        # Recently verified tokens, keyed by a BLAKE2b digest of the token,
+        # so repeat requests with the same bearer token skip signature checks
+        self._verified_tokens: TTLCache = TTLCache(maxsize=10_000, ttl=30)
     
     def create_access_token(self, data: Dict[str, Any]) -> str:
         """Create an access token."""
@@ -208,6 +296,14 @@ class JWTManager:
     
     def verify_token(self, token: str) -> TokenData:
         """Verify and decode a JWT token."""
+        cache_key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+        cached = self._verified_tokens.get(cache_key)
+        if cached is not None:
+            token_data, expires_at = cached
+            if expires_at is None or expires_at > datetime.now(timezone.utc).timestamp():
+                return token_data
+            self._verified_tokens.pop(cache_key, None)
+        
         try:
             payload = jwt.decode(
                 token, self.secret_key, algorithms=[self.algorithm]
@@ -232,12 +328,14 @@ class JWTManager:
                     detail="Invalid token: invalid user ID"
                 )
             
-            return TokenData(
+            token_data = TokenData(
                 user_id=user_id,
                 email=email,
                 roles=roles,
                 token_type=token_type
             )
+            self._verified_tokens[cache_key] = (token_data, payload.get("exp"))
+            return token_data
         except JWTError as e:
             logger.warning(f"JWT verification failed: {e}")
             raise HTTPException(
@@ -298,20 +396,21 @@ class AuthenticationService:
             )
         
         # Create new user
-        hashed_password = SecurityUtils.hash_password(user_data.password)
+        hashed_password = await SecurityUtils.hash_password_async(user_data.password)
         
-        new_user = User(
+        # RETURNING hands back server defaults with the INSERT, so there is
+        # no follow-up SELECT to reload the new row
+        stmt = insert(User).values(
             email=user_data.email,
             password_hash=hashed_password,
             full_name=user_data.full_name,
             roles=[role.value for role in user_data.roles],  # Convert enums to strings
             is_active=True,
             created_at=datetime.now(timezone.utc)
-        )
-        
-        self.db.add(new_user)
+        ).returning(User)
+        result = await self.db.execute(stmt)
+        new_user = result.scalar_one()
         await self.db.commit()
-        await self.db.refresh(new_user)
         
         logger.info(f"New user created: {new_user.email}")
         return new_user
@@ -325,10 +424,14 @@ class AuthenticationService:
         if not user or not user.is_active:
             return None
         
-        if not SecurityUtils.verify_password(password, user.password_hash):
+        if not await SecurityUtils.verify_password_async(password, user.password_hash):
             logger.warning(f"Failed login attempt for user: {email}")
             return None
         
+        # Upgrade legacy bcrypt hashes while the plaintext is at hand
+        if SecurityUtils.password_needs_rehash(user.password_hash):
+            user.password_hash = await SecurityUtils.hash_password_async(password)
+        
         # Update last login
         user.last_login_at = datetime.now(timezone.utc)
         await self.db.commit()
@@ -349,7 +452,7 @@ class AuthenticationService:
         api_key_hash = SecurityUtils.hash_api_key(api_key)
         
         # Create API key record
-        new_api_key = APIKey(
+        stmt = insert(APIKey).values(
             user_id=user_id,
             name=key_data.name,
             description=key_data.description,
@@ -358,11 +461,10 @@ class AuthenticationService:
             expires_at=key_data.expires_at,
             is_active=True,
             created_at=datetime.now(timezone.utc)
-        )
-        
-        self.db.add(new_api_key)
+        ).returning(APIKey)
+        result = await self.db.execute(stmt)
+        new_api_key = result.scalar_one()
         await self.db.commit()
-        await self.db.refresh(new_api_key)
         
         logger.info(f"API key created for user {user_id}: {key_data.name}")
         
@@ -518,7 +620,7 @@ def validate_url(url: str) -> bool:
 
 # Function exports for easier access
 def get_password_hash(password: str) -> str:
-    """Hash a password using bcrypt."""
+    """Hash a password using argon2id."""
     return SecurityUtils.hash_password(password)
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -5,6 +5,9 @@ Production-ready async database setup with connection pooling.
 
 import os
 from typing import AsyncGenerator
+from sqlalchemy import JSON, Text, func, select, table, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.pool import QueuePool
@@ -14,9 +17,61 @@ from app.core.config import get_settings
 # Base class for all models (can be imported without engine)
 Base = declarative_base()
 
+# JSON column type: binary JSONB (no re-parse on read, GIN-indexable) on
+# PostgreSQL, plain JSON on other dialects such as the SQLite test database
+JSONDocument = JSON().with_variant(JSONB(astext_type=Text()), "postgresql")
+
 # Global variables for lazy initialization
 _engine = None
 _async_session_factory = None
+_readonly_engine = None
+_readonly_session_factory = None
+
+# Connections warm_pool opens per process; every gunicorn worker runs it, so
+# warming the whole pool would multiply startup connections by the worker count
+WARM_POOL_CONNECTIONS = 2
+
+
+def _to_async_url(db_url: str) -> str:
+    """
+    Convert any PostgreSQL URL to its asyncpg form.
+    
+    DATABASE_URL may name the sync psycopg2 driver for tools like
+    Alembic; the app engine always runs on asyncpg.
+    """
+    url = make_url(db_url)
+    if url.get_backend_name() == "postgresql" and url.get_driver_name() != "asyncpg":
+        url = url.set(drivername="postgresql+asyncpg")
+        return url.render_as_string(hide_password=False)
+    return db_url
+
+
+def _create_engine(db_url: str, **kwargs):
+    """Create an async engine with the application's pool settings."""
+    settings = get_settings()
+    
+    # For async engines, don't use QueuePool - it's not compatible
+    return create_async_engine(
+        db_url,
+        echo=settings.DB_ECHO,
+        pool_size=settings.DATABASE_POOL_SIZE,
+        max_overflow=settings.DATABASE_MAX_OVERFLOW,
+        pool_timeout=settings.DATABASE_POOL_TIMEOUT,
+        pool_pre_ping=True,
+        pool_recycle=settings.DATABASE_POOL_RECYCLE,
+        connect_args={
+            # Prepared statements are cached per connection, so warm pooled
+            # connections skip the parse/plan step for repeated queries
+            "prepared_statement_cache_size": settings.DATABASE_STATEMENT_CACHE_SIZE,
+            "server_settings": {
+                "application_name": "cookie-licking-detector",
+                # JIT compilation costs more than it saves on short OLTP queries
+                "jit": "off",
+            }
+        } if "postgresql" in db_url else {},
+        **kwargs
+    )
+
 
 def get_engine():
     """Get or create database engine with lazy initialization"""
@@ -24,31 +79,41 @@ def get_engine():
     if _engine is None:
         settings = get_settings()
         
-        # Convert database URL for async if needed
-        db_url = settings.DATABASE_URL
-        if db_url.startswith("postgresql://"):
-            db_url = db_url.replace("postgresql://", "postgresql+asyncpg://")
-        
         try:
-            # For async engines, don't use QueuePool - it's not compatible
-            _engine = create_async_engine(
-                db_url,
-                echo=settings.DB_ECHO,
-                pool_size=settings.DATABASE_POOL_SIZE,
-                max_overflow=settings.DATABASE_MAX_OVERFLOW,
-                pool_pre_ping=True,
-                pool_recycle=settings.DATABASE_POOL_RECYCLE,
-                connect_args={
-                    "server_settings": {
-                        "application_name": "cookie-licking-detector",
-                    }
-                } if "postgresql" in db_url else {}
-            )
+            _engine = _create_engine(_to_async_url(settings.DATABASE_URL))
         except Exception as e:
             print(f"Warning: Could not create database engine: {e}")
             _engine = None
     return _engine
 
+
+def get_readonly_engine():
+    """
+    Get or create the engine used for read-only requests.
+    
+    Connections run in AUTOCOMMIT so plain SELECTs skip BEGIN/COMMIT. Uses
+    DATABASE_READ_REPLICA_URL when set, otherwise shares the primary pool.
+    """
+    global _readonly_engine
+    if _readonly_engine is None:
+        settings = get_settings()
+        
+        try:
+            if settings.DATABASE_READ_REPLICA_URL:
+                _readonly_engine = _create_engine(
+                    _to_async_url(settings.DATABASE_READ_REPLICA_URL),
+                    isolation_level="AUTOCOMMIT"
+                )
+            else:
+                engine = get_engine()
+                if engine:
+                    _readonly_engine = engine.execution_options(isolation_level="AUTOCOMMIT")
+        except Exception as e:
+            print(f"Warning: Could not create read-only database engine: {e}")
+            _readonly_engine = None
+    return _readonly_engine
+
+
 def get_async_session_factory():
     """Get or create async session factory with lazy initialization"""
     global _async_session_factory
@@ -62,6 +127,20 @@ def get_async_session_factory():
             )
     return _async_session_factory
 
+def get_readonly_session_factory():
+    """Get or create the read-only session factory with lazy initialization"""
+    global _readonly_session_factory
+    if _readonly_session_factory is None:
+        engine = get_readonly_engine()
+        if engine:
+            _readonly_session_factory = async_sessionmaker(
+                engine,
+                class_=AsyncSession,
+                expire_on_commit=False,
+                autoflush=False
+            )
+    return _readonly_session_factory
+
 # Legacy property access for backward compatibility
 @property
 def engine():
@@ -91,6 +170,66 @@ async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+async def get_readonly_session() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency for read-only endpoints.
+    
+    The session never commits; writes made through it are not supported.
+    """
+    session_factory = get_readonly_session_factory()
+    if not session_factory:
+        raise RuntimeError("Database not properly configured")
+    
+    async with session_factory() as session:
+        yield session
+
+
+async def estimated_row_count(db: AsyncSession, table_name: str) -> int:
+    """
+    Approximate row count from the planner statistics in pg_class.
+    
+    O(1) instead of the full scan count(*) needs. Falls back to an exact
+    count on other backends and for tables that have never been analyzed.
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        result = await db.execute(
+            text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:t)"),
+            {"t": table_name}
+        )
+        estimate = result.scalar()
+        if estimate is not None and estimate >= 0:
+            return estimate
+    
+    result = await db.execute(select(func.count()).select_from(table(table_name)))
+    return result.scalar() or 0
+
+
+async def warm_pool() -> int:
+    """
+    Open a couple of connections up front so the first requests after startup
+    don't pay connection setup and authentication.
+    """
+    engine = get_engine()
+    if not engine:
+        return 0
+    
+    settings = get_settings()
+    
+    # Each checkout holds its connection until all are open, so the pool
+    # really grows instead of reusing one connection
+    count = min(settings.DATABASE_POOL_SIZE, WARM_POOL_CONNECTIONS)
+    connections = [engine.connect() for _ in range(count)]
+    opened = 0
+    try:
+        for conn in connections:
+            await conn.start()
+            opened += 1
+    finally:
+        for conn in connections[:opened]:
+            await conn.close()
+    return opened
+
+
 async def create_tables():
     """Create all database tables."""
     # Import all models to ensure they're registered with Base.metadata
@@ -101,6 +240,9 @@ async def create_tables():
         raise RuntimeError("Database engine not available")
         
     async with engine.begin() as conn:
+        # Trigram indexes on claims need the extension in place first
+        if conn.dialect.name == "postgresql":
+            await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
         await conn.run_sync(Base.metadata.create_all)
 
 
@@ -116,9 +258,12 @@ async def drop_tables():
 
 async def close_db():
     """Close database connections with graceful error handling."""
-    global _engine, _async_session_factory
+    global _engine, _async_session_factory, _readonly_engine, _readonly_session_factory
     
     try:
+        # A read-only engine without a replica shares the primary pool
+        if _readonly_engine is not None and _readonly_engine.pool is not getattr(_engine, "pool", None):
+            await _readonly_engine.dispose()
         if _engine is not None:
             await _engine.dispose()
     except Exception as e:
@@ -130,6 +275,8 @@ async def close_db():
         # Reset global variables
         _engine = None
         _async_session_factory = None
+        _readonly_engine = None
+        _readonly_session_factory = None
 
 
 # Legacy sync session for backward compatibility (if needed)
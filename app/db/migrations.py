@@ -0,0 +1,101 @@
+"""
+Alembic migration runner for application startup.
+Runs migrations inline, in the background, or not at all depending on MIGRATION_MODE.
+"""
+
+import asyncio
+import enum
+from pathlib import Path
+from typing import Optional
+
+from fastapi import HTTPException, status
+
+from app.core.config import get_settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Repository root (contains alembic.ini and the alembic/ scripts directory)
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+
+class MigrationStatus(enum.Enum):
+    """Lifecycle of the startup migration run."""
+    SKIPPED = "skipped"
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+_migration_status = MigrationStatus.SKIPPED
+_migration_task: Optional[asyncio.Task] = None
+
+
+def get_migration_status() -> MigrationStatus:
+    """Get the current state of the startup migration run."""
+    return _migration_status
+
+
+def run_migrations() -> None:
+    """Upgrade the database to the latest revision (blocking)."""
+    from alembic import command
+    from alembic.config import Config
+
+    alembic_cfg = Config(str(PROJECT_ROOT / "alembic.ini"))
+    alembic_cfg.set_main_option("script_location", str(PROJECT_ROOT / "alembic"))
+    # Keep the application's logging configuration intact
+    alembic_cfg.attributes["configure_logger"] = False
+
+    command.upgrade(alembic_cfg, "head")
+
+
+async def run_migrations_async() -> None:
+    """Run migrations in a worker thread so the event loop keeps serving requests."""
+    global _migration_status
+
+    _migration_status = MigrationStatus.RUNNING
+    logger.info("Running database migrations")
+
+    try:
+        await asyncio.to_thread(run_migrations)
+        _migration_status = MigrationStatus.COMPLETED
+        logger.info("Database migrations completed")
+    except Exception as e:
+        _migration_status = MigrationStatus.FAILED
+        logger.error(f"Database migrations failed: {e}")
+
+
+async def start_migrations() -> None:
+    """Apply migrations according to the MIGRATION_MODE setting."""
+    global _migration_status, _migration_task
+
+    mode = get_settings().MIGRATION_MODE
+
+    if mode == "skip":
+        _migration_status = MigrationStatus.SKIPPED
+    elif mode == "sync":
+        await run_migrations_async()
+    else:
+        _migration_status = MigrationStatus.PENDING
+        _migration_task = asyncio.create_task(run_migrations_async())
+
+
+async def stop_migrations() -> None:
+    """Wait for a background migration run to finish during shutdown."""
+    global _migration_task
+
+    if _migration_task is not None and not _migration_task.done():
+        logger.info("Waiting for database migrations to finish")
+        await _migration_task
+    _migration_task = None
+
+
+async def require_migrations_complete() -> None:
+    """Dependency for write endpoints that need the latest schema."""
+    if _migration_status in (MigrationStatus.PENDING, MigrationStatus.RUNNING):
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Database migrations in progress",
+            headers={"Retry-After": "5"}
+        )
@@ -1,11 +1,11 @@
 import enum
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, JSON, Enum
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, JSON, Enum, Index
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 from sqlalchemy.sql import func
 from datetime import datetime, timezone
 from typing import Optional
 
-from app.db.database import Base
+from app.db.database import Base, JSONDocument
 
 class ActivityType(enum.Enum):
     """Activity type enum."""
@@ -41,10 +41,16 @@ class ActivityLog(Base):
         nullable=False,
         index=True
     )
-    activity_metadata: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    activity_metadata: Mapped[Optional[dict]] = mapped_column(JSONDocument, nullable=True)
 
     # Relationships - using lazy loading to avoid circular imports
     claim = relationship("Claim", back_populates="activity_logs", lazy="select")
 
+    # Per-claim history is read newest first; the single-column timestamp
+    # index already serves the global feed (B-trees scan backwards for DESC)
+    __table_args__ = (
+        Index('ix_activity_log_claim_timestamp', 'claim_id', 'timestamp'),
+    )
+
     def __repr__(self):
         return f"<ActivityLog(id={self.id}, type='{self.activity_type.value}', claim_id={self.claim_id})>"
@@ -1,11 +1,11 @@
 import enum
-from sqlalchemy import Column, Integer, BigInteger, String, DateTime, ForeignKey, Text, JSON, Enum
+from sqlalchemy import Column, Integer, BigInteger, SmallInteger, String, DateTime, ForeignKey, Text, JSON, Enum, Index, Computed, text
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 from sqlalchemy.sql import func
 from datetime import datetime, timezone
 from typing import Optional
 
-from app.db.database import Base
+from app.db.database import Base, JSONDocument
 
 class ClaimStatus(enum.Enum):
     """Status enum for claims."""
@@ -72,7 +72,14 @@ class Claim(Base):
     )
     release_reason: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
     confidence_score: Mapped[int] = mapped_column(Integer, nullable=False)  # 0-100, calculated during claim detection
-    context_metadata: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)  # reply context, user assignment status
+    # Stored decile of confidence_score (0, 10, ..., 100) for the dashboard distribution
+    confidence_bucket: Mapped[Optional[int]] = mapped_column(
+        SmallInteger,
+        Computed("(confidence_score / 10) * 10", persisted=True),
+        nullable=True,
+        index=True
+    )
+    context_metadata: Mapped[Optional[dict]] = mapped_column(JSONDocument, nullable=True)  # reply context, user assignment status
     
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
@@ -94,5 +101,27 @@ class Claim(Base):
     activity_logs = relationship("ActivityLog", back_populates="claim", cascade="all, delete-orphan", lazy="select")
     progress_tracking = relationship("ProgressTracking", back_populates="claim", uselist=False, cascade="all, delete-orphan", lazy="select")
 
+    # Indexes aligned with the listing and dashboard filters
+    __table_args__ = (
+        # Status filter + keyset pagination on id
+        Index('ix_claims_status_id', 'status', 'id'),
+        # Makes ILIKE '%user%' index-usable (requires pg_trgm)
+        Index(
+            'ix_claims_username_trgm', 'github_username',
+            postgresql_using='gin',
+            postgresql_ops={'github_username': 'gin_trgm_ops'}
+        ),
+        # Per-repository status counts on the dashboard
+        Index('ix_claims_repository_status', 'repository_id', 'status'),
+        Index('ix_claims_issue_status', 'issue_id', 'status'),
+        # Claims are append-mostly in time order, so a BRIN range index
+        # serves the 7-day window at a fraction of a B-tree's size
+        Index('ix_claims_claim_timestamp_brin', 'claim_timestamp', postgresql_using='brin'),
+        Index(
+            'ix_claims_auto_released', 'id',
+            postgresql_where=text("release_reason = 'auto_released_after_max_nudges'")
+        ),
+    )
+
     def __repr__(self):
         return f"<Claim(id={self.id}, user='{self.github_username}', status='{self.status.value}')>"
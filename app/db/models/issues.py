@@ -1,11 +1,11 @@
 import enum
-from sqlalchemy import Column, Integer, BigInteger, String, DateTime, JSON, ForeignKey, Text, Enum
+from sqlalchemy import Column, Integer, BigInteger, String, DateTime, JSON, ForeignKey, Text, Enum, UniqueConstraint
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 from sqlalchemy.sql import func
 from datetime import datetime, timezone
 from typing import Optional
 
-from app.db.database import Base
+from app.db.database import Base, JSONDocument
 
 class IssueStatus(enum.Enum):
     """Status enum for issues."""
@@ -50,11 +50,16 @@ class Issue(Base):
         onupdate=func.now(),
         nullable=False
     )
-    github_data: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)  # raw GitHub issue data
+    github_data: Mapped[Optional[dict]] = mapped_column(JSONDocument, nullable=True)  # raw GitHub issue data
 
     # Relationships - using lazy loading to avoid circular imports
     repository = relationship("Repository", back_populates="issues", lazy="select")
     claims = relationship("Claim", back_populates="issue", cascade="all, delete-orphan", lazy="select")
 
+    # Created by migration 001; also the conflict target for webhook upserts
+    __table_args__ = (
+        UniqueConstraint('github_repo_id', 'github_issue_number', name='uq_issues_repo_number'),
+    )
+
     def __repr__(self):
         return f"<Issue(id={self.id}, number=#{self.github_issue_number}, title='{self.title[:50]}...')>"
@@ -5,7 +5,7 @@ from sqlalchemy.sql import func
 from datetime import datetime, timezone
 from typing import Optional
 
-from app.db.database import Base
+from app.db.database import Base, JSONDocument
 
 class PRStatus(enum.Enum):
     """Pull request status enum."""
@@ -54,6 +54,15 @@ class ProgressTracking(Base):
         nullable=True,
         index=True
     )
+    
+    # Last GitHub commit/PR snapshot, refreshed by a background task so the
+    # progress endpoints never wait on GitHub
+    commits_cache: Mapped[Optional[list]] = mapped_column(JSONDocument, nullable=True)
+    prs_cache: Mapped[Optional[list]] = mapped_column(JSONDocument, nullable=True)
+    cache_updated_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True
+    )
 
     # Relationships - using lazy loading to avoid circular imports
     claim = relationship("Claim", back_populates="progress_tracking", lazy="select")
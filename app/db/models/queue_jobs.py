@@ -5,7 +5,7 @@ from sqlalchemy.sql import func
 from datetime import datetime, timezone
 from typing import Optional
 
-from app.db.database import Base
+from app.db.database import Base, JSONDocument
 
 class JobType(enum.Enum):
     """Job type enum."""
@@ -35,7 +35,7 @@ class QueueJob(Base):
         nullable=False,
         index=True
     )
-    payload: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)  # issue_id, claim_id, user_data, etc.
+    payload: Mapped[Optional[dict]] = mapped_column(JSONDocument, nullable=True)  # issue_id, claim_id, user_data, etc.
     scheduled_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         server_default=func.now(),
@@ -60,5 +60,10 @@ class QueueJob(Base):
         nullable=False
     )
 
+    # GIN index for payload containment lookups (JSONB on PostgreSQL)
+    __table_args__ = (
+        Index('ix_queue_jobs_payload_gin', 'payload', postgresql_using='gin'),
+    )
+
     def __repr__(self):
         return f"<QueueJob(id={self.id}, type='{self.job_type.value}', status='{self.status.value}')>"
@@ -1,10 +1,10 @@
-from sqlalchemy import Column, Integer, BigInteger, String, Boolean, JSON, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, BigInteger, String, Boolean, JSON, DateTime, ForeignKey, UniqueConstraint
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 from sqlalchemy.sql import func
 from datetime import datetime, timezone
 from typing import Optional, List
 
-from app.db.database import Base
+from app.db.database import Base, JSONDocument
 
 class Repository(Base):
     """
@@ -28,7 +28,7 @@ class Repository(Base):
     is_monitored: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
     grace_period_days: Mapped[int] = mapped_column(Integer, default=7, nullable=False)
     nudge_count: Mapped[int] = mapped_column(Integer, default=2, nullable=False)
-    notification_settings: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    notification_settings: Mapped[Optional[dict]] = mapped_column(JSONDocument, nullable=True)
     claim_detection_threshold: Mapped[int] = mapped_column(Integer, default=75, nullable=False)  # minimum confidence score
     
     # Timestamps
@@ -49,5 +49,10 @@ class Repository(Base):
     issues = relationship("Issue", back_populates="repository", cascade="all, delete-orphan", lazy="select")
     claims = relationship("Claim", back_populates="repository", cascade="all, delete-orphan", lazy="select")
 
+    # One row per GitHub repository; also backs the registration lookup
+    __table_args__ = (
+        UniqueConstraint('owner_name', 'name', name='uq_repositories_owner_name'),
+    )
+
     def __repr__(self):
         return f"<Repository(id={self.id}, full_name='{self.full_name}', monitored={self.is_monitored})>"
@@ -65,13 +65,20 @@ class User(Base):
     website: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
     location: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
     
-    # User preferences
-    preferences: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    # User preferences - deferred so the per-request auth lookup doesn't pull
+    # the JSON blob; read it explicitly (see /users/me/preferences)
+    preferences: Mapped[Optional[dict]] = mapped_column(
+        JSON, nullable=True, deferred=True, deferred_raiseload=True
+    )
     
-    # Relationships - using lazy loading to avoid circular imports
-    api_keys = relationship("APIKey", back_populates="user", cascade="all, delete-orphan", lazy="select")
-    repositories = relationship("Repository", back_populates="owner", lazy="select")
-    claims = relationship("Claim", back_populates="user", lazy="select")
+    # Relationships - roles and scopes are ARRAY columns loaded with the row, so
+    # these never need to load implicitly; raise_on_sql surfaces N+1 regressions
+    # instead of letting them emit a query per row. Load them with selectinload().
+    api_keys = relationship(
+        "APIKey", back_populates="user", cascade="all, delete-orphan", passive_deletes=True, lazy="raise_on_sql"
+    )
+    repositories = relationship("Repository", back_populates="owner", lazy="raise_on_sql")
+    claims = relationship("Claim", back_populates="user", lazy="raise_on_sql")
     
     def __repr__(self):
         return f"<User(id={self.id}, email='{self.email}', roles={self.roles})>"
@@ -140,7 +147,7 @@ class APIKey(Base):
     last_used_ip: Mapped[Optional[str]] = mapped_column(String(45), nullable=True)  # IPv6 support
     
     # Relationships
-    user = relationship("User", back_populates="api_keys")
+    user = relationship("User", back_populates="api_keys", lazy="raise_on_sql")
     
     def __repr__(self):
         return f"<APIKey(id={self.id}, name='{self.name}', user_id={self.user_id})>"
@@ -3,6 +3,7 @@ Cookie-Licking Detector - Production FastAPI Application
 Enterprise-ready backend with complete authentication, monitoring, and webhook support.
 """
 
+import asyncio
 import time
 from contextlib import asynccontextmanager
 from datetime import datetime, timezone
@@ -10,7 +11,7 @@ from datetime import datetime, timezone
 from fastapi import FastAPI, Request, Response, Depends, HTTPException, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -18,10 +19,13 @@ from app.core.config import get_settings
 from app.core.logging import get_logger, setup_logging
 from app.core.monitoring import (
     health_checker, track_request_metrics, get_metrics, 
-    CONTENT_TYPE_LATEST
+    run_api_call_flusher, CONTENT_TYPE_LATEST
 )
 from app.core.security import add_security_headers
-from app.db.database import get_async_session, create_tables, close_db
+from app.core.cache import close_cache
+from app.services.github_service import close_github_service
+from app.db.database import get_async_session, create_tables, close_db, warm_pool
+from app.db.migrations import start_migrations, stop_migrations, get_migration_status
 
 # Import all route modules
 from app.api.auth_routes import router as auth_router
@@ -55,11 +59,32 @@ async def lifespan(app: FastAPI):
             logger.warning(f"Could not create database tables: {e}")
             logger.info("App will continue without database - some features may be limited")
     
+    # Apply schema migrations (inline, in the background, or skipped per MIGRATION_MODE)
+    await start_migrations()
+    
+    # Open pooled connections before traffic arrives
+    try:
+        warmed = await warm_pool()
+        logger.info(f"Warmed {warmed} database connections")
+    except Exception as e:
+        logger.warning(f"Could not warm database pool: {e}")
+    
+    # Flush buffered API call metrics off the request path
+    metrics_flusher = asyncio.create_task(run_api_call_flusher())
+    
     yield
     
     # Shutdown
     logger.info("Shutting down Cookie Licking Detector API")
+    metrics_flusher.cancel()
+    try:
+        await metrics_flusher
+    except asyncio.CancelledError:
+        pass
+    await stop_migrations()
     await close_db()
+    await close_cache()
+    await close_github_service()
 
 
 # Create FastAPI application
@@ -84,6 +109,7 @@ app = FastAPI(
     docs_url=None,  # We'll create our own docs route
     redoc_url=None,  # We'll create our own ReDoc route
     openapi_url="/openapi.json",
+    default_response_class=ORJSONResponse,
     contact={
         "name": "Cookie Licking Detector Team",
         "email": "support@cookie-detector.com",
@@ -170,7 +196,13 @@ async def metrics_middleware(request: Request, call_next):
     """Track request metrics."""
     start_time = time.time()
     
-    response = await call_next(request)
+    # Route handlers no longer catch their own errors, so count unhandled
+    # exceptions here as the 500s the error handler turns them into
+    try:
+        response = await call_next(request)
+    except Exception:
+        track_request_metrics(request, Response(status_code=500), time.time() - start_time)
+        raise
     
     process_time = time.time() - start_time
     track_request_metrics(request, response, process_time)
@@ -474,6 +506,7 @@ async def root():
 async def health_check():
     """Perform comprehensive system health check."""
     health_result = await health_checker.run_all_checks()
+    health_result["migrations"] = get_migration_status().value
     
     status_code = 200 if health_result["status"] == "healthy" else 503
     
@@ -623,7 +656,10 @@ if __name__ == "__main__":
         host="0.0.0.0",
         port=8000,
         reload=settings.RELOAD if settings.ENVIRONMENT == "development" else False,
-        workers=1 if settings.ENVIRONMENT == "development" else settings.WORKERS,
+        workers=1 if settings.ENVIRONMENT == "development" else settings.API_WORKERS,
         log_level=settings.LOG_LEVEL.lower(),
-        access_log=True
+        access_log=True,
+        # C event loop and HTTP parser (both ship with uvicorn[standard])
+        loop="uvloop",
+        http="httptools"
     )
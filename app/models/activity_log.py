@@ -1,7 +1,8 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, JSON
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, JSON, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from . import Base
+from app.db.database import JSONDocument
 
 class ActivityLog(Base):
     """
@@ -15,10 +16,15 @@ class ActivityLog(Base):
     activity_type = Column(String, nullable=False)  # progress_nudge/auto_release/comment/claim_detected
     description = Column(Text)
     timestamp = Column(DateTime, default=datetime.utcnow)
-    activity_metadata = Column(JSON)
+    activity_metadata = Column(JSONDocument)
 
     # Relationships
     claim = relationship("Claim", back_populates="activity_logs")
 
+    # Per-claim history ordered by time
+    __table_args__ = (
+        Index('ix_activity_log_claim_timestamp', 'claim_id', 'timestamp'),
+    )
+
     def __repr__(self):
         return f"<ActivityLog {self.activity_type} for Claim {self.claim_id}>"
\ No newline at end of file
@@ -1,7 +1,8 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, JSON
+from sqlalchemy import Column, Integer, SmallInteger, String, DateTime, ForeignKey, Text, JSON, Index, Computed, text
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from . import Base
+from app.db.database import JSONDocument
 
 class Claim(Base):
     """
@@ -23,7 +24,8 @@ class Claim(Base):
     auto_release_timestamp = Column(DateTime)
     release_reason = Column(String)
     confidence_score = Column(Integer)  # 0-100, calculated during claim detection
-    context_metadata = Column(JSON)  # reply context, user assignment status
+    confidence_bucket = Column(SmallInteger, Computed("(confidence_score / 10) * 10", persisted=True), index=True)
+    context_metadata = Column(JSONDocument)  # reply context, user assignment status
     created_at = Column(DateTime, default=datetime.utcnow)
 
     # Relationships
@@ -31,5 +33,23 @@ class Claim(Base):
     activity_logs = relationship("ActivityLog", back_populates="claim")
     progress_tracking = relationship("ProgressTracking", back_populates="claim", uselist=False)
 
+    __table_args__ = (
+        # Partial index: only active claims are polled by the nudge/release workers
+        Index('ix_claims_active', 'last_activity_timestamp', postgresql_where=text("status = 'active'")),
+        # Listing and dashboard filters
+        Index('ix_claims_status_id', 'status', 'id'),
+        Index(
+            'ix_claims_username_trgm', 'github_username',
+            postgresql_using='gin',
+            postgresql_ops={'github_username': 'gin_trgm_ops'}
+        ),
+        Index('ix_claims_issue_status', 'issue_id', 'status'),
+        Index('ix_claims_claim_timestamp_brin', 'claim_timestamp', postgresql_using='brin'),
+        Index(
+            'ix_claims_auto_released', 'id',
+            postgresql_where=text("release_reason = 'auto_released_after_max_nudges'")
+        ),
+    )
+
     def __repr__(self):
         return f"<Claim by {self.github_username} on Issue #{self.issue.github_issue_number}>"
\ No newline at end of file
@@ -1,7 +1,8 @@
-from sqlalchemy import Column, Integer, String, DateTime, JSON, ForeignKey, Text
+from sqlalchemy import Column, Integer, String, DateTime, JSON, ForeignKey, Text, UniqueConstraint
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from . import Base
+from app.db.database import JSONDocument
 
 class Issue(Base):
     """
@@ -18,11 +19,15 @@ class Issue(Base):
     status = Column(String, default="open")  # open/closed
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-    github_data = Column(JSON)  # raw GitHub issue data
+    github_data = Column(JSONDocument)  # raw GitHub issue data
 
     # Relationships
     repository = relationship("Repository", back_populates="issues")
     claims = relationship("Claim", back_populates="issue")
 
+    __table_args__ = (
+        UniqueConstraint('github_repo_id', 'github_issue_number', name='uq_issues_repo_number'),
+    )
+
     def __repr__(self):
         return f"<Issue #{self.github_issue_number}: {self.title}>"
\ No newline at end of file
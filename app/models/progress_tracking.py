@@ -2,6 +2,7 @@ from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from . import Base
+from app.db.database import JSONDocument
 
 class ProgressTracking(Base):
     """
@@ -18,6 +19,9 @@ class ProgressTracking(Base):
     last_commit_date = Column(DateTime)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     detected_from = Column(String)  # ecosyste_ms_api/github_api
+    commits_cache = Column(JSONDocument)  # last GitHub commits snapshot
+    prs_cache = Column(JSONDocument)  # last GitHub pull requests snapshot
+    cache_updated_at = Column(DateTime(timezone=True))
 
     # Relationships
     claim = relationship("Claim", back_populates="progress_tracking")
@@ -1,6 +1,7 @@
-from sqlalchemy import Column, Integer, String, DateTime, JSON, Index
+from sqlalchemy import Column, Integer, String, DateTime, JSON, Index, text
 from datetime import datetime
 from . import Base
+from app.db.database import JSONDocument
 
 class QueueJob(Base):
     """
@@ -11,7 +12,7 @@ class QueueJob(Base):
 
     id = Column(Integer, primary_key=True)
     job_type = Column(String, nullable=False)  # nudge_check/progress_check/auto_release_check/comment_analysis
-    payload = Column(JSON)  # issue_id, claim_id, user_data, etc.
+    payload = Column(JSONDocument)  # issue_id, claim_id, user_data, etc.
     scheduled_at = Column(DateTime, default=datetime.utcnow)
     processed_at = Column(DateTime)
     status = Column(String, default="pending")  # pending/processing/completed/failed/dead_letter
@@ -23,6 +24,10 @@ class QueueJob(Base):
     __table_args__ = (
         Index('ix_queue_jobs_scheduled_at', 'scheduled_at'),
         Index('ix_queue_jobs_status', 'status'),
+        # Partial index: only pending jobs are polled by workers
+        Index('ix_queue_jobs_pending', 'scheduled_at', postgresql_where=text("status = 'pending'")),
+        # GIN index for payload containment lookups (JSONB only)
+        Index('ix_queue_jobs_payload_gin', 'payload', postgresql_using='gin'),
     )
 
     def __repr__(self):
@@ -1,7 +1,8 @@
-from sqlalchemy import Column, Integer, String, Boolean, JSON, DateTime
+from sqlalchemy import Column, Integer, String, Boolean, JSON, DateTime, UniqueConstraint
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from . import Base
+from app.db.database import JSONDocument
 
 class Repository(Base):
     """
@@ -18,12 +19,16 @@ class Repository(Base):
     is_monitored = Column(Boolean, default=True)
     grace_period_days = Column(Integer, default=7)
     nudge_count = Column(Integer, default=2)
-    notification_settings = Column(JSON)
+    notification_settings = Column(JSONDocument)
     claim_detection_threshold = Column(Integer, default=75)  # minimum confidence score
     created_at = Column(DateTime, default=datetime.utcnow)
     
     # Relationships
     issues = relationship("Issue", back_populates="repository")
 
+    __table_args__ = (
+        UniqueConstraint('owner', 'name', name='uq_repositories_owner_name'),
+    )
+
     def __repr__(self):
         return f"<Repository {self.owner}/{self.name}>"
\ No newline at end of file
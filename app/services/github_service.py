@@ -17,6 +17,11 @@ from app.core.config import get_settings
 
 logger = structlog.get_logger(__name__)
 
+# Keep-alive connections PyGithub's requests session holds to api.github.com.
+# Fetches run in worker threads, so size it above requests' default of 10 to
+# keep concurrent calls from discarding connections and re-handshaking TLS
+GITHUB_POOL_SIZE = 20
+
 class GitHubAPIService:
     """
     Production GitHub API service with rate limiting and error handling
@@ -33,7 +38,7 @@ class GitHubAPIService:
         if settings.GITHUB_TOKEN:
             try:
                 auth = Auth.Token(settings.GITHUB_TOKEN)
-                self.github = Github(auth=auth)
+                self.github = Github(auth=auth, pool_size=GITHUB_POOL_SIZE)
                 self.authenticated = True
                 logger.info("GitHub service initialized with token authentication")
             except Exception as e:
@@ -44,7 +49,7 @@ class GitHubAPIService:
                     settings.GITHUB_APP_ID,
                     settings.GITHUB_APP_PRIVATE_KEY_PATH
                 )
-                self.github = Github(auth=auth)
+                self.github = Github(auth=auth, pool_size=GITHUB_POOL_SIZE)
                 self.authenticated = True
                 logger.info("GitHub service initialized with App authentication")
             except Exception as e:
@@ -52,7 +57,7 @@ class GitHubAPIService:
         
         if not self.authenticated:
             logger.warning("GitHub service running without authentication - API calls will be limited")
-            self.github = Github()  # Public API only
+            self.github = Github(pool_size=GITHUB_POOL_SIZE)  # Public API only
         
         # HTTP client for webhook verification and raw API calls
         headers = {
@@ -324,40 +329,44 @@ class GitHubAPIService:
         try:
             await self._check_rate_limit()
             
-            repo = self.github.get_repo(f"{owner}/{name}")
-            
-            # Search for PRs that reference this issue
-            query = f"repo:{owner}/{name} is:pr #{issue_number}"
-            search_result = self.github.search_issues(query)
-            
-            prs = []
-            for pr in search_result:
-                if pr.pull_request:
-                    pr_data = repo.get_pull(pr.number)
-                    prs.append({
-                        "id": pr_data.id,
-                        "number": pr_data.number,
-                        "title": pr_data.title,
-                        "state": pr_data.state,
-                        "user": {
-                            "login": pr_data.user.login,
-                            "id": pr_data.user.id
-                        },
-                        "created_at": pr_data.created_at.isoformat(),
-                        "updated_at": pr_data.updated_at.isoformat(),
-                        "merged_at": pr_data.merged_at.isoformat() if pr_data.merged_at else None,
-                        "html_url": pr_data.html_url,
-                        "commits": pr_data.commits
-                    })
-            
-            return prs
+            def fetch_prs() -> List[Dict[str, Any]]:
+                repo = self.github.get_repo(f"{owner}/{name}")
+                
+                # Search for PRs that reference this issue
+                query = f"repo:{owner}/{name} is:pr #{issue_number}"
+                search_result = self.github.search_issues(query)
+                
+                prs = []
+                for pr in search_result:
+                    if pr.pull_request:
+                        pr_data = repo.get_pull(pr.number)
+                        prs.append({
+                            "id": pr_data.id,
+                            "number": pr_data.number,
+                            "title": pr_data.title,
+                            "state": pr_data.state,
+                            "user": {
+                                "login": pr_data.user.login,
+                                "id": pr_data.user.id
+                            },
+                            "created_at": pr_data.created_at.isoformat(),
+                            "updated_at": pr_data.updated_at.isoformat(),
+                            "merged_at": pr_data.merged_at.isoformat() if pr_data.merged_at else None,
+                            "html_url": pr_data.html_url,
+                            "commits": pr_data.commits
+                        })
+                return prs
+            
+            # PyGithub blocks on every page and per-PR lookup; run it in a
+            # thread so concurrent callers overlap instead of queueing
+            return await asyncio.to_thread(fetch_prs)
             
         except GithubException as e:
             logger.error(f"GitHub API error getting PRs for issue {owner}/{name}#{issue_number}: {e}")
-            return []
+            raise
         except Exception as e:
             logger.error(f"Unexpected error getting PRs for issue {owner}/{name}#{issue_number}: {e}")
-            return []
+            raise
 
     async def get_user_commits(self, owner: str, name: str, username: str, since: datetime) -> List[Dict[str, Any]]:
         """Get commits by a user in a repository since a specific date"""
@@ -365,35 +374,38 @@ class GitHubAPIService:
         try:
             await self._check_rate_limit()
             
-            repo = self.github.get_repo(f"{owner}/{name}")
-            commits = repo.get_commits(author=username, since=since)
-            
-            commit_list = []
-            for commit in commits:
-                commit_list.append({
-                    "sha": commit.sha,
-                    "message": commit.commit.message,
-                    "author": {
-                        "name": commit.commit.author.name,
-                        "email": commit.commit.author.email,
-                        "date": commit.commit.author.date.isoformat()
-                    },
-                    "html_url": commit.html_url,
-                    "stats": {
-                        "additions": commit.stats.additions if commit.stats else 0,
-                        "deletions": commit.stats.deletions if commit.stats else 0,
-                        "total": commit.stats.total if commit.stats else 0
-                    }
-                })
+            def fetch_commits() -> List[Dict[str, Any]]:
+                repo = self.github.get_repo(f"{owner}/{name}")
+                commits = repo.get_commits(author=username, since=since)
+                
+                commit_list = []
+                for commit in commits:
+                    commit_list.append({
+                        "sha": commit.sha,
+                        "message": commit.commit.message,
+                        "author": {
+                            "name": commit.commit.author.name,
+                            "email": commit.commit.author.email,
+                            "date": commit.commit.author.date.isoformat()
+                        },
+                        "html_url": commit.html_url,
+                        "stats": {
+                            "additions": commit.stats.additions if commit.stats else 0,
+                            "deletions": commit.stats.deletions if commit.stats else 0,
+                            "total": commit.stats.total if commit.stats else 0
+                        }
+                    })
+                return commit_list
             
-            return commit_list
+            # Pagination and per-commit stats are blocking PyGithub requests
+            return await asyncio.to_thread(fetch_commits)
             
         except GithubException as e:
             logger.error(f"GitHub API error getting commits for {username} in {owner}/{name}: {e}")
-            return []
+            raise
         except Exception as e:
             logger.error(f"Unexpected error getting commits for {username} in {owner}/{name}: {e}")
-            return []
+            raise
 
     async def create_webhook(self, owner: str, name: str, webhook_url: str, secret: str) -> Dict[str, Any]:
         """Create a webhook for repository events"""
@@ -537,6 +549,13 @@ def get_github_service() -> GitHubAPIService:
         _github_service = GitHubAPIService()
     return _github_service
 
+async def close_github_service() -> None:
+    """Close the singleton's HTTP client (application shutdown)"""
+    global _github_service
+    if _github_service is not None:
+        await _github_service.close()
+        _github_service = None
+
 # Convenience functions for use in workers
 async def post_issue_comment(issue, message: str) -> bool:
     """Post comment on issue"""
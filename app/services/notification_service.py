@@ -349,7 +349,7 @@ You're receiving this because you claimed an issue that hasn't seen activity in
             
             <h2 style="color: #4a5568;">Hi {claim.github_username},</h2>
             
-            <p>We wanted to let you know that your claim on the following issue has been automatically released:</p>
+            <p>We wanted to let you know that your claim on the following issue has been released:</p>
             
             <div style="background: #fef5e7; border-left: 4px solid #ed8936; padding: 20px; margin: 20px 0; border-radius: 5px;">
                 <h3 style="margin: 0 0 10px 0; color: #2d3748;">
@@ -394,7 +394,7 @@ You're receiving this because you claimed an issue that hasn't seen activity in
         return f"""
 Hi {claim.github_username},
 
-We wanted to let you know that your claim on the following issue has been automatically released:
+We wanted to let you know that your claim on the following issue has been released:
 
 #{claim.issue.github_issue_number}: {claim.issue.title}
 Repository: {claim.issue.repository.owner}/{claim.issue.repository.name}
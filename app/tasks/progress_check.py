@@ -193,3 +193,90 @@ def update_progress_task(claim_id: int):
     Used by API endpoints for manual progress updates
     """
     return check_progress_task(claim_id)
+
+
+@celery_app.task(bind=True, max_retries=3)
+def refresh_progress_cache_task(self, claim_id: int):
+    """
+    Refresh the GitHub commit and pull request snapshot for a claim.
+    The progress API serves these snapshots instead of calling GitHub inline.
+    """
+    try:
+        return asyncio.run(_refresh_progress_cache_async(claim_id))
+    except Exception as exc:
+        logger.error(f"Progress cache refresh failed for claim {claim_id}: {exc}")
+        raise self.retry(countdown=60, exc=exc)
+
+
+async def _refresh_progress_cache_async(claim_id: int) -> Dict[str, Any]:
+    """Fetch commits and PRs from GitHub and store them on progress_tracking"""
+    from app.services.github_service import get_github_service
+    
+    db = SessionLocal()
+    try:
+        claim = db.query(Claim).filter(Claim.id == claim_id).first()
+        if not claim:
+            return {"status": "error", "message": "Claim not found"}
+        
+        issue = claim.issue
+        if not issue or not issue.repository:
+            return {"status": "error", "message": "Issue or repository not found"}
+        
+        repo = issue.repository
+        github_service = get_github_service()
+        
+        # Both lookups are independent GitHub calls; the service runs each
+        # PyGithub fetch in a worker thread, so they overlap. Either one
+        # raising leaves the stored snapshot and cache_updated_at as they
+        # were for the retry
+        commits, prs = await asyncio.gather(
+            github_service.get_user_commits(
+                owner=repo.owner,
+                name=repo.name,
+                username=claim.github_username,
+                since=claim.claim_timestamp.replace(tzinfo=timezone.utc)
+            ),
+            github_service.get_pull_requests_for_issue(
+                owner=repo.owner,
+                name=repo.name,
+                issue_number=issue.github_issue_number
+            )
+        )
+        
+        progress_tracking = db.query(ProgressTracking).filter(
+            ProgressTracking.claim_id == claim_id
+        ).first()
+        
+        if not progress_tracking:
+            progress_tracking = ProgressTracking(
+                claim_id=claim_id,
+                detected_from="github_api"
+            )
+            db.add(progress_tracking)
+        
+        progress_tracking.commits_cache = commits
+        progress_tracking.prs_cache = [pr for pr in prs if pr["user"]["login"] == claim.github_username]
+        progress_tracking.cache_updated_at = datetime.now(timezone.utc)
+        
+        # Keep the summary columns in step so the commits endpoint can answer
+        # from them without loading the snapshot
+        progress_tracking.commit_count = len(commits)
+        progress_tracking.last_commit_date = datetime.fromisoformat(
+            commits[0]["author"]["date"].replace("Z", "+00:00")
+        ) if commits else None
+        
+        db.commit()
+        
+        return {
+            "status": "completed",
+            "claim_id": claim_id,
+            "commit_count": len(commits),
+            "pr_count": len(progress_tracking.prs_cache)
+        }
+        
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Error refreshing progress cache for claim {claim_id}: {e}")
+        raise
+    finally:
+        db.close()
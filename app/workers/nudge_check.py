@@ -6,6 +6,7 @@ Implements notification and auto-release flow as specified in MD file:
 - GitHub API integration for assignments/comments  
 """
 from celery import Task
+from sqlalchemy import literal_column
 from sqlalchemy.orm import Session
 from datetime import datetime, timedelta
 import structlog
@@ -288,10 +289,11 @@ def batch_nudge_check():
     
     db = SessionLocal()
     try:
-        # Get all pending nudge jobs that are due
+        # Get all pending nudge jobs that are due. The status is a SQL literal
+        # (not a bind param) so the planner can match ix_queue_jobs_pending.
         due_jobs = db.query(QueueJob).filter(
             QueueJob.job_type == "nudge_check",
-            QueueJob.status == "pending",
+            QueueJob.status == literal_column("'pending'"),
             QueueJob.scheduled_at <= datetime.utcnow()
         ).all()
         
@@ -9,7 +9,7 @@ import structlog
 from app.workers.celery_app import celery_app, PRIORITY_LOW
 from app.models import SessionLocal, QueueJob, Claim, ActivityLog
 from app.core.config import get_settings
-from sqlalchemy import func, and_
+from sqlalchemy import func, and_, literal_column
 
 logger = structlog.get_logger(__name__)
 settings = get_settings()
@@ -275,7 +275,8 @@ def health_check(self):
         stuck_threshold = datetime.utcnow() - timedelta(hours=1)
         stuck_jobs = db.query(func.count(QueueJob.id)).filter(
             and_(
-                QueueJob.status == "pending",
+                # Literal status so the planner can use ix_queue_jobs_pending
+                QueueJob.status == literal_column("'pending'"),
                 QueueJob.scheduled_at < stuck_threshold
             )
         ).scalar()
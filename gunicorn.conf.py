@@ -0,0 +1,22 @@
+"""
+Gunicorn settings for the production image.
+Worker count and class come from the GUNICORN_* variables in docker-compose.prod.yml.
+"""
+
+import multiprocessing
+import os
+
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:8000")
+
+# One worker per core by default, so webhook HMAC and parsing spread across
+# processes instead of queueing on a single event loop. Each worker keeps its
+# own database pool, so raising this multiplies connections to Postgres
+workers = int(os.getenv("GUNICORN_WORKERS", multiprocessing.cpu_count()))
+
+# UvicornWorker picks up uvloop and httptools when they are installed
+worker_class = os.getenv("GUNICORN_WORKER_CLASS", "uvicorn.workers.UvicornWorker")
+
+# Pending-connection queue for bursty webhook deliveries; the kernel caps it
+# at net.core.somaxconn, which the prod compose file raises to match
+backlog = int(os.getenv("GUNICORN_BACKLOG", "4096"))
+reuse_port = True
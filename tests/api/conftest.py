@@ -0,0 +1,48 @@
+"""
+Fixtures for API tests that mount a single router on its own app.
+
+The database session is a stand-in, so these run without PostgreSQL; the
+SQL itself is covered by the integration tests.
+"""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from unittest.mock import AsyncMock, Mock
+
+from app.db.database import get_async_session
+
+
+def _execute_result(scalar=None, scalars=(), row=None) -> Mock:
+    result = Mock()
+    result.scalar_one_or_none.return_value = scalar
+    result.scalars.return_value.all.return_value = list(scalars)
+    result.one_or_none.return_value = row
+    return result
+
+
+@pytest.fixture
+def execute_result():
+    """Build a stand-in for an AsyncSession.execute() result."""
+    return _execute_result
+
+
+@pytest.fixture
+def db_session() -> AsyncMock:
+    """Stand-in session; each execute() returns an empty result by default."""
+    session = AsyncMock()
+    session.execute.return_value = _execute_result()
+    return session
+
+
+@pytest.fixture
+def router_client(db_session):
+    """Create a test client for one router with db_session as its database."""
+    def _router_client(router, dependency_overrides=None) -> TestClient:
+        app = FastAPI()
+        app.include_router(router, prefix="/api/v1")
+        app.dependency_overrides[get_async_session] = lambda: db_session
+        app.dependency_overrides.update(dependency_overrides or {})
+        return TestClient(app)
+
+    return _router_client
@@ -0,0 +1,86 @@
+"""
+API tests for dashboard conditional responses (ETag / If-None-Match).
+"""
+
+import orjson
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from app.api.dashboard_routes import router as dashboard_router
+
+STATS_PAYLOAD = {"overview": {"total_claims": 12, "active_claims": 4}, "generated_at": "2024-01-15T12:00:00"}
+
+
+@pytest.fixture
+def cached_payload():
+    with patch("app.api.dashboard_routes.cached_json", AsyncMock(return_value=STATS_PAYLOAD)) as cached:
+        yield cached
+
+
+@pytest.fixture
+def dashboard_client(router_client, cached_payload):
+    return router_client(dashboard_router)
+
+
+@pytest.mark.api
+class TestDashboardETag:
+    """Test dashboard endpoints answer revalidation with 304."""
+
+    @pytest.mark.parametrize("path", ["/dashboard/stats", "/dashboard/repositories", "/dashboard/users"])
+    def test_body_carries_etag(self, dashboard_client, path):
+        response = dashboard_client.get(f"/api/v1{path}")
+
+        assert response.status_code == 200
+        assert response.json() == STATS_PAYLOAD
+        assert response.headers["etag"].startswith('"') and response.headers["etag"].endswith('"')
+        assert response.headers["cache-control"].startswith("private, max-age=")
+
+    def test_etag_is_stable_for_same_payload(self, dashboard_client):
+        first = dashboard_client.get("/api/v1/dashboard/stats")
+        second = dashboard_client.get("/api/v1/dashboard/stats")
+
+        assert first.headers["etag"] == second.headers["etag"]
+
+    def test_matching_if_none_match_gets_304(self, dashboard_client):
+        etag = dashboard_client.get("/api/v1/dashboard/stats").headers["etag"]
+
+        response = dashboard_client.get("/api/v1/dashboard/stats", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+    def test_etag_in_list_gets_304(self, dashboard_client):
+        etag = dashboard_client.get("/api/v1/dashboard/stats").headers["etag"]
+
+        response = dashboard_client.get(
+            "/api/v1/dashboard/stats", headers={"If-None-Match": f'"stale", {etag}'}
+        )
+
+        assert response.status_code == 304
+
+    def test_weak_etag_gets_304(self, dashboard_client):
+        """Test the tag a compressing proxy hands back as W/"..." still matches."""
+        etag = dashboard_client.get("/api/v1/dashboard/stats").headers["etag"]
+
+        response = dashboard_client.get("/api/v1/dashboard/stats", headers={"If-None-Match": f"W/{etag}"})
+
+        assert response.status_code == 304
+        assert response.content == b""
+
+    def test_wildcard_gets_304(self, dashboard_client):
+        response = dashboard_client.get("/api/v1/dashboard/stats", headers={"If-None-Match": "*"})
+
+        assert response.status_code == 304
+
+    @pytest.mark.parametrize("weak", [False, True])
+    def test_stale_etag_gets_body(self, dashboard_client, cached_payload, weak):
+        etag = dashboard_client.get("/api/v1/dashboard/stats").headers["etag"]
+        cached_payload.return_value = {**STATS_PAYLOAD, "generated_at": "2024-01-15T12:05:00"}
+
+        if_none_match = f"W/{etag}" if weak else etag
+        response = dashboard_client.get("/api/v1/dashboard/stats", headers={"If-None-Match": if_none_match})
+
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+        assert orjson.loads(response.content)["generated_at"] == "2024-01-15T12:05:00"
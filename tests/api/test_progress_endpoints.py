@@ -0,0 +1,190 @@
+"""
+API tests for progress tracking endpoints.
+"""
+
+import pytest
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+from app.api.progress_routes import router as progress_router
+from app.db.models import ActivityLog, ActivityType, Claim, ClaimStatus, Issue, IssueStatus, Repository
+
+
+def _claim(claim_id: int) -> Claim:
+    repository = Repository(id=1, owner_name="owner", name="test-repo")
+    issue = Issue(
+        id=claim_id,
+        github_issue_number=100 + claim_id,
+        title=f"Issue {claim_id}",
+        status=IssueStatus.OPEN,
+        repository=repository
+    )
+    return Claim(
+        id=claim_id,
+        github_username="testclaimer",
+        status=ClaimStatus.ACTIVE,
+        claim_timestamp=datetime(2024, 1, 15, 12, 0, 0),
+        last_activity_timestamp=datetime(2024, 1, 16, 12, 0, 0),
+        confidence_score=95,
+        issue=issue,
+        progress_tracking=None
+    )
+
+
+def _activity(activity_id: int, claim_id: int) -> ActivityLog:
+    return ActivityLog(
+        id=activity_id,
+        claim_id=claim_id,
+        activity_type=ActivityType.PROGRESS_UPDATE,
+        description="Manual progress update triggered via API",
+        timestamp=datetime(2024, 1, 16, 12, 0, activity_id),
+        activity_metadata={"trigger": "manual"}
+    )
+
+
+@pytest.fixture
+def progress_client(router_client):
+    return router_client(progress_router)
+
+
+@pytest.fixture
+def update_progress_task():
+    with patch("app.tasks.progress_check.update_progress_task") as task:
+        yield task
+
+
+@pytest.fixture
+def task_group():
+    with patch("app.api.progress_routes.group") as group:
+        yield group
+
+
+@pytest.mark.api
+class TestProgressBatch:
+    """Test POST /progress/batch."""
+
+    def test_two_queries_for_any_number_of_claims(self, progress_client, db_session, execute_result):
+        """Test claims and their activity come back in one query each."""
+        db_session.execute.side_effect = [
+            execute_result(scalars=[_claim(2), _claim(1)]),
+            execute_result(scalars=[_activity(10, 1), _activity(11, 2), _activity(12, 2)])
+        ]
+
+        response = progress_client.post("/api/v1/progress/batch", json={"claim_ids": [1, 2]})
+
+        assert response.status_code == 200
+        assert db_session.execute.await_count == 2
+        body = response.json()
+        assert [detail["claim_id"] for detail in body] == [1, 2]
+        assert [len(detail["recent_activity"]) for detail in body] == [1, 2]
+        assert body[0]["issue_info"]["repository"] == "owner/test-repo"
+
+    def test_requested_order_kept_and_unknown_skipped(self, progress_client, db_session, execute_result):
+        db_session.execute.side_effect = [
+            execute_result(scalars=[_claim(1), _claim(3)]),
+            execute_result(scalars=[])
+        ]
+
+        response = progress_client.post("/api/v1/progress/batch", json={"claim_ids": [3, 2, 1, 3]})
+
+        assert [detail["claim_id"] for detail in response.json()] == [3, 1]
+        assert db_session.execute.await_args_list[0].args[1] == {"claim_ids": [3, 2, 1]}
+
+    @pytest.mark.parametrize("claim_ids", [[], list(range(101))])
+    def test_batch_size_is_bounded(self, progress_client, db_session, claim_ids):
+        response = progress_client.post("/api/v1/progress/batch", json={"claim_ids": claim_ids})
+
+        assert response.status_code == 422
+        db_session.execute.assert_not_awaited()
+
+
+@pytest.mark.api
+class TestForceUpdateProgressBatch:
+    """Test POST /progress/update."""
+
+    def test_schedules_existing_claims_as_one_group(self, progress_client, db_session, execute_result, update_progress_task, task_group):
+        db_session.execute.side_effect = [execute_result(scalars=[1, 3]), execute_result()]
+        calls = MagicMock()
+        calls.attach_mock(db_session.commit, "commit")
+        calls.attach_mock(task_group.return_value.apply_async, "apply_async")
+
+        response = progress_client.post("/api/v1/progress/update", json={"claim_ids": [1, 2, 3, 1]})
+
+        assert response.status_code == 200
+        body = response.json()
+        assert [entry["claim_id"] for entry in body["scheduled"]] == [1, 3]
+        assert body["not_found"] == [2]
+
+        # One multi-row INSERT, committed before the group is published
+        activity_rows = db_session.execute.await_args_list[1].args[1]
+        assert [row["claim_id"] for row in activity_rows] == [1, 3]
+        assert [row["activity_metadata"]["task_id"] for row in activity_rows] == [
+            entry["task_id"] for entry in body["scheduled"]
+        ]
+        assert [name for name, _, _ in calls.mock_calls] == ["commit", "apply_async"]
+
+        signatures = list(task_group.call_args.args[0])
+        assert len(signatures) == 2
+        update_progress_task.s.assert_any_call(1)
+        update_progress_task.s.assert_any_call(3)
+
+    def test_no_existing_claims_sends_nothing(self, progress_client, db_session, execute_result, task_group):
+        db_session.execute.return_value = execute_result(scalars=[])
+
+        response = progress_client.post("/api/v1/progress/update", json={"claim_ids": [7, 8]})
+
+        assert response.status_code == 200
+        assert response.json()["not_found"] == [7, 8]
+        assert db_session.execute.await_count == 1
+        task_group.assert_not_called()
+
+    def test_failed_commit_sends_nothing(self, progress_client, db_session, execute_result, task_group):
+        db_session.execute.side_effect = [execute_result(scalars=[1]), execute_result()]
+        db_session.commit.side_effect = RuntimeError("connection lost")
+
+        response = progress_client.post("/api/v1/progress/update", json={"claim_ids": [1]})
+
+        assert response.status_code == 500
+        db_session.rollback.assert_awaited_once()
+        task_group.assert_not_called()
+
+
+@pytest.mark.api
+class TestForceUpdateProgress:
+    """Test POST /progress/{claim_id}/update."""
+
+    def test_task_is_sent_after_commit(self, progress_client, db_session, execute_result, update_progress_task):
+        """Test the worker is only told about the claim once the log row is committed."""
+        db_session.execute.return_value = execute_result(scalar=1)
+        calls = MagicMock()
+        calls.attach_mock(db_session.commit, "commit")
+        calls.attach_mock(update_progress_task.apply_async, "apply_async")
+
+        response = progress_client.post("/api/v1/progress/1/update")
+
+        assert response.status_code == 200
+        assert [name for name, _, _ in calls.mock_calls] == ["commit", "apply_async"]
+
+        task_id = response.json()["task_id"]
+        update_progress_task.apply_async.assert_called_once_with((1,), task_id=task_id)
+        activity_insert = db_session.execute.await_args_list[-1].args[0]
+        assert activity_insert.compile().params["activity_metadata"]["task_id"] == task_id
+
+    def test_failed_commit_sends_no_task(self, progress_client, db_session, execute_result, update_progress_task):
+        """Test a rolled-back update never reaches the worker."""
+        db_session.execute.return_value = execute_result(scalar=1)
+        db_session.commit.side_effect = RuntimeError("connection lost")
+
+        response = progress_client.post("/api/v1/progress/1/update")
+
+        assert response.status_code == 500
+        db_session.rollback.assert_awaited_once()
+        update_progress_task.apply_async.assert_not_called()
+
+    def test_unknown_claim(self, progress_client, db_session, update_progress_task):
+        """Test a missing claim is a 404 and nothing is logged or sent."""
+        response = progress_client.post("/api/v1/progress/999/update")
+
+        assert response.status_code == 404
+        db_session.commit.assert_not_awaited()
+        update_progress_task.apply_async.assert_not_called()
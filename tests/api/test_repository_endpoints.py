@@ -0,0 +1,171 @@
+"""
+API tests for repository endpoints.
+
+Statements are checked as compiled PostgreSQL; tests/integration runs
+them against a real database.
+"""
+
+import pytest
+from datetime import datetime
+from types import SimpleNamespace
+from sqlalchemy.dialects import postgresql
+from unittest.mock import AsyncMock, patch
+
+from app.api.repository_routes import router as repository_router
+from app.db.models import Repository
+from app.services.github_service import GitHubAPIService, get_github_service
+
+
+def _repository(repo_id: int) -> Repository:
+    return Repository(
+        id=repo_id,
+        github_repo_id=100000 + repo_id,
+        owner_name="owner",
+        name=f"repo-{repo_id}",
+        full_name=f"owner/repo-{repo_id}",
+        url=f"https://github.com/owner/repo-{repo_id}",
+        is_monitored=True,
+        grace_period_days=7,
+        nudge_count=2,
+        claim_detection_threshold=75,
+        notification_settings={},
+        created_at=datetime(2024, 1, 15),
+        updated_at=datetime(2024, 1, 15)
+    )
+
+
+def _sql(statement) -> str:
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+@pytest.fixture
+def github_service():
+    service = AsyncMock(spec=GitHubAPIService)
+    service.get_repository.return_value = {"id": 123456}
+    return service
+
+
+@pytest.fixture
+def invalidate():
+    with patch("app.api.repository_routes.invalidate", AsyncMock()) as invalidate:
+        yield invalidate
+
+
+@pytest.fixture
+def repository_client(router_client, github_service, invalidate):
+    return router_client(repository_router, {get_github_service: lambda: github_service})
+
+
+@pytest.mark.api
+class TestRegisterRepository:
+    """Test POST /repositories conflict handling."""
+
+    def test_existing_repository_is_409_without_github_call(self, repository_client, db_session, execute_result, github_service):
+        db_session.execute.return_value = execute_result(scalar=1)
+
+        response = repository_client.post("/api/v1/repositories", json={"owner": "owner", "name": "repo-1"})
+
+        assert response.status_code == 409
+        github_service.get_repository.assert_not_awaited()
+
+    def test_concurrent_registration_is_409(self, repository_client, db_session, execute_result):
+        """Test ON CONFLICT DO NOTHING returning no row maps to 409, not 500."""
+        db_session.execute.side_effect = [execute_result(scalar=None), execute_result(scalar=None)]
+
+        response = repository_client.post("/api/v1/repositories", json={"owner": "owner", "name": "repo-1"})
+
+        assert response.status_code == 409
+        db_session.rollback.assert_awaited_once()
+        db_session.commit.assert_not_awaited()
+
+        insert_sql = _sql(db_session.execute.await_args_list[1].args[0])
+        assert "ON CONFLICT DO NOTHING" in insert_sql
+        assert "RETURNING" in insert_sql
+
+    def test_registers_new_repository(self, repository_client, db_session, execute_result):
+        db_session.execute.side_effect = [execute_result(scalar=None), execute_result(scalar=_repository(1))]
+
+        response = repository_client.post("/api/v1/repositories", json={"owner": "owner", "name": "repo-1"})
+
+        assert response.status_code == 200
+        assert response.json()["full_name"] == "owner/repo-1"
+        db_session.commit.assert_awaited_once()
+
+
+@pytest.mark.api
+class TestRepositoryUpdateReturning:
+    """Test UPDATE ... RETURNING answers both the write and the existence check."""
+
+    def test_update_missing_repository_is_404(self, repository_client, db_session):
+        response = repository_client.put("/api/v1/repositories/99", json={"grace_period_days": 14})
+
+        assert response.status_code == 404
+        assert "RETURNING" in _sql(db_session.execute.await_args.args[0])
+        db_session.commit.assert_not_awaited()
+
+    def test_update_returns_updated_row(self, repository_client, db_session, execute_result):
+        db_session.execute.return_value = execute_result(scalar=_repository(1))
+
+        response = repository_client.put("/api/v1/repositories/1", json={"grace_period_days": 14})
+
+        assert response.status_code == 200
+        db_session.execute.assert_awaited_once()
+        db_session.commit.assert_awaited_once()
+
+    def test_stop_monitoring_missing_repository_is_404(self, repository_client, db_session):
+        response = repository_client.delete("/api/v1/repositories/99")
+
+        assert response.status_code == 404
+        db_session.commit.assert_not_awaited()
+
+    def test_stop_monitoring_uses_returned_name(self, repository_client, db_session, execute_result, invalidate):
+        db_session.execute.return_value = execute_result(
+            row=SimpleNamespace(owner_name="owner", name="repo-1", github_repo_id=100001)
+        )
+
+        response = repository_client.delete("/api/v1/repositories/1")
+
+        assert response.status_code == 200
+        assert response.json()["message"] == "Stopped monitoring repository owner/repo-1"
+        db_session.execute.assert_awaited_once()
+        invalidate.assert_awaited_once_with("repo:cfg:v1:100001")
+
+
+@pytest.mark.api
+class TestListRepositoriesKeyset:
+    """Test GET /repositories pages by after_id rather than OFFSET."""
+
+    def test_first_page_has_no_lower_bound(self, repository_client, db_session, execute_result):
+        db_session.execute.return_value = execute_result(scalars=[_repository(1), _repository(2)])
+
+        response = repository_client.get("/api/v1/repositories", params={"limit": 2})
+
+        sql = _sql(db_session.execute.await_args.args[0])
+        assert "repositories.id >" not in sql
+        assert "ORDER BY repositories.id" in sql
+        assert "OFFSET" not in sql
+        assert response.json()["next_cursor"] == 2
+
+    def test_after_id_seeks_past_cursor(self, repository_client, db_session, execute_result):
+        db_session.execute.return_value = execute_result(scalars=[_repository(3)])
+
+        response = repository_client.get("/api/v1/repositories", params={"after_id": 2, "limit": 2})
+
+        statement = db_session.execute.await_args.args[0]
+        assert "repositories.id > " in _sql(statement)
+        assert 2 in statement.compile().params.values()
+        assert [item["id"] for item in response.json()["items"]] == [3]
+
+    def test_short_page_ends_pagination(self, repository_client, db_session, execute_result):
+        db_session.execute.return_value = execute_result(scalars=[_repository(3)])
+
+        response = repository_client.get("/api/v1/repositories", params={"after_id": 2, "limit": 2})
+
+        assert response.json()["next_cursor"] is None
+
+    def test_status_filter_combines_with_cursor(self, repository_client, db_session):
+        repository_client.get("/api/v1/repositories", params={"status_filter": "active", "after_id": 5})
+
+        sql = _sql(db_session.execute.await_args.args[0])
+        assert "repositories.is_monitored" in sql
+        assert "repositories.id > " in sql
@@ -0,0 +1,50 @@
+"""
+API tests for system settings shared through Redis.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from app.api import settings_routes
+
+
+@pytest.fixture
+def settings_store(monkeypatch):
+    # Force every request past the per-process copy to the store
+    monkeypatch.setattr(settings_routes, "_system_settings", settings_routes.SystemSettingsModel())
+    monkeypatch.setattr(settings_routes, "_system_settings_loaded_at", 0.0)
+    monkeypatch.setattr(settings_routes, "SETTINGS_LOCAL_TTL", 0.0)
+
+    store = AsyncMock()
+    store.get.return_value = None
+    with patch("app.api.settings_routes.get_cache_client", return_value=store):
+        yield store
+
+
+@pytest.fixture
+def settings_client(router_client, settings_store):
+    return router_client(settings_routes.router)
+
+
+@pytest.mark.api
+class TestSystemSettings:
+    """Test GET /settings reads the shared copy and survives a bad one."""
+
+    def test_stored_settings_are_served(self, settings_client, settings_store):
+        settings_store.get.return_value = b'{"claim_timeout_hours": 48}'
+
+        response = settings_client.get("/api/v1/settings")
+
+        assert response.status_code == 200
+        assert response.json()["claim_timeout_hours"] == 48
+        settings_store.get.assert_awaited_once_with(settings_routes.SYSTEM_SETTINGS_KEY)
+
+    @pytest.mark.parametrize("raw", [b'{"claim_timeout_hours": 0}', b"not json"])
+    def test_invalid_stored_settings_serve_local_copy(self, settings_client, settings_store, raw):
+        settings_client.put("/api/v1/settings", json={"claim_timeout_hours": 12})
+        settings_store.get.return_value = raw
+
+        response = settings_client.get("/api/v1/settings")
+
+        assert response.status_code == 200
+        assert response.json()["claim_timeout_hours"] == 12
@@ -0,0 +1,117 @@
+"""
+API tests for the GitHub webhook receiver's body limit and signature check.
+"""
+
+import hashlib
+import hmac
+
+import pytest
+
+from app.api import webhook_routes
+
+WEBHOOK_SECRET = "test-webhook-secret"
+WEBHOOK_URL = "/api/v1/webhooks/github"
+
+
+def _sign(body: bytes, secret: str = WEBHOOK_SECRET) -> str:
+    return "sha256=" + hmac.new(secret.encode("utf-8"), body, hashlib.sha256).hexdigest()
+
+
+@pytest.fixture
+def webhook_client(router_client, monkeypatch):
+    monkeypatch.setattr(webhook_routes.settings, "GITHUB_WEBHOOK_SECRET", WEBHOOK_SECRET)
+    monkeypatch.setattr(webhook_routes, "MAX_WEBHOOK_BODY_BYTES", 1024)
+    return router_client(webhook_routes.router)
+
+
+@pytest.mark.api
+class TestWebhookSignature:
+    """Test X-Hub-Signature-256 verification against the streamed digest."""
+
+    def test_valid_signature(self, webhook_client):
+        body = b'{"zen": "Keep it logically awesome."}'
+        response = webhook_client.post(WEBHOOK_URL, content=body, headers={
+            "X-GitHub-Event": "ping",
+            "X-Hub-Signature-256": _sign(body)
+        })
+
+        assert response.status_code == 200
+        assert response.json() == {"message": "pong"}
+
+    def test_wrong_secret(self, webhook_client):
+        body = b'{"zen": "Keep it logically awesome."}'
+        response = webhook_client.post(WEBHOOK_URL, content=body, headers={
+            "X-GitHub-Event": "ping",
+            "X-Hub-Signature-256": _sign(body, secret="not-the-secret")
+        })
+
+        assert response.status_code == 401
+
+    def test_tampered_body(self, webhook_client):
+        body = b'{"zen": "Keep it logically awesome."}'
+        response = webhook_client.post(WEBHOOK_URL, content=body + b" ", headers={
+            "X-GitHub-Event": "ping",
+            "X-Hub-Signature-256": _sign(body)
+        })
+
+        assert response.status_code == 401
+
+    @pytest.mark.parametrize("signature", [None, "", "sha1=abc", "sha256=not-hex"])
+    def test_missing_or_malformed_signature(self, webhook_client, signature):
+        headers = {"X-GitHub-Event": "ping"}
+        if signature is not None:
+            headers["X-Hub-Signature-256"] = signature
+
+        response = webhook_client.post(WEBHOOK_URL, content=b"{}", headers=headers)
+
+        assert response.status_code == 401
+
+    def test_unsigned_when_no_secret(self, webhook_client, monkeypatch):
+        monkeypatch.setattr(webhook_routes.settings, "GITHUB_WEBHOOK_SECRET", None)
+
+        response = webhook_client.post(WEBHOOK_URL, content=b"{}", headers={"X-GitHub-Event": "ping"})
+
+        assert response.status_code == 200
+
+    def test_invalid_json_on_handled_event(self, webhook_client):
+        body = b"{not json"
+        response = webhook_client.post(WEBHOOK_URL, content=body, headers={
+            "X-GitHub-Event": "issues",
+            "X-Hub-Signature-256": _sign(body)
+        })
+
+        assert response.status_code == 400
+
+
+@pytest.mark.api
+class TestWebhookBodyLimit:
+    """Test deliveries over MAX_WEBHOOK_BODY_BYTES are rejected with 413."""
+
+    def test_body_at_limit_is_accepted(self, webhook_client):
+        body = b"x" * 1024
+        response = webhook_client.post(WEBHOOK_URL, content=body, headers={
+            "X-GitHub-Event": "ping",
+            "X-Hub-Signature-256": _sign(body)
+        })
+
+        assert response.status_code == 200
+
+    def test_declared_length_over_limit(self, webhook_client):
+        body = b"x" * 1025
+        response = webhook_client.post(WEBHOOK_URL, content=body, headers={
+            "X-GitHub-Event": "ping",
+            "X-Hub-Signature-256": _sign(body)
+        })
+
+        assert response.status_code == 413
+
+    def test_streamed_body_over_limit(self, webhook_client):
+        """Test a chunked body with no Content-Length is cut off once it passes the limit."""
+        chunks = [b"x" * 512] * 4
+
+        response = webhook_client.post(WEBHOOK_URL, content=iter(chunks), headers={
+            "X-GitHub-Event": "ping",
+            "X-Hub-Signature-256": _sign(b"".join(chunks))
+        })
+
+        assert response.status_code == 413
@@ -4,6 +4,10 @@ Test configuration and fixtures for Cookie Licking Detector.
 
 import asyncio
 import os
+
+# Select TestSettings before any app module reads the environment
+os.environ.setdefault("ENVIRONMENT", "test")
+
 import pytest
 from typing import AsyncGenerator, Generator
 from unittest.mock import Mock, AsyncMock
@@ -12,25 +16,25 @@ import pytest_asyncio
 from fastapi.testclient import TestClient
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import NullPool
 import redis.asyncio as redis
 
 from app.main import app
 from app.core.config import get_settings
 from app.core.security import AuthenticationService, SecurityUtils, jwt_manager
-from app.db.database import get_async_session, Base
+from app.db.database import get_async_session, get_readonly_session, Base
 from app.db.models.user import User, UserRole
-from app.services.github_service import GitHubService
+from app.services.github_service import GitHubAPIService
 from app.services.notification_service import NotificationService
 
 
-# Test database URL - use in-memory SQLite for fast tests
-TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
+# Test database URL. The models use PostgreSQL types (ARRAY, JSONB, GIN
+# indexes), so database-backed tests need TEST_DATABASE_URL pointing at a
+# disposable PostgreSQL database; they are skipped without it.
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL")
 
 # Override settings for testing
 test_settings = get_settings()
-test_settings.DATABASE_URL = TEST_DATABASE_URL
-test_settings.ENVIRONMENT = "testing"
 test_settings.DEBUG = True
 test_settings.ENABLE_METRICS = False
 
@@ -44,14 +48,17 @@ def event_loop() -> Generator:
 
 
 @pytest.fixture
-async def async_engine():
+def test_database_url() -> str:
+    """Skip database-backed tests before any async setup when no database is configured."""
+    if not TEST_DATABASE_URL:
+        pytest.skip("TEST_DATABASE_URL is not set; database-backed test skipped")
+    return TEST_DATABASE_URL
+
+
+@pytest.fixture
+async def async_engine(test_database_url):
     """Create async database engine for testing."""
-    engine = create_async_engine(
-        TEST_DATABASE_URL,
-        echo=False,
-        poolclass=StaticPool,
-        connect_args={"check_same_thread": False}
-    )
+    engine = create_async_engine(test_database_url, echo=False, poolclass=NullPool)
     
     # Create all tables
     async with engine.begin() as conn:
@@ -83,6 +90,7 @@ def override_get_db(async_session):
         yield async_session
     
     app.dependency_overrides[get_async_session] = _override_get_db
+    app.dependency_overrides[get_readonly_session] = _override_get_db
     yield
     app.dependency_overrides.clear()
 
@@ -199,10 +207,10 @@ def mock_redis():
 @pytest.fixture
 def mock_github_service():
     """Mock GitHub service."""
-    mock_service = AsyncMock(spec=GitHubService)
+    mock_service = AsyncMock(spec=GitHubAPIService)
     
     # Mock common methods
-    mock_service.get_rate_limit.return_value = {
+    mock_service.get_rate_limit_status.return_value = {
         "remaining": 5000,
         "limit": 5000,
         "reset_at": "2024-01-01T00:00:00Z"
@@ -217,19 +225,17 @@ def mock_github_service():
         "forks_count": 20
     }
     
-    mock_service.get_issues.return_value = [
-        {
-            "id": 1,
-            "number": 101,
-            "title": "Test Issue",
-            "body": "This is a test issue",
-            "state": "open",
-            "user": {
-                "login": "testuser",
-                "id": 12345
-            }
+    mock_service.get_issue.return_value = {
+        "id": 1,
+        "number": 101,
+        "title": "Test Issue",
+        "body": "This is a test issue",
+        "state": "open",
+        "user": {
+            "login": "testuser",
+            "id": 12345
         }
-    ]
+    }
     
     mock_service.get_issue_comments.return_value = [
         {
@@ -245,7 +251,7 @@ def mock_github_service():
     
     mock_service.assign_issue.return_value = True
     mock_service.unassign_issue.return_value = True
-    mock_service.create_issue_comment.return_value = {
+    mock_service.post_issue_comment.return_value = {
         "id": 2001,
         "body": "Comment created",
         "created_at": "2024-01-01T12:30:00Z"
@@ -259,26 +265,11 @@ def mock_notification_service():
     """Mock notification service."""
     mock_service = AsyncMock(spec=NotificationService)
     
-    mock_service.send_nudge_email.return_value = {
-        "status": "sent",
-        "message_id": "test_message_123"
-    }
-    
-    mock_service.send_auto_release_email.return_value = {
-        "status": "sent",
-        "message_id": "test_message_456"
-    }
-    
-    mock_service.send_maintainer_notification.return_value = {
-        "status": "sent",
-        "message_id": "test_message_789"
-    }
-    
-    mock_service.post_github_comment.return_value = {
-        "id": 3001,
-        "body": "Automated comment",
-        "created_at": "2024-01-01T13:00:00Z"
-    }
+    # Every send/post method reports success as a bool
+    mock_service.send_nudge_email.return_value = True
+    mock_service.send_auto_release_email.return_value = True
+    mock_service.post_nudge_comment.return_value = True
+    mock_service.post_auto_release_comment.return_value = True
     
     return mock_service
 
@@ -286,23 +277,17 @@ def mock_notification_service():
 @pytest.fixture
 async def test_repository(async_session):
     """Create test repository."""
-    from app.db.models.repository import Repository
+    from app.db.models.repositories import Repository
     
     repo = Repository(
-        github_id=123456,
-        full_name="owner/test-repo",
+        github_repo_id=123456,
+        owner_name="owner",
         name="test-repo",
-        owner="owner",
-        description="Test repository for cookie licking detection",
-        language="Python",
-        stars_count=100,
-        forks_count=20,
+        full_name="owner/test-repo",
+        url="https://github.com/owner/test-repo",
         is_monitored=True,
-        monitoring_settings={
-            "grace_period_days": 7,
-            "max_nudges": 2,
-            "auto_release_enabled": True
-        }
+        grace_period_days=7,
+        nudge_count=2
     )
     
     async_session.add(repo)
@@ -315,20 +300,17 @@ async def test_repository(async_session):
 @pytest.fixture
 async def test_issue(async_session, test_repository):
     """Create test issue."""
-    from app.db.models.issue import Issue
+    from app.db.models.issues import Issue, IssueStatus
     
     issue = Issue(
         repository_id=test_repository.id,
-        github_id=101,
-        number=101,
+        github_repo_id=test_repository.github_repo_id,
+        github_issue_id=9101,
+        github_issue_number=101,
         title="Test Issue for Cookie Licking",
-        body="This is a test issue to detect cookie licking behavior",
-        state="open",
-        author_username="issueauthor",
-        author_github_id=11111,
-        labels=["bug", "help wanted"],
-        created_at_github="2024-01-01T10:00:00Z",
-        updated_at_github="2024-01-01T10:00:00Z"
+        description="This is a test issue to detect cookie licking behavior",
+        status=IssueStatus.OPEN,
+        github_data={"html_url": "https://github.com/owner/test-repo/issues/101"}
     )
     
     async_session.add(issue)
@@ -341,17 +323,17 @@ async def test_issue(async_session, test_repository):
 @pytest.fixture
 async def test_claim(async_session, test_issue):
     """Create test claim."""
-    from app.db.models.claim import Claim, ClaimStatus
+    from app.db.models.claims import Claim, ClaimStatus
     
     claim = Claim(
         issue_id=test_issue.id,
-        username="testclaimer",
+        repository_id=test_issue.repository_id,
         github_user_id=22222,
-        comment_body="I'll work on this issue!",
-        comment_github_id=1001,
+        github_username="testclaimer",
+        claim_comment_id=1001,
+        claim_text="I'll work on this issue!",
         confidence_score=95,
-        status=ClaimStatus.ACTIVE,
-        grace_period_end="2024-01-08T10:00:00Z"
+        status=ClaimStatus.ACTIVE
     )
     
     async_session.add(claim)
@@ -428,6 +410,10 @@ def sample_webhook_payload():
 # Pytest configuration
 def pytest_configure(config):
     """Configure pytest markers."""
+    # pytest.ini keeps its options under [tool:pytest], a header pytest only
+    # reads from setup.cfg; apply the asyncio mode it asks for here
+    config.option.asyncio_mode = "auto"
+    
     config.addinivalue_line(
         "markers", 
         "slow: mark test as slow running"
@@ -0,0 +1,152 @@
+"""
+Integration tests for the PostgreSQL-specific query paths.
+
+These need TEST_DATABASE_URL pointing at a disposable PostgreSQL database
+and are skipped without it.
+"""
+
+import pytest
+from datetime import datetime, timedelta, timezone
+from fastapi import HTTPException
+from sqlalchemy import func, select
+from unittest.mock import AsyncMock, patch
+
+from app.api.progress_routes import ProgressBatchRequest, get_progress_batch
+from app.api.repository_routes import (
+    RepositoryCreate, RepositoryUpdate,
+    list_repositories, register_repository, update_repository
+)
+from app.db.models import ActivityLog, ActivityType, Repository
+from app.services.github_service import GitHubAPIService
+
+
+@pytest.fixture(autouse=True)
+def no_cache_invalidation():
+    with patch("app.api.repository_routes.invalidate", AsyncMock()):
+        yield
+
+
+def _github_service(github_repo_id: int):
+    service = AsyncMock(spec=GitHubAPIService)
+    service.get_repository.return_value = {"id": github_repo_id}
+    return service
+
+
+async def _add_repositories(session, count: int):
+    session.add_all([
+        Repository(
+            github_repo_id=200000 + n,
+            owner_name="owner",
+            name=f"repo-{n}",
+            full_name=f"owner/repo-{n}",
+            url=f"https://github.com/owner/repo-{n}",
+            is_monitored=n % 2 == 0
+        )
+        for n in range(count)
+    ])
+    await session.commit()
+
+
+@pytest.mark.integration
+@pytest.mark.database
+class TestRepositoryKeysetPagination:
+    """Test after_id pages cover every row exactly once."""
+
+    async def test_pages_walk_all_rows_in_id_order(self, async_session):
+        await _add_repositories(async_session, 5)
+
+        seen, cursor = [], None
+        while True:
+            page = await list_repositories(status_filter=None, after_id=cursor, limit=2, db=async_session)
+            seen.extend(repo.id for repo in page["items"])
+            cursor = page["next_cursor"]
+            if cursor is None:
+                break
+
+        all_ids = (await async_session.execute(select(Repository.id).order_by(Repository.id))).scalars().all()
+        assert seen == all_ids
+
+    async def test_cursor_with_status_filter(self, async_session):
+        await _add_repositories(async_session, 6)
+
+        first = await list_repositories(status_filter="active", after_id=None, limit=2, db=async_session)
+        second = await list_repositories(status_filter="active", after_id=first["next_cursor"], limit=2, db=async_session)
+
+        items = first["items"] + second["items"]
+        assert all(repo.is_monitored for repo in items)
+        assert len({repo.id for repo in items}) == 3
+        assert second["next_cursor"] is None
+
+
+@pytest.mark.integration
+@pytest.mark.database
+class TestRepositoryRegistrationConflicts:
+    """Test ON CONFLICT DO NOTHING RETURNING turns duplicates into 409s."""
+
+    async def test_duplicate_registration_is_409(self, async_session):
+        repo_data = RepositoryCreate(owner="owner", name="new-repo")
+        await register_repository(repo_data, db=async_session, github_service=_github_service(300001))
+
+        with pytest.raises(HTTPException) as exc_info:
+            await register_repository(repo_data, db=async_session, github_service=_github_service(300001))
+
+        assert exc_info.value.status_code == 409
+
+    async def test_conflicting_insert_is_409_and_leaves_one_row(self, async_session, test_repository):
+        """Test a row that passes the name check but collides on insert returns 409."""
+        # Same GitHub repository under a new name, e.g. after a rename on GitHub
+        repo_data = RepositoryCreate(owner="owner", name="renamed-repo")
+        github_service = _github_service(test_repository.github_repo_id)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await register_repository(repo_data, db=async_session, github_service=github_service)
+
+        assert exc_info.value.status_code == 409
+        count = await async_session.scalar(
+            select(func.count()).where(Repository.github_repo_id == test_repository.github_repo_id)
+        )
+        assert count == 1
+
+@pytest.mark.integration
+@pytest.mark.database
+class TestRepositoryUpdateReturning:
+    """Test UPDATE ... RETURNING answers both the write and the existence check."""
+
+    async def test_update_missing_repository_is_404(self, async_session):
+        with pytest.raises(HTTPException) as exc_info:
+            await update_repository(999999, RepositoryUpdate(grace_period_days=14), db=async_session)
+
+        assert exc_info.value.status_code == 404
+
+    async def test_update_returns_updated_row(self, async_session, test_repository):
+        repository = await update_repository(
+            test_repository.id, RepositoryUpdate(grace_period_days=14), db=async_session
+        )
+
+        assert repository.id == test_repository.id
+        assert repository.grace_period_days == 14
+
+
+@pytest.mark.integration
+@pytest.mark.database
+class TestProgressBatchQueries:
+    """Test the batched claim and windowed activity queries."""
+
+    async def test_ten_newest_activities_per_claim(self, async_session, test_claim):
+        start = datetime(2024, 1, 15, 12, 0, 0, tzinfo=timezone.utc)
+        async_session.add_all([
+            ActivityLog(
+                claim_id=test_claim.id,
+                activity_type=ActivityType.PROGRESS_UPDATE,
+                description=f"update {n}",
+                timestamp=start + timedelta(minutes=n)
+            )
+            for n in range(12)
+        ])
+        await async_session.commit()
+
+        details = await get_progress_batch(ProgressBatchRequest(claim_ids=[test_claim.id, 999999]), db=async_session)
+
+        assert [detail.claim_id for detail in details] == [test_claim.id]
+        descriptions = [activity.description for activity in details[0].recent_activity]
+        assert descriptions == [f"update {n}" for n in range(11, 1, -1)]
@@ -79,8 +79,7 @@ class APIUser(AuthenticatedUser):
             return
         
         params = {
-            "page": random.randint(1, 3),
-            "per_page": random.choice([10, 20, 50])
+            "limit": random.choice([10, 20, 50])
         }
         
         self.client.get("/api/v1/repositories", params=params, headers=self.headers)
@@ -92,7 +91,6 @@ class APIUser(AuthenticatedUser):
             return
         
         params = {
-            "page": random.randint(1, 3),
             "per_page": random.choice([10, 20, 50]),
             "status": random.choice(["active", "released", "all"])
         }
@@ -248,7 +246,7 @@ class AdminUser(AuthenticatedUser):
             return
         
         params = {
-            "page": random.randint(1, 3),
+            "after_id": random.randint(0, 40),
             "per_page": 20
         }
         
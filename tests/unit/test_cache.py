@@ -0,0 +1,175 @@
+"""
+Unit tests for the Redis-backed read cache helpers.
+"""
+
+import orjson
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from redis.exceptions import ConnectionError as RedisConnectionError, LockError, LockNotOwnedError
+
+from app.core.cache import acquire_once, cached_json, invalidate
+
+
+class FakeLock:
+    """Async context manager standing in for redis.asyncio.lock.Lock."""
+
+    def __init__(self, acquire_error=None, release_error=None):
+        self.acquire_error = acquire_error
+        self.release_error = release_error
+
+    async def __aenter__(self):
+        if self.acquire_error:
+            raise self.acquire_error
+        return self
+
+    async def __aexit__(self, *exc_info):
+        if self.release_error:
+            raise self.release_error
+        return False
+
+
+class FakeRedis:
+    """In-memory subset of the redis.asyncio client used by app.core.cache."""
+
+    def __init__(self):
+        self.store = {}
+        self.lock_options = {}
+        self.get = AsyncMock(side_effect=self._get)
+        self.set = AsyncMock(side_effect=self._set)
+        self.delete = AsyncMock(side_effect=self._delete)
+
+    async def _get(self, key):
+        return self.store.get(key)
+
+    async def _set(self, key, value, ex=None, nx=False):
+        if nx and key in self.store:
+            return None
+        self.store[key] = value
+        return True
+
+    async def _delete(self, *keys):
+        return sum(1 for key in keys if self.store.pop(key, None) is not None)
+
+    def lock(self, name, timeout=None, blocking_timeout=None):
+        return FakeLock(**self.lock_options)
+
+
+@pytest.fixture
+def redis_client():
+    client = FakeRedis()
+    with patch("app.core.cache.get_cache_client", return_value=client):
+        yield client
+
+
+@pytest.mark.unit
+class TestCachedJson:
+    """Test cached_json's hit, miss and failure paths."""
+
+    async def test_hit_skips_compute(self, redis_client):
+        """Test a cached value is returned without calling fn."""
+        redis_client.store["stats"] = orjson.dumps({"total": 3})
+        compute = AsyncMock()
+
+        assert await cached_json("stats", 60, compute) == {"total": 3}
+        compute.assert_not_awaited()
+
+    async def test_miss_computes_and_stores(self, redis_client):
+        """Test a miss computes once and stores the orjson payload."""
+        compute = AsyncMock(return_value={"total": 5})
+
+        assert await cached_json("stats", 60, compute) == {"total": 5}
+        compute.assert_awaited_once()
+        assert orjson.loads(redis_client.store["stats"]) == {"total": 5}
+        redis_client.set.assert_awaited_once_with("stats", orjson.dumps({"total": 5}), ex=60)
+
+    async def test_filled_while_waiting_for_lock(self, redis_client):
+        """Test a key filled by another worker during the lock wait is re-read."""
+        redis_client.get.side_effect = [None, orjson.dumps({"total": 7})]
+        compute = AsyncMock()
+
+        assert await cached_json("stats", 60, compute) == {"total": 7}
+        compute.assert_not_awaited()
+
+    async def test_failed_store_returns_computed_value(self, redis_client):
+        """Test a failed SET returns the computed value instead of recomputing."""
+        redis_client.set.side_effect = RedisConnectionError("connection reset")
+        compute = AsyncMock(return_value={"total": 5})
+
+        assert await cached_json("stats", 60, compute) == {"total": 5}
+        compute.assert_awaited_once()
+
+    async def test_failed_lock_release_returns_computed_value(self, redis_client):
+        """Test a lock that expired before release doesn't trigger a recompute."""
+        redis_client.lock_options = {"release_error": LockNotOwnedError("lock expired")}
+        compute = AsyncMock(return_value={"total": 5})
+
+        assert await cached_json("stats", 60, compute) == {"total": 5}
+        compute.assert_awaited_once()
+
+    async def test_none_result_is_not_recomputed(self, redis_client):
+        """Test a None result still counts as computed when the store fails."""
+        redis_client.set.side_effect = RedisConnectionError("connection reset")
+        compute = AsyncMock(return_value=None)
+
+        assert await cached_json("stats", 60, compute) is None
+        compute.assert_awaited_once()
+
+    async def test_lock_timeout_computes_directly(self, redis_client):
+        """Test a caller that can't get the lock computes without caching."""
+        redis_client.lock_options = {"acquire_error": LockError("Unable to acquire lock")}
+        compute = AsyncMock(return_value={"total": 5})
+
+        assert await cached_json("stats", 60, compute) == {"total": 5}
+        compute.assert_awaited_once()
+        assert "stats" not in redis_client.store
+
+    async def test_redis_down_computes_directly(self, redis_client):
+        """Test a Redis outage falls through to the source."""
+        redis_client.get.side_effect = RedisConnectionError("connection refused")
+        compute = AsyncMock(return_value={"total": 5})
+
+        assert await cached_json("stats", 60, compute) == {"total": 5}
+        compute.assert_awaited_once()
+
+    async def test_compute_error_propagates(self, redis_client):
+        """Test errors from fn itself are not swallowed as cache failures."""
+        compute = AsyncMock(side_effect=ValueError("bad query"))
+
+        with pytest.raises(ValueError):
+            await cached_json("stats", 60, compute)
+        compute.assert_awaited_once()
+
+
+@pytest.mark.unit
+class TestAcquireOnce:
+    """Test acquire_once's set-if-absent deduplication."""
+
+    async def test_first_caller_wins(self, redis_client):
+        """Test only the first caller in the window gets True."""
+        assert await acquire_once("refresh:1", 60) is True
+        assert await acquire_once("refresh:1", 60) is False
+        assert await acquire_once("refresh:2", 60) is True
+
+    async def test_fails_open_without_redis(self, redis_client):
+        """Test callers proceed when Redis is unavailable."""
+        redis_client.set.side_effect = RedisConnectionError("connection refused")
+
+        assert await acquire_once("refresh:1", 60) is True
+
+
+@pytest.mark.unit
+class TestInvalidate:
+    """Test invalidate drops keys and tolerates outages."""
+
+    async def test_deletes_keys(self, redis_client):
+        redis_client.store.update({"a": b"1", "b": b"2", "c": b"3"})
+
+        await invalidate("a", "b")
+
+        assert list(redis_client.store) == ["c"]
+
+    async def test_redis_error_is_logged(self, redis_client):
+        redis_client.delete.side_effect = RedisConnectionError("connection refused")
+
+        await invalidate("a")
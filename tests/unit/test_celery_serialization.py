@@ -0,0 +1,54 @@
+"""
+Unit tests for the orjson Celery message codec.
+"""
+
+import pytest
+from datetime import datetime
+from kombu.serialization import dumps, loads, prepare_accept_content
+from kombu.exceptions import ContentDisallowed
+
+from app.core.celery_app import celery_app
+
+
+@pytest.mark.unit
+class TestOrjsonCodec:
+    """Test the codec registered with kombu as "orjson"."""
+
+    def test_registered_with_own_content_type(self):
+        content_type, content_encoding, body = dumps({"claim_id": 1}, serializer="orjson")
+
+        assert content_type == "application/x-orjson"
+        assert content_encoding == "binary"
+        assert isinstance(body, bytes)
+
+    def test_round_trips_task_payload(self):
+        payload = {
+            "comment": {"id": 1001, "body": "I'd like to work on this \U0001F36A"},
+            "issue_number": 101,
+            "labels": ["good first issue", "help wanted"],
+            "confidence": 0.95,
+            "assignee": None
+        }
+        content_type, content_encoding, body = dumps(payload, serializer="orjson")
+
+        assert loads(body, content_type, content_encoding, accept=["application/x-orjson"]) == payload
+
+    def test_datetimes_travel_as_iso_strings(self):
+        """Test datetimes arrive as strings; kombu's json codec is for callers that need them back."""
+        content_type, content_encoding, body = dumps(
+            {"since": datetime(2024, 1, 15, 12, 0, 0)}, serializer="orjson"
+        )
+
+        assert loads(body, content_type, content_encoding, accept=["application/x-orjson"]) == {"since": "2024-01-15T12:00:00"}
+
+    def test_workers_accept_orjson_and_json(self):
+        accept_content = prepare_accept_content(celery_app.conf.accept_content)
+
+        assert "application/x-orjson" in accept_content
+        assert "application/json" in accept_content
+
+    def test_rejected_when_not_accepted(self):
+        content_type, content_encoding, body = dumps({"claim_id": 1}, serializer="orjson")
+
+        with pytest.raises(ContentDisallowed):
+            loads(body, content_type, content_encoding, accept=["application/json"])
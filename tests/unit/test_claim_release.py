@@ -0,0 +1,109 @@
+"""
+Unit tests for the follow-up work that runs after a manual claim release.
+"""
+
+import pytest
+from datetime import datetime
+from unittest.mock import AsyncMock, patch
+
+from app.api.claim_routes import _post_release_side_effects
+from app.services.github_service import GitHubAPIService
+from app.services.notification_service import NotificationService
+
+
+def _release_kwargs(**overrides):
+    kwargs = dict(
+        claim_id=1,
+        owner_name="owner",
+        repository_name="test-repo",
+        issue_number=101,
+        issue_title="Test Issue",
+        issue_github_data={"html_url": "https://github.com/owner/test-repo/issues/101"},
+        username="testclaimer",
+        claim_timestamp=datetime(2024, 1, 15, 12, 0, 0),
+        release_reason="manual_release_via_api",
+    )
+    kwargs.update(overrides)
+    return kwargs
+
+
+@pytest.mark.unit
+class TestPostReleaseSideEffects:
+    """Test GitHub unassignment and claimer email after a manual release."""
+
+    @pytest.fixture
+    def github_service(self):
+        service = AsyncMock(spec=GitHubAPIService)
+        service.unassign_issue.return_value = True
+        return service
+
+    @pytest.fixture
+    def notification_service(self):
+        service = AsyncMock(spec=NotificationService)
+        service.send_auto_release_email.return_value = True
+        return service
+
+    @pytest.fixture
+    def patched_services(self, github_service, notification_service):
+        with patch("app.services.github_service.get_github_service", return_value=github_service), \
+             patch("app.services.notification_service.get_notification_service", return_value=notification_service):
+            yield github_service, notification_service
+
+    async def test_unassigns_and_emails_claimer(self, patched_services):
+        """Test both follow-up calls run with the released claim's details."""
+        github_service, notification_service = patched_services
+
+        await _post_release_side_effects(**_release_kwargs())
+
+        github_service.unassign_issue.assert_awaited_once_with("owner", "test-repo", 101, "testclaimer")
+        notification_service.send_auto_release_email.assert_awaited_once()
+
+        claim, = notification_service.send_auto_release_email.await_args.args
+        assert notification_service.send_auto_release_email.await_args.kwargs["reason"] == "manual_release_via_api"
+        assert claim.github_username == "testclaimer"
+        assert claim.claim_timestamp == datetime(2024, 1, 15, 12, 0, 0)
+        assert claim.issue.github_issue_number == 101
+        assert claim.issue.repository.owner == "owner"
+        assert claim.issue.repository.name == "test-repo"
+
+    async def test_snapshot_renders_release_email(self, patched_services):
+        """Test the snapshot carries every field the email templates read."""
+        _, notification_service = patched_services
+
+        await _post_release_side_effects(**_release_kwargs())
+
+        claim, = notification_service.send_auto_release_email.await_args.args
+        renderer = NotificationService.__new__(NotificationService)
+        text = renderer._get_auto_release_email_text(claim, "manual_release_via_api")
+        html = renderer._get_auto_release_email_html(claim, "manual_release_via_api")
+
+        assert "#101: Test Issue" in text
+        assert "Repository: owner/test-repo" in text
+        assert "https://github.com/owner/test-repo/issues/101" in html
+
+    async def test_default_reason_when_none_given(self, patched_services):
+        """Test a release without a stored reason still sends a readable one."""
+        _, notification_service = patched_services
+
+        await _post_release_side_effects(**_release_kwargs(release_reason=None))
+
+        assert notification_service.send_auto_release_email.await_args.kwargs["reason"] == "Released by a maintainer"
+
+    async def test_one_failure_does_not_block_the_other(self, patched_services):
+        """Test a GitHub error still lets the email go out, and vice versa."""
+        github_service, notification_service = patched_services
+        github_service.unassign_issue.side_effect = RuntimeError("GitHub down")
+        notification_service.send_auto_release_email.return_value = False
+
+        await _post_release_side_effects(**_release_kwargs())
+
+        github_service.unassign_issue.assert_awaited_once()
+        notification_service.send_auto_release_email.assert_awaited_once()
+
+    async def test_service_setup_failure_is_logged(self):
+        """Test a failure to build the services is swallowed, not raised."""
+        with patch("app.services.github_service.get_github_service", side_effect=RuntimeError("no token")), \
+             patch("app.api.claim_routes.logger") as logger:
+            await _post_release_side_effects(**_release_kwargs())
+
+        logger.warning.assert_called_once()
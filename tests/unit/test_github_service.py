@@ -0,0 +1,63 @@
+"""
+Unit tests for the GitHub API service's snapshot fetches.
+"""
+
+import asyncio
+import threading
+import pytest
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, Mock, patch
+
+from github.GithubException import GithubException
+
+from app.services.github_service import GitHubAPIService
+
+
+@pytest.fixture
+def github_service():
+    service = GitHubAPIService()
+    service.github = Mock()
+    with patch.object(service, "_check_rate_limit", AsyncMock()):
+        yield service
+
+
+@pytest.mark.unit
+class TestSnapshotFetches:
+    """Test the commit and pull request fetches used by the progress snapshot."""
+
+    async def test_fetches_run_concurrently(self, github_service):
+        """Test both blocking PyGithub fetches are in flight at the same time."""
+        # Each fetch waits for the other; run back to back on the event loop
+        # thread, the barrier would time out
+        barrier = threading.Barrier(2, timeout=5)
+
+        def get_repo(full_name):
+            barrier.wait()
+            repo = Mock()
+            repo.get_commits.return_value = []
+            return repo
+
+        github_service.github.get_repo.side_effect = get_repo
+        github_service.github.search_issues.return_value = []
+
+        commits, prs = await asyncio.gather(
+            github_service.get_user_commits("owner", "test-repo", "testclaimer", datetime.now(timezone.utc)),
+            github_service.get_pull_requests_for_issue("owner", "test-repo", 101)
+        )
+
+        assert commits == []
+        assert prs == []
+
+    async def test_commit_fetch_error_is_raised(self, github_service):
+        """Test API errors propagate so the stored snapshot is not overwritten."""
+        github_service.github.get_repo.side_effect = GithubException(502, "Bad Gateway", None)
+
+        with pytest.raises(GithubException):
+            await github_service.get_user_commits("owner", "test-repo", "testclaimer", datetime.now(timezone.utc))
+
+    async def test_pull_request_fetch_error_is_raised(self, github_service):
+        """Test API errors propagate so the stored snapshot is not overwritten."""
+        github_service.github.search_issues.side_effect = GithubException(502, "Bad Gateway", None)
+
+        with pytest.raises(GithubException):
+            await github_service.get_pull_requests_for_issue("owner", "test-repo", 101)
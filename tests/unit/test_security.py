@@ -25,7 +25,7 @@ class TestSecurityUtils:
         
         assert hashed != password
         assert len(hashed) > 0
-        assert hashed.startswith('$2b$')
+        assert hashed.startswith('$argon2id$')
     
     def test_verify_password_success(self):
         """Test successful password verification."""
@@ -42,6 +42,26 @@ class TestSecurityUtils:
         
         assert SecurityUtils.verify_password(wrong_password, hashed) is False
     
+    def test_verify_password_legacy_bcrypt(self):
+        """Test legacy bcrypt hashes still verify and are flagged for rehash."""
+        import bcrypt
+        
+        password = "TestPassword123!"
+        legacy_hash = bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+        
+        assert SecurityUtils.verify_password(password, legacy_hash) is True
+        assert SecurityUtils.password_needs_rehash(legacy_hash) is True
+        assert SecurityUtils.password_needs_rehash(SecurityUtils.hash_password(password)) is False
+    
+    @pytest.mark.asyncio
+    async def test_verify_password_async(self):
+        """Test password hashing and verification on the thread pool."""
+        password = "TestPassword123!"
+        hashed = await SecurityUtils.hash_password_async(password)
+        
+        assert await SecurityUtils.verify_password_async(password, hashed) is True
+        assert await SecurityUtils.verify_password_async("WrongPassword123!", hashed) is False
+    
     def test_verify_password_invalid_hash(self):
         """Test password verification with invalid hash."""
         password = "TestPassword123!"
@@ -177,7 +197,19 @@ class TestJWTManager:
         assert decoded_data.email == "test@example.com"
         assert decoded_data.roles == ["user"]
         assert decoded_data.token_type == "access"
-    
+
+    def test_verify_token_cached(self):
+        """Test repeated verification is served from the token cache."""
+        token = self.jwt_manager.create_access_token({"sub": "123", "email": "test@example.com"})
+
+        first = self.jwt_manager.verify_token(token)
+
+        with patch('app.core.security.jwt.decode') as mock_decode:
+            second = self.jwt_manager.verify_token(token)
+
+        mock_decode.assert_not_called()
+        assert second is first
+
     def test_verify_token_invalid(self):
         """Test token verification with invalid token."""
         invalid_token = "invalid.token.here"